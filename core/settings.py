@@ -86,9 +86,41 @@ DATABASES = {
     }
 }
 
+# ====================================================
+# 🧠 CACHE
+# ====================================================
+# Sesiunile cached_db, cache-ul de identitate (planner.backends), indexul
+# de citate și cheile per user presupun UN cache comun tuturor proceselor.
+# LocMem (implicit: dev, teste) e per proces – cu mai mulți workeri o
+# schimbare văzută de un proces nu ajunge la celelalte. În producție:
+#   CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+#   CACHE_LOCATION=redis://127.0.0.1:6379/1
+# sau DatabaseCache (CACHE_LOCATION=planner_cache + manage.py createcachetable).
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
+
 # ====================================================
 # 🔑 PASSWORD VALIDATION
 # ====================================================
+# 🍪 SESIUNI: cached_db citește din cache și scrie și în DB (implicit);
+# "django.contrib.sessions.backends.signed_cookies" = fără DB deloc
+SESSION_ENGINE = os.getenv(
+    "SESSION_ENGINE",
+    "django.contrib.sessions.backends.cached_db"
+)
+
+AUTHENTICATION_BACKENDS = [
+    "planner.backends.EmailBackend",     # login cu email
+    "django.contrib.auth.backends.ModelBackend",  # admin (username)
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -123,6 +155,9 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 #DEFAULT_FROM_EMAIL = "Emotional Planner <emotional.planner.app@gmail.com>"
 
+# linkurile absolute din emailurile trimise fără request (remindere)
+SITE_URL = os.getenv("SITE_URL", "http://localhost:8000")
+
 LOGIN_URL = "login"
 LOGIN_REDIRECT_URL = "today"
 LOGOUT_REDIRECT_URL = "home"
@@ -0,0 +1,343 @@
+from calendar import monthrange
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, F, Max, Min, Q
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils.dateparse import parse_date
+
+from .caching import user_generation, user_key, week_start
+from .calendar_engine import month_bounds
+from .models import Day
+from .rollups import COLOR_FIELDS, MOOD_FIELDS, rollup_aggregates, rollups_between
+
+
+# ===================================================
+# 📊 ANALYTICS – agregări făcute în baza de date
+# ===================================================
+
+BUCKETS = {
+    "day": None,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+# mood → cod mic, pentru payload-uri compacte
+MOOD_SCORES = {
+    Day.Mood.VERY_BAD: 1,
+    Day.Mood.BAD: 2,
+    Day.Mood.NEUTRAL: 3,
+    Day.Mood.GOOD: 4,
+    Day.Mood.VERY_GOOD: 5,
+}
+
+# "auto": zile până la ~4 luni, apoi săptămâni până la ~3 ani, apoi luni
+AUTO_BUCKET_DAYS = [
+    (120, "day"),
+    (3 * 366, "week"),
+]
+
+
+def _parse(value):
+    try:
+        return parse_date(value or "")
+    except ValueError:
+        return None
+
+
+def date_window(request, default="day"):
+    """(from, to, bucket) din query string; valorile invalide sunt ignorate."""
+    start = _parse(request.GET.get("from"))
+    end = _parse(request.GET.get("to"))
+
+    bucket = request.GET.get("bucket", default)
+    if bucket not in BUCKETS and bucket != default:
+        bucket = default
+
+    return start, end, bucket
+
+
+def user_days(user, start=None, end=None):
+    days = Day.objects.filter(user=user)
+    if start:
+        days = days.filter(date__gte=start)
+    if end:
+        days = days.filter(date__lte=end)
+    return days
+
+
+def bucket_expression(bucket):
+    trunc = BUCKETS[bucket]
+    return F("date") if trunc is None else trunc("date")
+
+
+def whole_months(start=None, end=None):
+    """True dacă intervalul acoperă doar luni întregi (poate citi rollup-uri)."""
+    return (
+        (start is None or start.day == 1) and
+        (end is None or end.day == monthrange(end.year, end.month)[1])
+    )
+
+
+def productivity_series(user, start=None, end=None, bucket="day"):
+    """
+    Task-uri finalizate / totale pe zi, săptămână sau lună.
+    Un singur query grupat, indiferent de lungimea istoricului;
+    lunile întregi se citesc direct din rollup-uri.
+    """
+    if bucket == "month" and whole_months(start, end):
+        return [
+            {
+                "date": date(r.year, r.month, 1),
+                "days": r.days_logged,
+                "completed": r.blocks_completed,
+                "total": r.blocks_planned,
+            }
+            for r in rollups_between(user, start, end)
+            if r.days_logged
+        ]
+
+    rows = (
+        user_days(user, start, end)
+        .annotate(bucket=bucket_expression(bucket))
+        .values("bucket")
+        .annotate(
+            days=Count("id", distinct=True),
+            completed=Count(
+                "time_blocks",
+                filter=Q(time_blocks__completed=True)
+            ),
+            total=Count("time_blocks"),
+        )
+        .order_by("bucket")
+    )
+
+    return [
+        {
+            "date": row["bucket"],
+            "days": row["days"],
+            "completed": row["completed"],
+            "total": row["total"],
+        }
+        for row in rows
+    ]
+
+
+def auto_bucket(user, start=None, end=None):
+    """Cea mai fină grupare care ține graficul la câteva sute de puncte."""
+    if start is None or end is None:
+        bounds = user_days(user, start, end).aggregate(
+            first=Min("date"),
+            last=Max("date")
+        )
+        start = start or bounds["first"]
+        end = end or bounds["last"] or date.today()
+
+    if start is None:
+        return "day"
+
+    span = (end - start).days
+    for limit, bucket in AUTO_BUCKET_DAYS:
+        if span <= limit:
+            return bucket
+    return "month"
+
+
+def mood_series(user, start=None, end=None, bucket="auto"):
+    """
+    Serie columnară {dates, moods} cu moods ca întregi 1–5.
+    Pentru săptămâni / luni se păstrează starea cea mai frecventă (modul),
+    calculată din numărători grupate în DB sau din rollup-urile lunare –
+    nu se aduc rânduri individuale.
+    """
+    if bucket == "auto":
+        bucket = auto_bucket(user, start, end)
+
+    days = user_days(user, start, end).filter(mood__in=MOOD_SCORES)
+
+    if bucket == "month" and whole_months(start, end):
+        modes = {}
+        for r in rollups_between(user, start, end):
+            counts = [
+                (n, MOOD_SCORES[mood])
+                for mood, n in r.mood_distribution().items()
+                if n
+            ]
+            if counts:
+                modes[date(r.year, r.month, 1)] = max(counts)
+
+        dates = [key.isoformat() for key in modes]
+        moods = [score for _, score in modes.values()]
+    elif bucket == "day":
+        rows = list(days.order_by("date").values_list("date", "mood"))
+        dates = [d.isoformat() for d, _ in rows]
+        moods = [MOOD_SCORES[m] for _, m in rows]
+    else:
+        counts = (
+            days
+            .annotate(bucket=bucket_expression(bucket))
+            .values_list("bucket", "mood")
+            .annotate(n=Count("id"))
+            .order_by("bucket")
+        )
+
+        modes = {}
+        for key, mood, n in counts:
+            score = MOOD_SCORES[mood]
+            if key not in modes or (n, score) > modes[key]:
+                modes[key] = (n, score)
+
+        dates = [key.isoformat() for key in modes]
+        moods = [score for _, score in modes.values()]
+
+    return {
+        "bucket": bucket,
+        "dates": dates,
+        "moods": moods,
+    }
+
+
+# ===================================================
+# 💗 SCOR DE ECHILIBRU SĂPTĂMÂNAL
+# ===================================================
+
+MAX_SCORE_WEEKS = 260
+
+
+def score_aggregates():
+    return {
+        "days": Count("id", distinct=True),
+        "mood_days": Count(
+            "id",
+            filter=Q(mood__isnull=False) & ~Q(mood=""),
+            distinct=True
+        ),
+        "completed": Count(
+            "time_blocks",
+            filter=Q(time_blocks__completed=True)
+        ),
+    }
+
+
+def balance_score(days, mood_days, completed):
+    return min(days * 10 + mood_days * 8 + completed * 2, 100)
+
+
+def score_stats(days, mood_days, completed, **extra):
+    return {
+        **extra,
+        "days": days,
+        "mood_days": mood_days,
+        "completed": completed,
+        "score": balance_score(days, mood_days, completed),
+    }
+
+
+def window_score(user, start, end):
+    """Scorul pentru un interval oarecare (ex. ultimele 7 zile), un query."""
+    return score_stats(
+        **user_days(user, start, end).aggregate(**score_aggregates())
+    )
+
+
+def weekly_scores(user, weeks=52, today=None):
+    """
+    Scorul pentru ultimele `weeks` săptămâni (luni–duminică), cea curentă
+    inclusă. Săptămânile încheiate vin din cache; cele lipsă se calculează
+    toate într-un singur query grupat.
+    """
+    today = today or date.today()
+    current = week_start(today)
+    starts = [current - timedelta(weeks=n) for n in range(weeks - 1, -1, -1)]
+
+    # o singură citire a generației pentru toate cheile săptămânilor
+    generation = user_generation(user.id)
+    keys = {
+        start: user_key(user.id, "week", start.isoformat(), generation=generation)
+        for start in starts
+        if start < current
+    }
+    cached = cache.get_many(keys.values())
+
+    results = {
+        start: cached[key]
+        for start, key in keys.items()
+        if key in cached
+    }
+    missing = [start for start in starts if start not in results]
+
+    if missing:
+        rows = (
+            user_days(user, missing[0], missing[-1] + timedelta(days=6))
+            .annotate(week=TruncWeek("date"))
+            .values("week")
+            .annotate(**score_aggregates())
+            .order_by()
+        )
+        found = {row.pop("week"): row for row in rows}
+
+        for start in missing:
+            row = found.get(start, {"days": 0, "mood_days": 0, "completed": 0})
+            results[start] = score_stats(week=start, **row)
+
+        cache.set_many(
+            {keys[start]: results[start] for start in missing if start in keys},
+            timeout=None
+        )
+
+    return [results[start] for start in starts]
+
+
+# ===================================================
+# 🗓 OVERVIEW LUNAR
+# ===================================================
+
+def _distribution(stats, choices, prefix, total):
+    return [
+        {
+            "value": value,
+            "label": label,
+            "count": stats[f"{prefix}_{value}"],
+            "percent": round(100 * stats[f"{prefix}_{value}"] / total) if total else 0,
+        }
+        for value, label in choices
+    ]
+
+
+def compute_month_overview(user_id, year, month):
+    """Statisticile lunii dintr-un singur query de agregare + lista zilelor."""
+    start, end = month_bounds(year, month)
+    days = Day.objects.filter(user_id=user_id, date__range=(start, end))
+
+    stats = days.aggregate(**rollup_aggregates())
+    planned = stats["blocks_planned"]
+    moods_total = sum(stats[field] for field in MOOD_FIELDS.values())
+    colors_total = sum(stats[field] for field in COLOR_FIELDS.values())
+
+    return {
+        "days_logged": stats["days_logged"],
+        "rest_days": stats["rest_days"],
+        "blocks_planned": planned,
+        "blocks_completed": stats["blocks_completed"],
+        "completion": round(100 * stats["blocks_completed"] / planned) if planned else None,
+        "moods": _distribution(stats, Day.Mood.choices, "mood", moods_total),
+        "colors": _distribution(stats, Day.Color.choices, "color", colors_total),
+        "days": list(days.order_by("date").values("date", "mood")),
+    }
+
+
+def month_overview(user_id, year, month, today=None):
+    """
+    Lunile încheiate nu se mai schimbă decât prin editări explicite
+    (care trec prin forget_day), deci le ținem în cache fără expirare.
+    """
+    today = today or date.today()
+    if (year, month) >= (today.year, today.month):
+        return compute_month_overview(user_id, year, month)
+
+    key = user_key(user_id, "month", f"{year:04d}-{month:02d}")
+    overview = cache.get(key)
+    if overview is None:
+        overview = compute_month_overview(user_id, year, month)
+        cache.set(key, overview, timeout=None)
+    return overview
@@ -4,4 +4,5 @@ class PlannerConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "planner"
 
-
+    def ready(self):
+        from . import checks, signals, tasks  # noqa: F401
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from .caching import IDENTITY_TIMEOUT, identity_key
+
+
+# ===================================================
+# 🔑 AUTENTIFICARE CU EMAIL
+# ===================================================
+
+class EmailBackend(ModelBackend):
+    """
+    Un singur SELECT (email, fără diferență între litere mari / mici,
+    pe indexul NOCASE) și verificarea parolei pe userul găsit.
+    Adminul (username) merge mai departe prin ModelBackend.
+
+    get_user() servește userul (cu profilul atașat) din cache: o cerere
+    autentificată nu mai face niciun query pentru identitate.
+    Semnalele de salvare ale User / UserProfile șterg intrarea – doar în
+    cache-ul procesului care a salvat, deci cu mai mulți workeri e nevoie
+    de un cache comun (CACHES în settings; vezi planner.checks).
+    """
+
+    def user_for_credentials(self, email, password):
+        """Userul cu emailul și parola date, chiar dacă nu e activ; altfel None."""
+        if not email or password is None:
+            return None
+
+        UserModel = get_user_model()
+        user = (
+            UserModel._default_manager
+            .filter(email__iexact=email.strip())
+            .order_by("pk")
+            .first()
+        )
+
+        if user is None:
+            # ⏱ hash „în gol”: un email necunoscut răspunde la fel de lent
+            UserModel().set_password(password)
+            return None
+
+        return user if user.check_password(password) else None
+
+    def authenticate(self, request, email=None, password=None, **kwargs):
+        user = self.user_for_credentials(email, password)
+        if user is not None and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user(self, user_id):
+        key = identity_key(user_id)
+        user = cache.get(key)
+
+        if user is None:
+            user = (
+                get_user_model()._default_manager
+                .select_related("profile")
+                .filter(pk=user_id)
+                .first()
+            )
+            if user is None:
+                return None
+            cache.set(key, user, IDENTITY_TIMEOUT)
+
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,235 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.dateparse import parse_time
+
+from . import rollups
+from .caching import forget_day
+from .intervals import DayIntervals, to_minutes
+from .models import Day, TimeBlock
+from .wellbeing import max_tasks_for_day
+
+
+# ===================================================
+# 📦 OPERAȚII ÎN LOT PE BLOCURILE UNEI ZILE
+# ===================================================
+# [{"op": "create", "title": ..., "start_time": "09:00", "end_time": ...},
+#  {"op": "update", "id": 3, "title": ...},
+#  {"op": "complete", "id": 4, "completed": true},
+#  {"op": "delete", "id": 5}]
+
+MAX_OPERATIONS = 200
+
+EDITABLE_FIELDS = ("title", "start_time", "end_time", "category", "completed")
+
+
+class BatchError(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def block_data(block):
+    return {
+        "id": block.id,
+        "title": block.title,
+        "start_time": block.start_time.strftime("%H:%M"),
+        "end_time": block.end_time.strftime("%H:%M"),
+        "category": block.category,
+        "completed": block.completed,
+    }
+
+
+def _boolean(value, field="completed"):
+    # doar true / false din JSON: "false" ar fi adevărat pentru bool()
+    if not isinstance(value, bool):
+        raise ValidationError({field: "Valoare invalidă (true / false)."})
+    return value
+
+
+def _apply_fields(block, data):
+    """Setează câmpurile prezente în `data`; întoarce numele lor."""
+    fields = []
+    for field in EDITABLE_FIELDS:
+        if field not in data:
+            continue
+
+        value = data[field]
+        if field in ("start_time", "end_time"):
+            try:
+                value = parse_time(value) if isinstance(value, str) else None
+            except ValueError:
+                value = None
+            if value is None:
+                raise ValidationError({field: "Oră invalidă."})
+        elif field == "completed":
+            value = _boolean(value)
+
+        setattr(block, field, value)
+        fields.append(field)
+
+    return fields
+
+
+def _validate(block):
+    if block.start_time is None or block.end_time is None:
+        raise ValidationError("Intervalul are nevoie de oră de început și de sfârșit.")
+    block.full_clean(exclude=["day"])
+
+
+def _message(error):
+    return " ".join(error.messages)
+
+
+def _overlap_errors(blocks, touched):
+    """
+    O eroare pentru fiecare bloc creat / mutat care se suprapune cu altul.
+    Suprapunerile mai vechi, neatinse de lot, nu blochează lotul.
+    """
+    # cheia fiecărui interval e poziția blocului în listă (cele noi n-au id)
+    intervals = DayIntervals(
+        (to_minutes(block.start_time), to_minutes(block.end_time), position)
+        for position, block in enumerate(blocks)
+    )
+
+    errors = {}
+    for first, second in intervals.conflicts():
+        for mine, other in ((first, second), (second, first)):
+            index = touched.get(id(blocks[mine]))
+            if index is not None and index not in errors:
+                errors[index] = (
+                    f"Intervalul se suprapune cu „{blocks[other].title}” "
+                    f"({blocks[other].start_time:%H:%M}–{blocks[other].end_time:%H:%M})."
+                )
+
+    return [
+        {"index": index, "error": error}
+        for index, error in sorted(errors.items())
+    ]
+
+
+def _write(created, changed, deleted):
+    if created:
+        TimeBlock.objects.bulk_create(created)
+
+    # doar câmpurile atinse de lot: restul rămân cum sunt în DB
+    groups = {}
+    for block, fields in changed.values():
+        groups.setdefault(frozenset(fields), []).append(block)
+    for fields, blocks in groups.items():
+        if fields:
+            TimeBlock.objects.bulk_update(blocks, sorted(fields))
+
+    if deleted:
+        TimeBlock.objects.filter(pk__in=deleted).delete()
+
+
+def apply_operations(day, operations):
+    """
+    Validează toate operațiile în memorie, apoi le aplică cu
+    bulk_create / bulk_update / un DELETE. Totul rulează într-o
+    tranzacție, cu ziua și blocurile ei blocate (select_for_update):
+    două loturi – sau un lot și add_timeblock – nu pot trece amândouă
+    de limită și de verificarea suprapunerilor.
+    Întoarce blocurile finale, ordonate; la orice eroare nu se scrie nimic.
+    """
+    if not isinstance(operations, list) or not operations:
+        raise BatchError([{"index": None, "error": "Nicio operație."}])
+
+    if len(operations) > MAX_OPERATIONS:
+        raise BatchError([{
+            "index": None,
+            "error": f"Cel mult {MAX_OPERATIONS} operații odată.",
+        }])
+
+    with transaction.atomic():
+        day = Day.objects.select_for_update().get(pk=day.pk)
+        if day.is_closed:
+            raise BatchError([{"index": None, "error": "Ziua este închisă."}])
+
+        # citite din nou sub lock, nu din prefetch-ul paginii
+        existing = {
+            block.id: block
+            for block in TimeBlock.objects.select_for_update().filter(day=day)
+        }
+        completed_before = sum(block.completed for block in existing.values())
+
+        created, deleted = [], set()
+        # id → (bloc, câmpurile schimbate)
+        changed = {}
+        errors = []
+        # blocul creat / modificat → indexul operației (pentru erori)
+        touched = {}
+
+        for index, operation in enumerate(operations):
+            try:
+                if not isinstance(operation, dict):
+                    raise ValidationError("Operație invalidă.")
+
+                kind = operation.get("op")
+
+                if kind == "create":
+                    block = TimeBlock(day=day)
+                    _apply_fields(block, operation)
+                    _validate(block)
+                    created.append(block)
+                    touched[id(block)] = index
+                    continue
+
+                if kind not in ("update", "complete", "delete"):
+                    raise ValidationError(f"Operație necunoscută: {kind!r}.")
+
+                block = existing.get(operation.get("id"))
+                if block is None or block.id in deleted:
+                    raise ValidationError("Intervalul nu există în această zi.")
+
+                if kind == "delete":
+                    deleted.add(block.id)
+                    changed.pop(block.id, None)
+                    continue
+
+                fields = changed.get(block.id, (block, set()))[1]
+                if kind == "complete":
+                    block.completed = _boolean(operation.get("completed", True))
+                    fields.add("completed")
+                else:
+                    fields.update(_apply_fields(block, operation))
+                    _validate(block)
+                    touched[id(block)] = index
+                changed[block.id] = (block, fields)
+
+            except ValidationError as error:
+                errors.append({"index": index, "error": _message(error)})
+
+        final = [
+            block for block in existing.values() if block.id not in deleted
+        ] + created
+
+        if not errors:
+            errors.extend(_overlap_errors(final, touched))
+
+        limit = max_tasks_for_day(day)
+        if created and len(final) > limit:
+            errors.append({
+                "index": None,
+                "error": f"Azi sunt suficiente {limit} intervale. 🌿",
+            })
+
+        if errors:
+            raise BatchError(errors)
+
+        _write(created, changed, deleted)
+
+        planned = len(created) - len(deleted)
+        completed = sum(block.completed for block in final) - completed_before
+        rollups.record_change(
+            day.user_id,
+            day.date,
+            blocks_planned=planned,
+            blocks_completed=completed,
+        )
+        if not (planned or completed):
+            # contoarele n-au mișcat (ex. doar categoria sau ora), dar
+            # raportul de corelații numără blocurile pe categorii
+            forget_day(day.user_id, day.date)
+
+    return sorted(final, key=lambda block: (block.start_time, block.id or 0))
@@ -0,0 +1,273 @@
+import math
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from . import rollups
+from .caching import reset_user_cache
+from .journal import CHUNK_SIZE
+from .models import Day, TimeBlock
+from .synthetic import generate_history
+from .wellbeing import RECENT_DAYS
+
+
+# ===================================================
+# ⏱ BUGET DE QUERY-URI PER URL
+# ===================================================
+# Fiecare nume din planner/urls.py are aici un caz. Cazurile rulează în
+# ordinea listei (mutațiile la final, logout ultimul), pe un user cu
+# istoric generat; pentru un view sănătos numărul de query-uri NU
+# depinde de lungimea istoricului.
+
+Fixture = namedtuple("Fixture", "user day blocks")
+
+
+def _day_args(f):
+    return [f.day.date.year, f.day.date.month, f.day.date.day]
+
+
+def _month_args(f):
+    return [f.day.date.year, f.day.date.month]
+
+
+def _prev_month_args(f):
+    # o lună încheiată: a doua cerere ar veni din cache
+    first = f.day.date.replace(day=1) - timedelta(days=1)
+    return [first.year, first.month]
+
+
+CASES = [
+    # (nume, metodă, argumente URL, date trimise)
+    ("home", "get", None, None),
+    ("today", "get", None, None),
+    ("day_detail", "get", _day_args, None),
+    ("calendar", "get", None, None),
+    ("calendar_month", "get", _month_args, None),
+    ("monthly_overview", "get", None, None),
+    ("monthly_overview_month", "get", lambda f: _prev_month_args(f), None),
+    ("year_pixels", "get", None, None),
+    ("year_pixels_year", "get", lambda f: [f.day.date.year - 1], None),
+    ("insights", "get", None, None),
+    ("insights_report", "get", None, None),
+    ("search", "get", None, lambda f: {"q": "respir"}),
+    ("weekly_score", "get", None, None),
+    ("weekly_score_history", "get", None, None),
+    ("mood_chart", "get", None, None),
+    ("mood_chart_data", "get", None, None),
+    ("productivity_chart", "get", None, None),
+    ("export_jsonl", "get", None, None),
+    ("export_csv", "get", None, None),
+    ("import_journal", "get", None, None),
+    ("free_slots", "get", _day_args, lambda f: {"min": 30}),
+    ("profile", "get", None, None),
+    ("register", "get", None, None),
+    ("login", "get", None, None),
+    ("activate", "get", lambda f: ["MA", "token-invalid"], None),
+
+    ("set_day_color", "post", None,
+        lambda f: {"day_id": f.day.id, "color": "green"}),
+    ("set_day_mood", "post", None,
+        lambda f: {"day_id": f.day.id, "mood": "good"}),
+    ("update_day_text", "post", None,
+        lambda f: {"day_id": f.day.id, "notes": "Notă de benchmark"}),
+    ("add_timeblock", "post", None,
+        lambda f: {
+            "day_id": f.day.id,
+            "title": "Plimbare",
+            "start_time": "18:00",
+            "end_time": "18:30",
+            "category": "health",
+        }),
+    ("toggle_timeblock", "post", lambda f: [f.blocks[0].id], None),
+    ("delete_timeblock", "post", lambda f: [f.blocks[1].id], None),
+    ("timeblock_batch", "json", _day_args,
+        lambda f: {"operations": [
+            {"op": "complete", "id": f.blocks[0].id, "completed": False},
+            {"op": "create", "title": "Ceai",
+             "start_time": "20:00", "end_time": "20:15"},
+        ]}),
+    ("schedule_day", "json", _day_args,
+        lambda f: {"accept": True, "tasks": [
+            {"title": "Raport", "minutes": 90, "category": "work", "priority": 2},
+            {"title": "Telefon", "minutes": 15, "category": "personal"},
+        ]}),
+    ("evening_reflection", "post", _day_args,
+        lambda f: {"drain": "Ședințe", "small_win": "Am ieșit afară"}),
+
+    ("logout", "get", None, None),
+]
+
+
+# exporturile citesc istoricul în bucăți de journal.CHUNK_SIZE zile:
+# un query în plus la fiecare bucată e prin design
+CHUNKED = {"export_jsonl", "export_csv"}
+QUERIES_PER_CHUNK = 1
+
+
+# query-uri făcute doar ca să afle cine e userul (sesiune, user, profil)
+IDENTITY_TABLES = ('"django_session"', '"auth_user"', '"planner_userprofile"')
+
+
+def identity_queries(queries):
+    return sum(
+        1 for query in queries
+        if query["sql"].startswith("SELECT")
+        and any(table in query["sql"].split(" WHERE ")[0] for table in IDENTITY_TABLES)
+    )
+
+
+# un cache doar al benchmark-ului: cache.clear() nu atinge cache-ul comun
+BENCHMARK_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "planner-benchmark",
+    }
+}
+
+
+@contextmanager
+def isolated():
+    """
+    Rulează blocul pe o bază de date de test (creată acum și ștearsă la
+    final, ca la manage.py test) și pe BENCHMARK_CACHES: datele reale,
+    sesiunile și cache-ul workerilor rămân neatinse.
+    """
+    with override_settings(CACHES=BENCHMARK_CACHES):
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            cache.clear()
+
+
+def url_names():
+    return {name for name, *_ in CASES}
+
+
+def chunks(history_days):
+    # istoricul + ziua de azi din prepare()
+    return math.ceil((history_days + 1) / CHUNK_SIZE)
+
+
+def over_budget(name, queries, baseline, history_days, baseline_days):
+    """
+    True dacă `name` face mai multe query-uri la history_days decât la
+    baseline_days. Exporturile au voie cu câte QUERIES_PER_CHUNK în plus
+    pentru fiecare bucată nouă.
+    """
+    if name not in CHUNKED:
+        return queries != baseline
+
+    extra = (chunks(history_days) - chunks(baseline_days)) * QUERIES_PER_CHUNK
+    return queries > baseline + extra
+
+
+def growing(sizes, results):
+    """Cazurile care ies din buget la vreuna din mărimi, față de cea mai mică."""
+    smallest = min(sizes)
+    return [
+        name for name, *_ in CASES
+        if any(
+            over_budget(
+                name,
+                results[size][name]["queries"],
+                results[smallest][name]["queries"],
+                size,
+                smallest,
+            )
+            for size in sizes
+        )
+    ]
+
+
+def prepare(user, history_days, seed=0):
+    """
+    Istoric de `history_days` zile până ieri + ziua de azi cu 2 blocuri.
+    Ultimele zile au mood fix, ca regulile de wellbeing să fie aceleași
+    la orice mărime a istoricului.
+    """
+    today = date.today()
+
+    if history_days:
+        generate_history(user, history_days, end=today - timedelta(days=1), seed=seed)
+        Day.objects.filter(
+            user=user,
+            date__gte=today - timedelta(days=RECENT_DAYS)
+        ).update(mood=Day.Mood.NEUTRAL, rest_day=False)
+
+    day = Day.objects.create(user=user, date=today, mood=Day.Mood.GOOD)
+    blocks = TimeBlock.objects.bulk_create([
+        TimeBlock(day=day, title="Scris", start_time="09:00", end_time="10:00"),
+        TimeBlock(day=day, title="Email", start_time="11:00", end_time="11:30"),
+    ])
+
+    rollups.rebuild(Day.objects.filter(user=user))
+    reset_user_cache(user.pk)
+
+    return Fixture(user, day, blocks)
+
+
+def measure(call):
+    """Rulează `call()` și întoarce (rezultat, query-uri capturate, ms, KB maxim alocați)."""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as ctx:
+        result = call()
+    elapsed = (time.perf_counter() - started) * 1000
+
+    _, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+
+    return result, ctx.captured_queries, elapsed, peak / 1024
+
+
+def _consume(response):
+    # un răspuns streaming face query-urile abia când e citit
+    if response.streaming:
+        b"".join(response.streaming_content)
+    return response
+
+
+def run_cases(client, fixture, names=None):
+    """{nume: {"status", "queries", "identity", "ms", "peak_kb"}} pentru fiecare caz."""
+    results = {}
+
+    for name, method, args, data in CASES:
+        if names is not None and name not in names:
+            continue
+
+        url = reverse(name, args=args(fixture) if args else None)
+        payload = data(fixture) if data else None
+
+        if method == "get":
+            call = lambda: client.get(url, payload)
+        elif method == "post":
+            call = lambda: client.post(url, payload)
+        else:
+            call = lambda: client.post(url, payload, content_type="application/json")
+
+        response, queries, elapsed, peak = measure(lambda: _consume(call()))
+        results[name] = {
+            "status": response.status_code,
+            "queries": len(queries),
+            "identity": identity_queries(queries),
+            "ms": round(elapsed, 1),
+            "peak_kb": round(peak, 1),
+        }
+
+    return results
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+
+
+# ===================================================
+# 🧠 CACHE PER USER
+# ===================================================
+# Cheile derivate (scoruri, statistici) au forma
+#   planner:<user_id>:<generație>:<părți>
+# Generația se schimbă când datele unui user trebuie uitate în bloc
+# (user nou cu același id, import masiv); altfel se șterg chei punctuale.
+
+def _generation_key(user_id):
+    return f"planner:{user_id}:generation"
+
+
+def user_generation(user_id):
+    return cache.get_or_set(_generation_key(user_id), 1, timeout=None)
+
+
+def user_key(user_id, *parts, generation=None):
+    """
+    Cheia derivată; pentru multe chei odată, citiți generația o singură
+    dată și dați-o ca `generation` (o citire din cache în loc de N).
+    """
+    if generation is None:
+        generation = user_generation(user_id)
+
+    return ":".join(
+        ["planner", str(user_id), str(generation)] +
+        [str(part) for part in parts]
+    )
+
+
+def reset_user_cache(user_id):
+    """Invalidează toate cheile derivate ale userului."""
+    key = _generation_key(user_id)
+    if not cache.add(key, 1, timeout=None):
+        cache.incr(key)
+
+
+def week_start(day_date):
+    return day_date - timedelta(days=day_date.weekday())
+
+
+def forget_day(user_id, day_date):
+    """O zi s-a schimbat: uităm valorile derivate care o includ."""
+    generation = user_generation(user_id)
+    keys = [
+        user_key(user_id, "week", week_start(day_date).isoformat(), generation=generation),
+        user_key(user_id, "month", f"{day_date.year:04d}-{day_date.month:02d}", generation=generation),
+        # seriile și mediile de azi pot include orice zi (vezi insights)
+        user_key(user_id, "insights", date.today().isoformat(), generation=generation),
+        user_key(user_id, "correlations", generation=generation),
+    ]
+
+    # starea emoțională de azi depinde doar de zilele din trecut
+    if day_date < date.today():
+        keys.append(user_key(user_id, "wellbeing", generation=generation))
+
+    cache.delete_many(keys)
+
+
+# ===================================================
+# 👤 IDENTITATE (user + profil, pentru fiecare cerere)
+# ===================================================
+
+IDENTITY_TIMEOUT = 15 * 60
+
+
+def identity_key(user_id):
+    return user_key(user_id, "identity")
+
+
+def forget_identity(user_id):
+    cache.delete(identity_key(user_id))
@@ -0,0 +1,67 @@
+from calendar import monthrange
+from datetime import date
+
+from .models import Day
+
+
+# ===================================================
+# 🗓 CALENDAR ENGINE
+# ===================================================
+
+# câte luni se pot afișa deodată (?months=)
+MAX_MONTHS = 12
+
+
+def shift_month(year, month, offset):
+    """(year, month) mutat cu `offset` luni înainte / înapoi."""
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+
+def month_bounds(year, month, count=1):
+    """Prima zi din prima lună și ultima zi din ultima lună afișată."""
+    last_year, last_month = shift_month(year, month, count - 1)
+    return (
+        date(year, month, 1),
+        date(last_year, last_month, monthrange(last_year, last_month)[1]),
+    )
+
+
+def load_days(user, start, end):
+    """
+    Toate zilele userului din [start, end], într-un singur query,
+    indexate după dată (cheia unică user + date).
+    """
+    days = Day.objects.filter(
+        user=user,
+        date__range=(start, end)
+    ).only("id", "date", "mood", "color", "is_closed")
+
+    return {d.date: d for d in days}
+
+
+def build_months(user, year, month, count=1):
+    """
+    Grila pentru `count` luni consecutive începând cu (year, month).
+    Numărul de query-uri este mereu 1, indiferent de câte luni / zile.
+    """
+    start, end = month_bounds(year, month, count)
+    days_by_date = load_days(user, start, end)
+
+    months = []
+    for offset in range(count):
+        y, m = shift_month(year, month, offset)
+        months.append({
+            "year": y,
+            "month": m,
+            "first": date(y, m, 1),
+            "days": [
+                {"date": current, "day": days_by_date.get(current)}
+                for current in (
+                    date(y, m, d)
+                    for d in range(1, monthrange(y, m)[1] + 1)
+                )
+            ],
+        })
+
+    return months
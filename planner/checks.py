@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+# ===================================================
+# ✅ VERIFICĂRI DE DEPLOY (manage.py check --deploy)
+# ===================================================
+
+# cache-uri văzute doar de procesul curent
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(Tags.caches, deploy=True)
+def shared_cache_check(app_configs, **kwargs):
+    """
+    Identitatea, sesiunile cached_db și cheile per user se invalidează
+    prin cache; un cache per proces lasă celelalte procese cu date vechi.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+
+    return [Warning(
+        "Cache-ul implicit este local procesului; cu mai mulți workeri "
+        "userii, sesiunile și citatele din cache rămân vechi.",
+        hint="Setează CACHE_BACKEND / CACHE_LOCATION (Redis sau DatabaseCache).",
+        id="planner.W001",
+    )]
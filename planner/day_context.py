@@ -0,0 +1,65 @@
+from django.db.models import Prefetch
+
+from . import rollups
+from .models import Day, EveningReflection, TimeBlock
+from .wellbeing import max_tasks_for_day
+
+
+# ===================================================
+# 📅 CONTEXTUL PAGINII DE ZI
+# ===================================================
+# O zi existentă costă exact 2 query-uri: ziua (cu reflecția și citatul
+# final prin JOIN) și blocurile ei, ordonate după ora de început.
+
+def day_queryset():
+    return Day.objects.select_related(
+        "closing_quote",
+        "evening_reflection",
+    ).prefetch_related(
+        Prefetch(
+            "time_blocks",
+            queryset=TimeBlock.objects.order_by("start_time")
+        )
+    )
+
+
+def load_day(user, day_date):
+    """(day, created) cu tot ce are nevoie pagina, deja încărcat."""
+    day = day_queryset().filter(user=user, date=day_date).first()
+    if day is not None:
+        return day, False
+
+    day, created = Day.objects.get_or_create(user=user, date=day_date)
+    if created:
+        rollups.record_change(user.id, day_date, days_logged=1)
+
+        # 🆕 zi nouă: nimic de încărcat, umplem cache-urile relațiilor
+        day._prefetched_objects_cache = {
+            "time_blocks": TimeBlock.objects.none()
+        }
+        Day.evening_reflection.related.set_cached_value(day, None)
+    else:
+        # creată între timp de altă cerere
+        day = day_queryset().get(pk=day.pk)
+
+    return day, created
+
+
+def reflection_for(day):
+    try:
+        return day.evening_reflection
+    except EveningReflection.DoesNotExist:
+        return None
+
+
+def day_context(day, **extra):
+    """Contextul comun pentru planner/day.html."""
+    return {
+        "day": day,
+        "time_blocks": day.time_blocks.all(),
+        "limit": max_tasks_for_day(day),
+        "reflection": reflection_for(day),
+        "quote": day.closing_quote,
+        "message": None,
+        **extra,
+    }
@@ -1,10 +1,12 @@
 from django import forms
-from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 import uuid
 
+from .backends import EmailBackend
+
 
 class RegisterForm(forms.ModelForm):
     password1 = forms.CharField(
@@ -35,7 +37,7 @@ class RegisterForm(forms.ModelForm):
 
     def clean_email(self):
         email = self.cleaned_data.get("email")
-        if email and User.objects.filter(email=email).exists():
+        if email and User.objects.filter(email__iexact=email).exists():
             raise ValidationError("Există deja un cont asociat cu acest email.")
         return email
 
@@ -78,26 +80,35 @@ class EmailAuthenticationForm(forms.Form):
         })
     )
 
+    def __init__(self, request=None, *args, **kwargs):
+        self.request = request
+        self.user = None
+        super().__init__(*args, **kwargs)
+
     def clean(self):
         email = self.cleaned_data.get("email")
         password = self.cleaned_data.get("password")
 
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
-            raise ValidationError("Email sau parolă incorectă.")
-
-        user = authenticate(username=user.username, password=password)
+        # prin AUTHENTICATION_BACKENDS: semnalul user_login_failed și
+        # user.backend (pentru login()) vin de la Django
+        user = authenticate(self.request, email=email, password=password)
 
         if user is None:
+            # backend-urile refuză conturile inactive; parola corectă
+            # pe un cont neactivat primește totuși explicația
+            inactive = EmailBackend().user_for_credentials(email, password)
+            if inactive is not None:
+                self.confirm_login_allowed(inactive)
             raise ValidationError("Email sau parolă incorectă.")
 
-        if not user.is_active:
-            raise ValidationError("Contul nu este activ. Verifică emailul.")
-
+        self.confirm_login_allowed(user)
         self.user = user
         return self.cleaned_data
 
+    def confirm_login_allowed(self, user):
+        if not user.is_active:
+            raise ValidationError("Contul nu este activ. Verifică emailul.")
+
     def get_user(self):
         return self.user
 
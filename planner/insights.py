@@ -0,0 +1,409 @@
+from collections import namedtuple
+from datetime import date, timedelta
+
+import numpy as np
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .analytics import MOOD_SCORES
+from .caching import user_key
+from .models import Day, TimeBlock
+from .pixels import COLOR_CODES
+
+
+# ===================================================
+# 🔎 INSIGHTS – serii, medii mobile, săptămână vs săptămână
+# ===================================================
+# Istoricul userului se citește O SINGURĂ DATĂ (un query grupat) în
+# coloane NumPy; seriile, mediile și diferențele se calculează pe
+# vectori, fără bucle Python peste zile.
+
+ROLLING_WINDOWS = (7, 30)
+CHART_DAYS = 90
+WEEKS = 8
+INSIGHTS_TIMEOUT = 24 * 60 * 60
+
+History = namedtuple("History", "ordinal mood color closed completed")
+
+
+def insights_key(user_id, today):
+    return user_key(user_id, "insights", today.isoformat())
+
+
+def load_history(user_id, end=None):
+    """
+    Coloanele istoricului până la `end` inclusiv, ordonate după dată.
+    Doar zilele completate: mood, note, măcar un bloc sau închise.
+    Paginile creează zile goale (get_or_create) – o vizită nu e o zi
+    „logată”.
+    """
+    days = Day.objects.filter(user_id=user_id)
+    if end:
+        days = days.filter(date__lte=end)
+
+    rows = list(
+        days
+        .annotate(
+            blocks=Count("time_blocks"),
+            done=Count("time_blocks", filter=Q(time_blocks__completed=True)),
+        )
+        # __gt="" exclude atât NULL, cât și textul gol
+        .filter(
+            Q(mood__gt="") | Q(notes__gt="") | Q(blocks__gt=0) | Q(is_closed=True)
+        )
+        .order_by("date")
+        .values_list("date", "mood", "color", "is_closed", "done")
+    )
+    count = len(rows)
+
+    def column(values, dtype):
+        return np.fromiter(values, dtype=dtype, count=count)
+
+    return History(
+        ordinal=column((row[0].toordinal() for row in rows), np.int32),
+        mood=column((MOOD_SCORES.get(row[1], 0) for row in rows), np.int8),
+        color=column((COLOR_CODES.get(row[2], 0) for row in rows), np.int8),
+        closed=column((row[3] for row in rows), np.bool_),
+        completed=column((row[4] for row in rows), np.int32),
+    )
+
+
+# ---------------------------------------------------
+# 🔥 SERII (zile consecutive)
+# ---------------------------------------------------
+
+def runs(ordinals):
+    """(prima zi, lungime) pentru fiecare șir de zile consecutive."""
+    if not ordinals.size:
+        return ordinals, ordinals
+
+    breaks = np.flatnonzero(np.diff(ordinals) != 1) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [ordinals.size]))
+    return ordinals[starts], ends - starts
+
+
+def streak(ordinals, today):
+    """
+    {"current", "longest"}. Seria curentă rămâne vie până la sfârșitul
+    zilei de azi: dacă ieri a fost completat, azi încă nu o rupe.
+    """
+    firsts, lengths = runs(ordinals)
+    if not lengths.size:
+        return {"current": 0, "longest": 0}
+
+    last_day = firsts[-1] + lengths[-1] - 1
+    alive = last_day >= today.toordinal() - 1
+
+    return {
+        "current": int(lengths[-1]) if alive else 0,
+        "longest": int(lengths.max()),
+    }
+
+
+# ---------------------------------------------------
+# 📈 MEDII MOBILE
+# ---------------------------------------------------
+
+def rolling_mean(values, present, window):
+    """
+    Media pe ultimele `window` zile calendaristice, pentru fiecare zi;
+    zilele fără valoare nu intră în medie (NaN dacă fereastra e goală).
+    """
+    sums = np.concatenate(([0], np.cumsum(values, dtype=np.float64)))
+    counts = np.concatenate(([0], np.cumsum(present, dtype=np.int64)))
+
+    ends = np.arange(1, values.size + 1)
+    starts = np.maximum(ends - window, 0)
+
+    total = sums[ends] - sums[starts]
+    seen = counts[ends] - counts[starts]
+
+    return np.divide(
+        total,
+        seen,
+        out=np.full(values.size, np.nan),
+        where=seen > 0
+    )
+
+
+def daily_moods(history, first, last):
+    """Stările pe fiecare zi din [first, last] (0 = nesetat)."""
+    scores = np.zeros(last - first + 1, dtype=np.int8)
+    inside = (history.ordinal >= first) & (history.ordinal <= last)
+    scores[history.ordinal[inside] - first] = history.mood[inside]
+    return scores
+
+
+# ---------------------------------------------------
+# 📆 SĂPTĂMÂNĂ VS SĂPTĂMÂNĂ
+# ---------------------------------------------------
+
+def week_number(ordinals):
+    # ordinalul 1 (1 ian. anul 1) a fost luni → săptămâni luni–duminică
+    return (ordinals - 1) // 7
+
+
+def weekly_totals(history, today, weeks=WEEKS):
+    """Totalurile ultimelor `weeks` săptămâni, cu diferența față de cea anterioară."""
+    # una în plus, ca prima săptămână afișată să aibă și ea diferență
+    span = weeks + 1
+    index = week_number(history.ordinal) - week_number(today.toordinal()) + span - 1
+    inside = index >= 0
+    index = index[inside]
+
+    def total(values):
+        return np.bincount(index, weights=values, minlength=span)[:span]
+
+    rated = history.mood[inside] > 0
+    days = total(np.ones(index.size))
+    mood_days = total(rated)
+    completed = total(history.completed[inside])
+    closed = total(history.closed[inside])
+
+    mood = np.divide(
+        total(history.mood[inside]),
+        mood_days,
+        out=np.full(span, np.nan),
+        where=mood_days > 0
+    )
+
+    monday = today - timedelta(days=today.weekday())
+
+    return [
+        {
+            "week": monday - timedelta(weeks=span - 1 - n),
+            "days": int(days[n]),
+            "closed": int(closed[n]),
+            "completed": int(completed[n]),
+            "mood": _number(mood[n]),
+            "mood_delta": _number(mood[n] - mood[n - 1]),
+            "completed_delta": int(completed[n] - completed[n - 1]),
+        }
+        for n in range(1, span)
+    ]
+
+
+def _number(value):
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+# ---------------------------------------------------
+# 🔎 TOTUL, PENTRU PAGINA DE INSIGHTS
+# ---------------------------------------------------
+
+def compute_insights(history, today):
+    today_ordinal = today.toordinal()
+    chart_start = today_ordinal - CHART_DAYS + 1
+
+    # fereastra cea mai lungă are nevoie de zilele dinaintea graficului
+    first = chart_start - max(ROLLING_WINDOWS) + 1
+    scores = daily_moods(history, first, today_ordinal)
+
+    rolling = {
+        window: rolling_mean(scores, scores > 0, window)[-CHART_DAYS:]
+        for window in ROLLING_WINDOWS
+    }
+
+    return {
+        "days_logged": int(history.ordinal.size),
+        "logged_streak": streak(history.ordinal, today),
+        "closed_streak": streak(history.ordinal[history.closed], today),
+        "averages": {
+            f"mood_{window}": _number(values[-1])
+            for window, values in rolling.items()
+        },
+        "weeks": weekly_totals(history, today),
+        "chart": {
+            "labels": [
+                date.fromordinal(ordinal).isoformat()
+                for ordinal in range(chart_start, today_ordinal + 1)
+            ],
+            **{
+                f"mood_{window}": [_number(value) for value in values]
+                for window, values in rolling.items()
+            },
+        },
+    }
+
+
+def user_insights(user_id, today=None):
+    """
+    Insights-urile userului, calculate o dată pe zi; orice schimbare
+    a unei zile (forget_day) le invalidează.
+    """
+    today = today or date.today()
+    key = insights_key(user_id, today)
+
+    insights = cache.get(key)
+    if insights is None:
+        insights = compute_insights(load_history(user_id, end=today), today)
+        cache.set(key, insights, timeout=INSIGHTS_TIMEOUT)
+    return insights
+
+
+# ===================================================
+# 🔗 CORELAȚII – stare / energie / odihnă vs productivitate
+# ===================================================
+# Un singur query grupat pe zi (blocuri planificate, finalizate și pe
+# categorii), apoi totul pe vectori: bincount pe codurile de mood /
+# culoare și o mască pentru „cele 3 zile de după o zi de odihnă”.
+
+REST_EFFECT_DAYS = 3
+CATEGORIES = TimeBlock.Category.values
+
+Report = namedtuple(
+    "Report",
+    "ordinal mood color rest planned completed categories"
+)
+
+
+def correlations_key(user_id):
+    return user_key(user_id, "correlations")
+
+
+def load_report(user_id):
+    """Coloanele pentru raport: o zi pe rând, blocurile numărate în DB."""
+    rows = list(
+        Day.objects.filter(user_id=user_id)
+        .annotate(
+            planned=Count("time_blocks"),
+            done=Count("time_blocks", filter=Q(time_blocks__completed=True)),
+            **{
+                f"category_{category}": Count(
+                    "time_blocks",
+                    filter=Q(time_blocks__category=category)
+                )
+                for category in CATEGORIES
+            },
+        )
+        .order_by("date")
+        .values_list(
+            "date", "mood", "color", "rest_day", "planned", "done",
+            *(f"category_{category}" for category in CATEGORIES)
+        )
+    )
+    count = len(rows)
+
+    def column(values, dtype):
+        return np.fromiter(values, dtype=dtype, count=count)
+
+    return Report(
+        ordinal=column((row[0].toordinal() for row in rows), np.int32),
+        mood=column((MOOD_SCORES.get(row[1], 0) for row in rows), np.int8),
+        color=column((COLOR_CODES.get(row[2], 0) for row in rows), np.int8),
+        rest=column((row[3] for row in rows), np.bool_),
+        planned=column((row[4] for row in rows), np.int32),
+        completed=column((row[5] for row in rows), np.int32),
+        categories=np.array([row[6:] for row in rows], dtype=np.int32).reshape(
+            count, len(CATEGORIES)
+        ),
+    )
+
+
+def _percent(part, whole):
+    return None if not whole else round(100 * float(part) / float(whole))
+
+
+def completion_by(codes, report, choices):
+    """Rata de finalizare pentru fiecare cod (1-based, 0 = nesetat)."""
+    size = len(choices) + 1
+    planned = np.bincount(codes, weights=report.planned, minlength=size)
+    completed = np.bincount(codes, weights=report.completed, minlength=size)
+    days = np.bincount(codes, minlength=size)
+
+    return [
+        {
+            "value": value,
+            "label": label,
+            "days": int(days[code]),
+            "planned": int(planned[code]),
+            "completion": _percent(completed[code], planned[code]),
+        }
+        for code, (value, label) in enumerate(choices, start=1)
+    ]
+
+
+def after_rest(report, days=REST_EFFECT_DAYS):
+    """Masca zilelor aflate la cel mult `days` zile după o zi de odihnă."""
+    rest_days = report.ordinal[report.rest]
+    if not rest_days.size:
+        return np.zeros(report.ordinal.size, dtype=np.bool_)
+
+    # pentru fiecare zi: cea mai recentă zi de odihnă strict înainte
+    previous = np.searchsorted(rest_days, report.ordinal, side="left") - 1
+    gap = report.ordinal - rest_days[np.maximum(previous, 0)]
+    return (previous >= 0) & (gap >= 1) & (gap <= days)
+
+
+def rest_effect(report, days=REST_EFFECT_DAYS):
+    following = after_rest(report, days)
+    # zilele de odihnă nu intră în niciun grup
+    other = ~following & ~report.rest
+
+    def group(mask):
+        rated = mask & (report.mood > 0)
+        return {
+            "days": int(mask.sum()),
+            "completion": _percent(
+                report.completed[mask].sum(), report.planned[mask].sum()
+            ),
+            "mood": _number(report.mood[rated].mean()) if rated.any() else None,
+        }
+
+    return {
+        "days": days,
+        "rest_days": int(report.rest.sum()),
+        "after": group(following),
+        "other": group(other),
+    }
+
+
+def category_mix(report):
+    """Pentru fiecare mood: ponderea fiecărei categorii în blocurile zilei."""
+    size = len(Day.Mood.choices) + 1
+    totals = np.zeros((size, len(CATEGORIES)), dtype=np.int64)
+    np.add.at(totals, report.mood, report.categories)
+
+    rows = []
+    for code, (value, label) in enumerate(Day.Mood.choices, start=1):
+        whole = totals[code].sum()
+        rows.append({
+            "value": value,
+            "label": label,
+            "blocks": int(whole),
+            "mix": [
+                {
+                    "value": category,
+                    "label": category_label,
+                    "percent": _percent(totals[code, n], whole) or 0,
+                }
+                for n, (category, category_label) in enumerate(TimeBlock.Category.choices)
+            ],
+        })
+    return rows
+
+
+def compute_correlations(report):
+    return {
+        "days": int(report.ordinal.size),
+        "by_mood": completion_by(report.mood, report, Day.Mood.choices),
+        "by_color": completion_by(report.color, report, Day.Color.choices),
+        "rest": rest_effect(report),
+        "categories": category_mix(report),
+    }
+
+
+def user_correlations(user_id):
+    """
+    Raportul de corelații al userului. Depinde de tot istoricul, deci
+    stă în cache până când o zi se schimbă (forget_day) sau până la un
+    import (generație nouă).
+    """
+    key = correlations_key(user_id)
+
+    report = cache.get(key)
+    if report is None:
+        report = compute_correlations(load_report(user_id))
+        cache.set(key, report, timeout=None)
+    return report
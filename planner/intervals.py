@@ -0,0 +1,168 @@
+from bisect import bisect_left, insort
+from datetime import time
+
+from django.utils.dateparse import parse_time
+
+
+# ===================================================
+# ⏰ INTERVALELE UNEI ZILE (suprapuneri, timp liber)
+# ===================================================
+# Blocurile unei zile, ca minute de la miezul nopții, sortate după
+# început. Pe lângă capete ținem maximul capetelor de sfârșit până la
+# fiecare poziție: „există ceva care se suprapune peste [a, b)?” devine
+# o căutare binară, iar timpul liber vine dintr-o singură trecere.
+# Intervalele sunt semideschise: 09:00–10:00 și 10:00–11:00 nu se ating.
+
+DAY_MINUTES = 24 * 60
+
+# fereastra implicită pentru timpul liber
+DEFAULT_WINDOW = (8 * 60, 22 * 60)
+
+
+def to_minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def to_time(minutes):
+    """Minute → time; 24:00 nu încape într-un TimeField."""
+    return time(*divmod(minutes, 60))
+
+
+def from_minutes(minutes):
+    """Minute → "HH:MM"; capătul zilei se scrie 24:00."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_minutes(value, default=None):
+    """"HH:MM" (sau time) → minute; "24:00" e capătul zilei."""
+    if isinstance(value, time):
+        return to_minutes(value)
+    if value in ("24:00", "24:00:00"):
+        return DAY_MINUTES
+    if not isinstance(value, str):
+        return default
+
+    try:
+        parsed = parse_time(value)
+    except ValueError:
+        parsed = None
+    return default if parsed is None else to_minutes(parsed)
+
+
+def _bounds(item):
+    # cheile pot fi de tipuri diferite (id-uri, None); ordonăm doar după capete
+    return item[0], item[1]
+
+
+class DayIntervals:
+    """
+    Index de intervale pentru o zi. `add` păstrează ordinea (inserție
+    binară), deci poate valida o listă de blocuri noi unul câte unul.
+    """
+
+    def __init__(self, intervals=()):
+        # (start, end, cheie) – cheia e id-ul blocului sau orice marcaj
+        self._items = sorted(intervals, key=_bounds)
+        self._rebuild()
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        return cls(
+            (to_minutes(block.start_time), to_minutes(block.end_time), block.id)
+            for block in blocks
+        )
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Din values_list("start_time", "end_time", "id")."""
+        return cls(
+            (to_minutes(start), to_minutes(end), key)
+            for start, end, key in rows
+        )
+
+    def _rebuild(self):
+        self._starts = [start for start, _, _ in self._items]
+        self._reach = []
+
+        reach = -1
+        for _, end, _ in self._items:
+            reach = max(reach, end)
+            self._reach.append(reach)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def add(self, start, end, key=None):
+        insort(self._items, (start, end, key), key=_bounds)
+        self._rebuild()
+
+    def overlaps(self, start, end, ignore=None):
+        """Cheile intervalelor care se suprapun peste [start, end)."""
+        # doar cele care încep înainte de `end` pot atinge intervalul
+        stop = bisect_left(self._starts, end)
+        if not stop or self._reach[stop - 1] <= start:
+            return []
+
+        found = []
+        for index in range(stop - 1, -1, -1):
+            # nimic mai la stânga nu mai ajunge până la `start`
+            if self._reach[index] <= start:
+                break
+
+            _, item_end, key = self._items[index]
+            if item_end > start and key != ignore:
+                found.append(key)
+
+        found.reverse()
+        return found
+
+    def conflicts(self):
+        """Perechile (cheie, cheie) care se suprapun, dintr-o trecere."""
+        pairs = []
+        active = []
+
+        for start, end, key in self._items:
+            active = [(other_end, other) for other_end, other in active if other_end > start]
+            pairs.extend((other, key) for _, other in active)
+            active.append((end, key))
+
+        return pairs
+
+    def busy(self, window_start=0, window_end=DAY_MINUTES):
+        """Intervalele ocupate din fereastră, unite: [(start, end), ...]."""
+        merged = []
+
+        for start, end, _ in self._items:
+            start, end = max(start, window_start), min(end, window_end)
+            if start >= end:
+                continue
+
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        return [tuple(item) for item in merged]
+
+    def free_slots(self, minutes=0, window_start=DEFAULT_WINDOW[0], window_end=DEFAULT_WINDOW[1]):
+        """Golurile de cel puțin `minutes` minute dintre window_start și window_end."""
+        slots = []
+        cursor = window_start
+
+        for start, end in self.busy(window_start, window_end) + [(window_end, window_end)]:
+            if start - cursor >= max(minutes, 1):
+                slots.append((cursor, start))
+            cursor = max(cursor, end)
+
+        return slots
+
+
+def slot_data(start, end):
+    return {
+        "start": from_minutes(start),
+        "end": from_minutes(end),
+        "minutes": end - start,
+    }
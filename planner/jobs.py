@@ -0,0 +1,201 @@
+import logging
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+
+# ===================================================
+# ⚙️ COADĂ DE JOBURI (în baza de date)
+# ===================================================
+# @task înregistrează o funcție, defer() pune un job în coadă, iar
+# worker-ul (manage.py run_jobs) revendică loturi de joburi scadente
+# cu un UPDATE condiționat și le rulează într-un thread pool.
+# Payload-ul trebuie să fie JSON (id-uri, nu obiecte).
+# Cât rulează, un job își reîmprospătează locked_at la fiecare
+# HEARTBEAT; doar joburile fără semn de viață de LOCK_TIMEOUT sunt
+# considerate abandonate.
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE = 30          # secunde, se dublează la fiecare încercare
+BACKOFF_MAX = 60 * 60
+LOCK_TIMEOUT = timedelta(minutes=10)
+HEARTBEAT = LOCK_TIMEOUT / 4
+ERROR_LIMIT = 4000
+
+_registry = {}
+
+
+def task(name=None, max_attempts=5):
+    def decorator(func):
+        key = name or f"{func.__module__}.{func.__name__}"
+        _registry[key] = (func, max_attempts)
+        func.job_name = key
+        return func
+
+    return decorator
+
+
+def defer(func_or_name, *, run_at=None, delay=None, idempotency_key=None, **payload):
+    """
+    Pune un job în coadă și îl întoarce. Cu `idempotency_key`, un al doilea
+    apel întoarce jobul existent în loc să creeze altul.
+    """
+    name = getattr(func_or_name, "job_name", func_or_name)
+    if name not in _registry:
+        raise LookupError(f"Job necunoscut: {name}")
+
+    fields = {
+        "name": name,
+        "payload": payload,
+        "max_attempts": _registry[name][1],
+        "run_at": run_at or timezone.now() + (delay or timedelta()),
+    }
+
+    if idempotency_key is None:
+        return Job.objects.create(**fields)
+
+    try:
+        with transaction.atomic():
+            return Job.objects.create(idempotency_key=idempotency_key, **fields)
+    except IntegrityError:
+        return Job.objects.get(idempotency_key=idempotency_key)
+
+
+def backoff(attempts):
+    return timedelta(seconds=min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX))
+
+
+def claim(worker_id, limit):
+    """Revendică până la `limit` joburi scadente pentru `worker_id`."""
+    now = timezone.now()
+
+    # 🧟 joburi rămase „running” de la un worker oprit brusc:
+    # încercarea s-a consumat, deci cele la limită nu mai rulează
+    stale = Job.objects.filter(
+        status=Job.Status.RUNNING,
+        locked_at__lt=now - LOCK_TIMEOUT
+    )
+    stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Job.Status.FAILED,
+        locked_by="",
+        last_error="Workerul s-a oprit în timpul ultimei încercări.",
+        finished_at=now,
+    )
+    stale.update(status=Job.Status.PENDING, locked_by="")
+
+    ids = list(
+        Job.objects.filter(status=Job.Status.PENDING, run_at__lte=now)
+        .order_by("run_at", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+    if not ids:
+        return []
+
+    # condiția pe status face revendicarea sigură între mai mulți workeri
+    Job.objects.filter(pk__in=ids, status=Job.Status.PENDING).update(
+        status=Job.Status.RUNNING,
+        locked_by=worker_id,
+        locked_at=now,
+        attempts=F("attempts") + 1,
+    )
+
+    return list(Job.objects.filter(pk__in=ids, locked_by=worker_id))
+
+
+def touch(job):
+    """Semn de viață: locked_at = acum, doar cât jobul e încă al nostru."""
+    return Job.objects.filter(
+        pk=job.pk,
+        status=Job.Status.RUNNING,
+        locked_by=job.locked_by,
+    ).update(locked_at=timezone.now())
+
+
+@contextmanager
+def heartbeat(job, interval=None):
+    """Cât rulează blocul, un thread apelează touch(job) la fiecare `interval`."""
+    interval = interval or HEARTBEAT
+    stop = threading.Event()
+
+    def beat():
+        try:
+            while not stop.wait(interval.total_seconds()):
+                touch(job)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f"heartbeat-{job.pk}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_job(job):
+    func, _ = _registry.get(job.name, (None, None))
+
+    try:
+        if func is None:
+            raise LookupError(f"Job necunoscut: {job.name}")
+        with heartbeat(job):
+            func(**job.payload)
+
+    except Exception:
+        error = traceback.format_exc()[-ERROR_LIMIT:]
+        logger.warning("Jobul %s a eșuat (încercarea %s)", job, job.attempts)
+
+        if job.attempts >= job.max_attempts:
+            changes = {
+                "status": Job.Status.FAILED,
+                "finished_at": timezone.now(),
+            }
+        else:
+            changes = {
+                "status": Job.Status.PENDING,
+                "run_at": timezone.now() + backoff(job.attempts),
+            }
+
+        Job.objects.filter(pk=job.pk).update(locked_by="", last_error=error, **changes)
+        return False
+
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.Status.DONE,
+        locked_by="",
+        last_error="",
+        finished_at=timezone.now(),
+    )
+    return True
+
+
+def _run_in_thread(job):
+    try:
+        return run_job(job)
+    finally:
+        # fiecare thread are conexiunea lui; o închidem explicit
+        connection.close()
+
+
+def run_pending(workers=1, batch_size=20):
+    """Rulează un lot de joburi scadente. Întoarce câte au fost revendicate."""
+    jobs = claim(uuid.uuid4().hex, batch_size)
+
+    if workers <= 1:
+        for job in jobs:
+            run_job(job)
+    elif jobs:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_run_in_thread, jobs))
+
+    return len(jobs)
@@ -0,0 +1,388 @@
+import csv
+import json
+import zlib
+from datetime import date
+
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_date, parse_datetime, parse_time
+
+from . import rollups
+from .caching import reset_user_cache
+from .calendar_engine import month_bounds
+from .day_context import day_queryset, reflection_for
+from .models import Day, EveningReflection, Quote, TimeBlock
+
+
+# ===================================================
+# 📤 EXPORT JURNAL (streaming, memorie constantă)
+# ===================================================
+# Zilele se citesc cu iterator(chunk_size): câte CHUNK_SIZE zile odată,
+# cu blocurile, reflecția și citatul final prefetch-uite per bucată.
+
+CHUNK_SIZE = 500
+
+# gzip (nu zlib brut): header + CRC, se deschide cu orice unealtă
+GZIP_WBITS = 31
+
+CSV_COLUMNS = [
+    "date",
+    "mood",
+    "color",
+    "rest_day",
+    "is_closed",
+    "focus_of_the_day",
+    "gratitude",
+    "notes",
+    "drain",
+    "small_win",
+    "closing_quote",
+    "blocks_total",
+    "blocks_completed",
+    "blocks",
+]
+
+
+def export_days(user, chunk_size=CHUNK_SIZE):
+    return day_queryset().filter(user=user).order_by("date").iterator(
+        chunk_size=chunk_size
+    )
+
+
+def day_record(day):
+    """O zi ca dict simplu, serializabil JSON."""
+    reflection = reflection_for(day)
+
+    return {
+        "date": day.date.isoformat(),
+        "mood": day.mood,
+        "color": day.color,
+        "rest_day": day.rest_day,
+        "is_closed": day.is_closed,
+        "closed_at": day.closed_at.isoformat() if day.closed_at else None,
+        "focus_of_the_day": day.focus_of_the_day,
+        "gratitude": day.gratitude,
+        "notes": day.notes,
+        "reflection": {
+            "drain": reflection.drain,
+            "small_win": reflection.small_win,
+        } if reflection else None,
+        "closing_quote": day.closing_quote.text if day.closing_quote else None,
+        "time_blocks": [
+            {
+                "title": block.title,
+                "start_time": block.start_time.strftime("%H:%M"),
+                "end_time": block.end_time.strftime("%H:%M"),
+                "category": block.category,
+                "completed": block.completed,
+            }
+            for block in day.time_blocks.all()
+        ],
+    }
+
+
+def jsonl_lines(user, chunk_size=CHUNK_SIZE):
+    for day in export_days(user, chunk_size):
+        yield json.dumps(day_record(day), ensure_ascii=False) + "\n"
+
+
+class _Echo:
+    """Pseudo-fișier: csv.writer întoarce direct linia scrisă."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(user, chunk_size=CHUNK_SIZE):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+
+    for day in export_days(user, chunk_size):
+        record = day_record(day)
+        reflection = record["reflection"] or {}
+        blocks = record["time_blocks"]
+
+        yield writer.writerow([
+            record["date"],
+            record["mood"] or "",
+            record["color"] or "",
+            int(record["rest_day"]),
+            int(record["is_closed"]),
+            record["focus_of_the_day"],
+            record["gratitude"],
+            record["notes"],
+            reflection.get("drain") or "",
+            reflection.get("small_win") or "",
+            record["closing_quote"] or "",
+            len(blocks),
+            sum(block["completed"] for block in blocks),
+            "; ".join(
+                f"{b['start_time']}-{b['end_time']} {b['title']}"
+                f"{' ✓' if b['completed'] else ''}"
+                for b in blocks
+            ),
+        ])
+
+
+def gzip_chunks(lines, level=6):
+    """Comprimă un flux de linii text pe măsură ce vine."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+
+    for line in lines:
+        chunk = compressor.compress(line.encode("utf-8"))
+        if chunk:
+            yield chunk
+
+    yield compressor.flush()
+
+
+def stream_response(lines, extension, content_type, compress=False):
+    filename = f"jurnal-{date.today().isoformat()}.{extension}"
+
+    if compress:
+        lines = gzip_chunks(lines)
+        content_type = "application/gzip"
+        filename += ".gz"
+
+    response = StreamingHttpResponse(lines, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+# ===================================================
+# 📥 IMPORT JURNAL (același format JSONL)
+# ===================================================
+# Liniile se citesc pe rând și se scriu în loturi de IMPORT_BATCH zile,
+# fiecare lot într-o tranzacție proprie. Zilele care există deja
+# (user, date) sunt sărite, deci un import întrerupt se poate relua
+# de la ultima linie confirmată (sau de la capăt, fără dubluri).
+# Rollup-urile lunilor atinse se refac o singură dată, la final; un
+# import reluat (start_line) le reface pe toate ale userului, fiindcă
+# nu știe ce loturi a scris rularea întreruptă.
+
+IMPORT_BATCH = 1000
+# un alt import poate scrie aceleași zile între SELECT și INSERT
+BATCH_ATTEMPTS = 3
+MAX_REPORTED_ERRORS = 50
+
+# .values recalculează lista la fiecare acces
+MOODS = frozenset(Day.Mood.values)
+COLORS = frozenset(Day.Color.values)
+CATEGORIES = frozenset(TimeBlock.Category.values)
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.errors = []
+        self.error_count = 0
+        self.last_line = 0
+
+    def error(self, line_no, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "error": message})
+
+
+def _choice(value, choices):
+    return value if isinstance(value, str) and value in choices else None
+
+
+def _text(value, max_length=None):
+    value = value if isinstance(value, str) else ""
+    return value[:max_length] if max_length else value
+
+
+def parse_record(data):
+    """
+    Un dict din export → (Day nesalvat, blocuri, reflecție, text citat).
+    Câmpurile necunoscute / invalide devin goale; fără dată validă → ValueError.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Linia nu este un obiect JSON.")
+
+    day_date = parse_date(_text(data.get("date")))
+    if day_date is None:
+        raise ValueError("Dată lipsă sau invalidă.")
+
+    closed_at = data.get("closed_at")
+    day = Day(
+        date=day_date,
+        mood=_choice(data.get("mood"), MOODS),
+        color=_choice(data.get("color"), COLORS),
+        rest_day=bool(data.get("rest_day")),
+        is_closed=bool(data.get("is_closed")),
+        closed_at=parse_datetime(closed_at) if isinstance(closed_at, str) else None,
+        notes=_text(data.get("notes")),
+        focus_of_the_day=_text(data.get("focus_of_the_day"), 255),
+        gratitude=_text(data.get("gratitude"), 255),
+    )
+
+    items = data.get("time_blocks") or []
+    if not isinstance(items, list):
+        raise ValueError("Interval orar invalid.")
+
+    blocks = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError("Interval orar invalid.")
+
+        start = parse_time(_text(item.get("start_time")))
+        end = parse_time(_text(item.get("end_time")))
+        if start is None or end is None or end <= start:
+            raise ValueError("Interval orar invalid.")
+
+        blocks.append(TimeBlock(
+            title=_text(item.get("title"), 100),
+            start_time=start,
+            end_time=end,
+            category=_choice(item.get("category"), CATEGORIES)
+            or TimeBlock.Category.OTHER,
+            completed=bool(item.get("completed")),
+        ))
+
+    reflection = data.get("reflection")
+    if isinstance(reflection, dict):
+        reflection = EveningReflection(
+            drain=_text(reflection.get("drain")),
+            small_win=_text(reflection.get("small_win")),
+        )
+    else:
+        reflection = None
+
+    return day, blocks, reflection, _text(data.get("closing_quote")) or None
+
+
+def _existing_dates(user, dates):
+    return set(
+        Day.objects.filter(user=user, date__in=dates)
+        .values_list("date", flat=True)
+    )
+
+
+def _insert_batch(user, batch):
+    """Scrie zilele noi din lot; întoarce (datele create, câte au fost sărite)."""
+    with transaction.atomic():
+        existing = _existing_dates(user, [day.date for day, *_ in batch])
+        quotes = dict(
+            Quote.objects.filter(
+                text__in={text for *_, text in batch if text}
+            ).values_list("text", "id")
+        )
+
+        fresh, seen = [], set()
+        for record in batch:
+            day = record[0]
+            if day.date in existing or day.date in seen:
+                continue
+
+            seen.add(day.date)
+            day.user = user
+            day.closing_quote_id = quotes.get(record[3])
+            fresh.append(record)
+
+        Day.objects.bulk_create([day for day, *_ in fresh])
+
+        blocks, reflections = [], []
+        for day, day_blocks, reflection, _ in fresh:
+            # day_id direct: descriptorul FK costă la sute de mii de rânduri
+            for block in day_blocks:
+                block.day_id = day.pk
+                blocks.append(block)
+            if reflection:
+                reflection.day_id = day.pk
+                reflections.append(reflection)
+
+        TimeBlock.objects.bulk_create(blocks)
+        EveningReflection.objects.bulk_create(reflections)
+
+    return seen, len(batch) - len(fresh)
+
+
+def _write_batch(user, batch, result):
+    """
+    _insert_batch, reluat dacă un import concurent a scris între timp
+    aceleași zile: la reluare ele apar ca existente și sunt sărite.
+    """
+    for attempt in range(BATCH_ATTEMPTS):
+        try:
+            created, skipped = _insert_batch(user, batch)
+            break
+        except IntegrityError:
+            if attempt == BATCH_ATTEMPTS - 1:
+                raise
+            # tranzacția a fost anulată: obiectele se inserează din nou
+            for day, *_ in batch:
+                day.pk = None
+                day._state.adding = True
+
+    result.created += len(created)
+    result.skipped += skipped
+    return created
+
+
+def _rebuild_rollups(user, first, last):
+    # luni întregi: rebuild suprascrie rândul de rollup al lunii
+    rollups.rebuild(Day.objects.filter(
+        user=user,
+        date__range=(
+            month_bounds(first.year, first.month)[0],
+            month_bounds(last.year, last.month)[1],
+        )
+    ))
+
+
+def import_lines(user, lines, batch_size=IMPORT_BATCH, start_line=0, progress=None):
+    """
+    Importă liniile JSONL pentru `user`. Liniile până la `start_line`
+    (inclusiv) sunt sărite. `progress(result)` e apelat după fiecare lot
+    confirmat; result.last_line e punctul de reluare.
+    """
+    result = ImportResult()
+    result.last_line = start_line
+    batch = []
+    touched = []
+
+    def flush(line_no):
+        if batch:
+            created = _write_batch(user, batch, result)
+            if created:
+                touched.extend((min(created), max(created)))
+            batch.clear()
+        elif line_no == result.last_line:
+            return
+
+        result.last_line = line_no
+        if progress:
+            progress(result)
+
+    line_no = start_line
+    for line_no, line in enumerate(lines, start=1):
+        if line_no <= start_line:
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            # json.loads acceptă și bytes (fișiere încărcate)
+            batch.append(parse_record(json.loads(line)))
+        except ValueError as error:
+            result.error(line_no, str(error))
+            continue
+
+        if len(batch) >= batch_size:
+            flush(line_no)
+
+    flush(max(line_no, start_line))
+
+    if start_line:
+        rollups.rebuild(Day.objects.filter(user=user))
+    elif touched:
+        _rebuild_rollups(user, min(touched), max(touched))
+
+    if result.created or start_line:
+        reset_user_cache(user.pk)
+
+    return result
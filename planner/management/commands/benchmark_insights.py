@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+
+from planner.benchmarks import isolated, measure
+from planner.insights import compute_insights, load_history
+from planner.synthetic import generate_history, generate_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Măsoară încărcarea istoricului și calculul insights-urilor "
+        "pe istorice sintetice de câțiva ani, pe o bază de date și un "
+        "cache de unică folosință."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--years",
+            default="1,3,10",
+            help="Lungimile istoricului, în ani (separate prin virgulă).",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        years = [int(value) for value in options["years"].split(",")]
+        repeat = max(1, options["repeat"])
+        today = date.today()
+
+        self.stdout.write(
+            f"{'ani':>4}{'zile':>8}{'query-uri':>11}{'citire ms':>11}"
+            f"{'calcul ms':>11}{'KB':>8}"
+        )
+
+        with isolated():
+            for count in years:
+                user = generate_users(1, prefix=f"insights{count}")[0]
+                generate_history(
+                    user,
+                    count * 365,
+                    end=today - timedelta(days=1),
+                    seed=options["seed"],
+                )
+
+                history, queries, load_ms, load_kb = measure(
+                    lambda: load_history(user.id, end=today)
+                )
+
+                # calculul e rapid: media pe mai multe rulări
+                _, _, compute_ms, compute_kb = measure(
+                    lambda: [compute_insights(history, today) for _ in range(repeat)]
+                )
+
+                self.stdout.write(
+                    f"{count:>4}{history.ordinal.size:>8}{len(queries):>11}"
+                    f"{load_ms:>11.1f}{compute_ms / repeat:>11.2f}"
+                    f"{max(load_kb, compute_kb):>8.0f}"
+                )
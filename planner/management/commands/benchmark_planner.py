@@ -0,0 +1,91 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.core.cache import cache
+from django.test import Client, override_settings
+
+from planner.benchmarks import CASES, growing, isolated, prepare, run_cases
+from planner.synthetic import generate_quotes, generate_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Măsoară query-uri, timp și memorie pentru fiecare URL, "
+        "la mai multe lungimi de istoric, pe o bază de date și un cache "
+        "de unică folosință."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="30,365,1095",
+            help="Lungimile istoricului, în zile (separate prin virgulă).",
+        )
+        parser.add_argument("--quotes", type=int, default=2000)
+        parser.add_argument(
+            "--identity-baseline",
+            action="store_true",
+            help="Compară și cu sesiuni în DB + ModelBackend (fără cache de identitate).",
+        )
+
+    def _run(self, size):
+        cache.clear()
+        user = generate_users(1, prefix="bench")[0]
+        fixture = prepare(user, size)
+
+        client = Client()
+        client.force_login(user)
+        return run_cases(client, fixture)
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options["sizes"].split(",")]
+        results = {}
+
+        with isolated(), override_settings(
+            ALLOWED_HOSTS=["testserver"],
+            EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+        ):
+            generate_quotes(options["quotes"])
+
+            for size in sizes:
+                results[size] = self._run(size)
+
+            baseline = None
+            if options["identity_baseline"]:
+                with override_settings(
+                    SESSION_ENGINE="django.contrib.sessions.backends.db",
+                    AUTHENTICATION_BACKENDS=["django.contrib.auth.backends.ModelBackend"],
+                ):
+                    baseline = self._run(sizes[0])
+
+        if baseline:
+            cached = sum(r["identity"] for r in results[sizes[0]].values())
+            plain = sum(r["identity"] for r in baseline.values())
+            self.stdout.write(
+                f"Query-uri de identitate pe {len(CASES)} cereri: "
+                f"{cached} (cache) față de {plain} (sesiuni în DB, fără cache)."
+            )
+
+        # ultimul: dacă vreun URL iese din buget, comanda se termină cu eroare
+        self._report(sizes, results)
+
+    def _report(self, sizes, results):
+        header = f"{'url':<22}" + "".join(f"{size:>26}" for size in sizes)
+        self.stdout.write(header)
+        self.stdout.write(f"{'':<22}" + f"{'q / ms / KB':>26}" * len(sizes))
+
+        for name, *_ in CASES:
+            row = [results[size][name] for size in sizes]
+            cells = "".join(
+                f"{r['queries']:>8} /{r['ms']:>8} /{r['peak_kb']:>7.0f}"
+                for r in row
+            )
+            self.stdout.write(f"{name:<22}{cells}")
+
+        over = growing(sizes, results)
+        if over:
+            raise CommandError(
+                "Query-uri care cresc cu istoricul: " + ", ".join(over)
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            "Numărul de query-uri nu depinde de istoric."
+        ))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from planner.synthetic import generate_history, generate_quotes, generate_users
+
+
+class Command(BaseCommand):
+    help = "Generează useri, zile, blocuri, reflecții și citate sintetice."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=5)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=3 * 365,
+            help="Câte zile de istoric pentru fiecare user (până ieri).",
+        )
+        parser.add_argument("--quotes", type=int, default=10000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--password",
+            default="ComplexPass123!",
+            help="Parola comună a userilor generați.",
+        )
+
+    def handle(self, *args, **options):
+        if options["quotes"]:
+            generate_quotes(options["quotes"], seed=options["seed"])
+            self.stdout.write(f"{options['quotes']} citate.")
+
+        users = generate_users(options["users"], password=options["password"])
+        for offset, user in enumerate(users):
+            generate_history(user, options["days"], seed=options["seed"] + offset)
+            self.stdout.write(f"{user.username}: {options['days']} zile.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(users)} useri generați (parola: {options['password']})."
+        ))
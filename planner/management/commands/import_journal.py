@@ -0,0 +1,68 @@
+import gzip
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from planner.journal import IMPORT_BATCH, import_lines
+
+
+class Command(BaseCommand):
+    help = "Importă un jurnal JSONL (formatul de la /export/jsonl/) pentru un user."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Fișier .jsonl / .jsonl.gz, sau - pentru stdin.")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Id-ul, username-ul sau emailul userului.",
+        )
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH)
+        parser.add_argument(
+            "--start-line",
+            type=int,
+            default=0,
+            help="Reia după această linie (afișată la fiecare lot confirmat).",
+        )
+
+    def handle(self, *args, **options):
+        lookup = options["user"]
+        query = Q(username=lookup) | Q(email__iexact=lookup)
+        if lookup.isdigit():
+            query |= Q(pk=int(lookup))
+
+        users = list(User.objects.filter(query)[:2])
+        if len(users) != 1:
+            raise CommandError(f"Userul {lookup!r} nu a fost găsit (sau nu e unic).")
+
+        path = options["path"]
+        if path == "-":
+            source = sys.stdin
+        elif path.endswith(".gz"):
+            source = gzip.open(path, "rt", encoding="utf-8")
+        else:
+            source = open(path, encoding="utf-8")
+
+        def progress(result):
+            self.stdout.write(
+                f"linia {result.last_line}: {result.created} zile noi, "
+                f"{result.skipped} existente"
+            )
+
+        with source:
+            result = import_lines(
+                users[0],
+                source,
+                batch_size=options["batch_size"],
+                start_line=options["start_line"],
+                progress=progress,
+            )
+
+        for error in result.errors:
+            self.stderr.write(f"linia {error['line']}: {error['error']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result.created} zile importate, {result.skipped} sărite, "
+            f"{result.error_count} linii cu erori."
+        ))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from planner.models import Day
+from planner.rollups import rebuild
+
+
+class Command(BaseCommand):
+    help = "Recalculează rollup-urile lunare din zilele brute."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            help="Doar pentru userul cu acest id.",
+        )
+
+    def handle(self, *args, **options):
+        days = Day.objects.all()
+        if options["user"]:
+            days = days.filter(user_id=options["user"])
+
+        count = rebuild(days)
+        self.stdout.write(self.style.SUCCESS(f"{count} luni recalculate."))
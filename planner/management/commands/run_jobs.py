@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from planner.jobs import run_pending
+
+
+class Command(BaseCommand):
+    help = "Worker pentru coada de joburi (emailuri, remindere)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="Secunde de pauză când coada e goală.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Golește coada scadentă și se oprește.",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+
+        while True:
+            close_old_connections()
+            count = run_pending(
+                workers=options["workers"],
+                batch_size=options["batch_size"],
+            )
+            total += count
+
+            if count:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"{total} joburi rulate."))
@@ -0,0 +1,62 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from planner import jobs
+from planner.reminders import BATCH_SIZE, dispatch, minutes_between
+from planner.tasks import dispatch_evening_reminders
+
+
+class Command(BaseCommand):
+    help = "Trimite reminderele de seară pentru minutul curent (sau rulează continuu)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Rulează la fiecare minut, recuperând minutele pierdute.",
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--defer",
+            action="store_true",
+            help="Doar pune minutele în coada de joburi (trimite run_jobs).",
+        )
+
+    def send(self, moment, batch_size, defer):
+        if defer:
+            jobs.defer(
+                dispatch_evening_reminders,
+                moment=moment.isoformat(),
+                idempotency_key=f"reminders:{moment:%Y-%m-%dT%H:%M}",
+            )
+            return 0
+
+        return dispatch(moment, batch_size=batch_size)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        defer = options["defer"]
+
+        if not options["loop"]:
+            sent = self.send(timezone.localtime(), batch_size, defer)
+            message = "Minutul a fost pus în coadă." if defer else f"{sent} remindere trimise."
+            self.stdout.write(self.style.SUCCESS(message))
+            return
+
+        last = timezone.localtime() - timedelta(minutes=1)
+        while True:
+            now = timezone.localtime()
+
+            # după o pauză lungă (sleep, deploy) nu recuperăm mai mult de o oră
+            last = max(last, now - timedelta(hours=1))
+
+            for moment in minutes_between(last, now):
+                sent = self.send(moment, batch_size, defer)
+                if sent:
+                    self.stdout.write(f"{moment:%H:%M} – {sent} remindere")
+                last = moment
+
+            time.sleep(60 - timezone.localtime().second)
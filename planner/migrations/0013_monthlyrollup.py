@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+MOODS = ["very_bad", "bad", "neutral", "good", "very_good"]
+COLORS = ["green", "yellow", "red", "blue", "purple"]
+
+
+def backfill_rollups(apps, schema_editor):
+    Day = apps.get_model("planner", "Day")
+    MonthlyRollup = apps.get_model("planner", "MonthlyRollup")
+
+    aggregates = {
+        "days_logged": Count("id", distinct=True),
+        "rest_days": Count("id", filter=Q(rest_day=True), distinct=True),
+        "blocks_planned": Count("time_blocks"),
+        "blocks_completed": Count("time_blocks", filter=Q(time_blocks__completed=True)),
+    }
+    for mood in MOODS:
+        aggregates[f"mood_{mood}"] = Count("id", filter=Q(mood=mood), distinct=True)
+    for color in COLORS:
+        aggregates[f"color_{color}"] = Count("id", filter=Q(color=color), distinct=True)
+
+    rows = (
+        Day.objects
+        .annotate(year=ExtractYear("date"), month=ExtractMonth("date"))
+        .values("user_id", "year", "month")
+        .annotate(**aggregates)
+        .order_by()
+    )
+
+    MonthlyRollup.objects.bulk_create(
+        [MonthlyRollup(**row) for row in rows],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planner', '0012_day_closing_quote'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('days_logged', models.IntegerField(default=0)),
+                ('rest_days', models.IntegerField(default=0)),
+                ('blocks_planned', models.IntegerField(default=0)),
+                ('blocks_completed', models.IntegerField(default=0)),
+                ('mood_very_bad', models.IntegerField(default=0)),
+                ('mood_bad', models.IntegerField(default=0)),
+                ('mood_neutral', models.IntegerField(default=0)),
+                ('mood_good', models.IntegerField(default=0)),
+                ('mood_very_good', models.IntegerField(default=0)),
+                ('color_green', models.IntegerField(default=0)),
+                ('color_yellow', models.IntegerField(default=0)),
+                ('color_red', models.IntegerField(default=0)),
+                ('color_blue', models.IntegerField(default=0)),
+                ('color_purple', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['year', 'month'],
+                'unique_together': {('user', 'year', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
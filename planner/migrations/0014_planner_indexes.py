@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('planner', '0013_monthlyrollup'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='timeblock',
+            name='day',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='time_blocks', to='planner.day'),
+        ),
+        migrations.AddIndex(
+            model_name='quote',
+            index=models.Index(condition=models.Q(('active', True)), fields=['active', 'mood'], name='quote_active_mood_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timeblock',
+            index=models.Index(fields=['day', 'start_time'], name='timeblock_day_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timeblock',
+            index=models.Index(fields=['day', 'completed'], name='timeblock_day_completed_idx'),
+        ),
+        # auth_user nu e modelul nostru: login / înregistrare caută după email
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS planner_user_email_idx ON auth_user (email);',
+            reverse_sql='DROP INDEX IF EXISTS planner_user_email_idx;',
+        ),
+    ]
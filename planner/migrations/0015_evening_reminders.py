@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planner', '0014_planner_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='last_reminder_sent',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(condition=models.Q(('evening_reminder_time__isnull', False)), fields=['evening_reminder_time'], name='profile_reminder_time_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+# email__iexact: SQLite îl traduce în LIKE (folosește un index NOCASE),
+# PostgreSQL în UPPER(email) = UPPER(%s) (folosește un index pe expresie)
+CREATE = {
+    "sqlite": "CREATE INDEX IF NOT EXISTS planner_user_email_ci_idx "
+              "ON auth_user (email COLLATE NOCASE);",
+    "postgresql": "CREATE INDEX IF NOT EXISTS planner_user_email_ci_idx "
+                  "ON auth_user (UPPER(email));",
+}
+PLAIN = "CREATE INDEX IF NOT EXISTS planner_user_email_idx ON auth_user (email);"
+
+
+def create_ci_index(apps, schema_editor):
+    sql = CREATE.get(schema_editor.connection.vendor)
+    if sql:
+        schema_editor.execute(sql)
+        schema_editor.execute("DROP INDEX IF EXISTS planner_user_email_idx;")
+
+
+def drop_ci_index(apps, schema_editor):
+    if schema_editor.connection.vendor in CREATE:
+        schema_editor.execute("DROP INDEX IF EXISTS planner_user_email_ci_idx;")
+        schema_editor.execute(PLAIN)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planner', '0016_job'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_ci_index, drop_ci_index),
+    ]
@@ -0,0 +1,104 @@
+from django.db import migrations
+
+
+# 🔎 index FTS5 peste textele unei zile (rowid = planner_day.id).
+# Triggerele îl țin la zi la orice scriere – save(), .update(),
+# bulk_create (import, date sintetice) și ștergerile în cascadă.
+TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS planner_day_search USING fts5(
+    user_id UNINDEXED,
+    date UNINDEXED,
+    notes,
+    focus,
+    gratitude,
+    drain,
+    small_win,
+    tokenize = "unicode61 remove_diacritics 2"
+);
+"""
+
+FILL = """
+INSERT INTO planner_day_search
+    (rowid, user_id, date, notes, focus, gratitude, drain, small_win)
+SELECT d.id, d.user_id, d.date, d.notes, d.focus_of_the_day, d.gratitude,
+       COALESCE(r.drain, ''), COALESCE(r.small_win, '')
+FROM planner_day d
+LEFT JOIN planner_eveningreflection r ON r.day_id = d.id;
+"""
+
+TRIGGERS = {
+    "planner_day_search_ai": """
+        AFTER INSERT ON planner_day BEGIN
+            INSERT INTO planner_day_search
+                (rowid, user_id, date, notes, focus, gratitude, drain, small_win)
+            VALUES (new.id, new.user_id, new.date, new.notes,
+                    new.focus_of_the_day, new.gratitude, '', '');
+        END;
+    """,
+    "planner_day_search_au": """
+        AFTER UPDATE OF notes, focus_of_the_day, gratitude ON planner_day BEGIN
+            UPDATE planner_day_search
+            SET notes = new.notes,
+                focus = new.focus_of_the_day,
+                gratitude = new.gratitude
+            WHERE rowid = new.id;
+        END;
+    """,
+    "planner_day_search_ad": """
+        AFTER DELETE ON planner_day BEGIN
+            DELETE FROM planner_day_search WHERE rowid = old.id;
+        END;
+    """,
+    "planner_reflection_search_ai": """
+        AFTER INSERT ON planner_eveningreflection BEGIN
+            UPDATE planner_day_search
+            SET drain = new.drain, small_win = new.small_win
+            WHERE rowid = new.day_id;
+        END;
+    """,
+    "planner_reflection_search_au": """
+        AFTER UPDATE OF drain, small_win ON planner_eveningreflection BEGIN
+            UPDATE planner_day_search
+            SET drain = new.drain, small_win = new.small_win
+            WHERE rowid = new.day_id;
+        END;
+    """,
+    "planner_reflection_search_ad": """
+        AFTER DELETE ON planner_eveningreflection BEGIN
+            UPDATE planner_day_search
+            SET drain = '', small_win = ''
+            WHERE rowid = old.day_id;
+        END;
+    """,
+}
+
+
+def create_search_index(apps, schema_editor):
+    # pe alte baze de date căutarea folosește fallback-ul din planner/search.py
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute(TABLE)
+    for name, body in TRIGGERS.items():
+        schema_editor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    schema_editor.execute(FILL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for name in TRIGGERS:
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {name};")
+    schema_editor.execute("DROP TABLE IF EXISTS planner_day_search;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planner', '0017_user_email_nocase_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
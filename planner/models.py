@@ -35,6 +35,22 @@ class UserProfile(models.Model):
         blank=True
     )
 
+    # 🌙 ziua pentru care s-a trimis deja reminderul (fără dubluri)
+    last_reminder_sent = models.DateField(
+        null=True,
+        blank=True
+    )
+
+    class Meta:
+        indexes = [
+            # dispatcher-ul caută doar profilurile cu ora în minutul curent
+            models.Index(
+                fields=["evening_reminder_time"],
+                condition=models.Q(evening_reminder_time__isnull=False),
+                name="profile_reminder_time_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.nickname or self.user.email
 
@@ -56,6 +72,16 @@ class Quote(models.Model):
 
     active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            # 💬 indexul de citate: WHERE active → (id, mood), fără tabel
+            models.Index(
+                fields=["active", "mood"],
+                condition=models.Q(active=True),
+                name="quote_active_mood_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.text[:60]
 
@@ -154,10 +180,12 @@ class TimeBlock(models.Model):
         REST = 'rest', 'Odihnă'
         OTHER = 'other', 'Altele'
 
+    # indexat prin (day, start_time) de mai jos
     day = models.ForeignKey(
         Day,
         on_delete=models.CASCADE,
-        related_name="time_blocks"
+        related_name="time_blocks",
+        db_index=False
     )
 
     title = models.CharField(max_length=100)
@@ -183,6 +211,18 @@ class TimeBlock(models.Model):
 
     class Meta:
         ordering = ["start_time"]
+        indexes = [
+            # blocurile unei zile, deja în ordinea afișării
+            models.Index(
+                fields=["day", "start_time"],
+                name="timeblock_day_start_idx",
+            ),
+            # COUNT(...) FILTER (completed) din analytics / rollup-uri
+            models.Index(
+                fields=["day", "completed"],
+                name="timeblock_day_completed_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.start_time}–{self.end_time})"
@@ -208,6 +248,62 @@ class EveningReflection(models.Model):
         return f"Reflection – {self.day.user.username} – {self.day.date}"
 
 
+# ===================================================
+# 📊 ROLLUP LUNAR (menținut incremental de views)
+# ===================================================
+
+class MonthlyRollup(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="monthly_rollups"
+    )
+
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+
+    days_logged = models.IntegerField(default=0)
+    rest_days = models.IntegerField(default=0)
+
+    blocks_planned = models.IntegerField(default=0)
+    blocks_completed = models.IntegerField(default=0)
+
+    # 💭 distribuția stărilor
+    mood_very_bad = models.IntegerField(default=0)
+    mood_bad = models.IntegerField(default=0)
+    mood_neutral = models.IntegerField(default=0)
+    mood_good = models.IntegerField(default=0)
+    mood_very_good = models.IntegerField(default=0)
+
+    # 🎨 distribuția energiei
+    color_green = models.IntegerField(default=0)
+    color_yellow = models.IntegerField(default=0)
+    color_red = models.IntegerField(default=0)
+    color_blue = models.IntegerField(default=0)
+    color_purple = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["year", "month"]
+        unique_together = ("user", "year", "month")
+
+    def mood_distribution(self):
+        return {
+            mood: getattr(self, f"mood_{mood}")
+            for mood in Day.Mood.values
+        }
+
+    def color_distribution(self):
+        return {
+            color: getattr(self, f"color_{color}")
+            for color in Day.Color.values
+        }
+
+    def __str__(self):
+        return f"{self.user.username} – {self.month:02d}/{self.year}"
+
+
 # ===================================================
 # 💬 CITAT
 # ===================================================
@@ -215,3 +311,58 @@ class EveningReflection(models.Model):
 
 
 
+
+
+# ===================================================
+# ⚙️ JOBURI ÎN FUNDAL (emailuri, efecte lente)
+# ===================================================
+
+class Job(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'În așteptare'
+        RUNNING = 'running', 'Rulează'
+        DONE = 'done', 'Gata'
+        FAILED = 'failed', 'Eșuat'
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+
+    # același efect cerut de două ori = un singur job
+    idempotency_key = models.CharField(
+        max_length=200,
+        unique=True,
+        null=True,
+        blank=True
+    )
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+
+    run_at = models.DateTimeField()
+    locked_by = models.CharField(max_length=64, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["run_at", "id"]
+        indexes = [
+            # worker-ul: joburile scadente, în ordine
+            models.Index(
+                fields=["run_at", "id"],
+                condition=models.Q(status="pending"),
+                name="job_pending_run_at_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
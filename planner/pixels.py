@@ -0,0 +1,94 @@
+from calendar import isleap, monthrange
+from datetime import date
+
+from django.core.cache import cache
+
+from .caching import user_key
+from .models import Day
+
+
+# ===================================================
+# 🟪 YEAR IN PIXELS – un octet pe zi
+# ===================================================
+# Octetul zilei: mood în nibble-ul de sus, culoarea în cel de jos
+# (0 = nesetat). Un an = 365/366 octeți în cache, construit dintr-un
+# singur values_list. La schimbarea unei zile anul e șters, nu corectat
+# pe loc: un citește-modifică-scrie fără lock ar pierde schimbările
+# făcute în paralel, iar reconstruirea costă un singur query.
+
+MOOD_CODES = {mood: code for code, mood in enumerate(Day.Mood.values, start=1)}
+COLOR_CODES = {color: code for code, color in enumerate(Day.Color.values, start=1)}
+
+MOODS_BY_CODE = {code: mood for mood, code in MOOD_CODES.items()}
+COLORS_BY_CODE = {code: color for color, code in COLOR_CODES.items()}
+
+
+def pixels_key(user_id, year):
+    return user_key(user_id, "pixels", year)
+
+
+def year_length(year):
+    return 366 if isleap(year) else 365
+
+
+def day_index(day_date):
+    return day_date.timetuple().tm_yday - 1
+
+
+def encode(mood, color):
+    return MOOD_CODES.get(mood, 0) << 4 | COLOR_CODES.get(color, 0)
+
+
+def build_year(user_id, year):
+    pixels = bytearray(year_length(year))
+
+    rows = Day.objects.filter(
+        user_id=user_id,
+        date__year=year
+    ).values_list("date", "mood", "color").order_by()
+
+    for day_date, mood, color in rows:
+        pixels[day_index(day_date)] = encode(mood, color)
+
+    return bytes(pixels)
+
+
+def year_pixels(user_id, year):
+    """Octeții anului: o citire din cache, sau un query la prima cerere."""
+    key = pixels_key(user_id, year)
+    pixels = cache.get(key)
+
+    if pixels is None:
+        pixels = build_year(user_id, year)
+        cache.set(key, pixels, timeout=None)
+
+    return pixels
+
+
+def forget_year(user_id, year):
+    """Mood-ul sau culoarea unei zile s-a schimbat: anul se reconstruiește la cerere."""
+    cache.delete(pixels_key(user_id, year))
+
+
+def year_grid(pixels, year):
+    """Lunile anului, fiecare cu celulele ei: {day, mood, color}."""
+    months = []
+    offset = 0
+
+    for month in range(1, 13):
+        length = monthrange(year, month)[1]
+        months.append({
+            "month": month,
+            "cells": [
+                {
+                    "day": number,
+                    "date": date(year, month, number),
+                    "mood": MOODS_BY_CODE.get(pixels[offset + number - 1] >> 4),
+                    "color": COLORS_BY_CODE.get(pixels[offset + number - 1] & 0x0F),
+                }
+                for number in range(1, length + 1)
+            ],
+        })
+        offset += length
+
+    return months
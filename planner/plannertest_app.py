@@ -157,7 +157,7 @@ class DayFlowTests(TestCase):
             title="Task",
         )
 
-        response = self.client.get(
+        response = self.client.post(
             reverse("toggle_timeblock", args=[block.id])
         )
 
@@ -0,0 +1,92 @@
+import random
+import threading
+import uuid
+
+from django.core.cache import cache
+
+from .models import Quote
+
+
+# ===================================================
+# 💬 INDEX DE CITATE (în memorie, per proces)
+# ===================================================
+
+VERSION_KEY = "planner:quotes:version"
+
+
+class QuoteIndex:
+    """
+    Id-urile citatelor active, grupate după mood, încărcate leneș.
+    Alegerea unui citat e O(1) + un lookup după cheia primară,
+    fără ORDER BY RANDOM() pe tot tabelul.
+
+    Versiunea din cache le spune și celorlalte procese să reconstruiască
+    indexul după ce un citat a fost salvat / șters – doar dacă toate
+    folosesc același cache (CACHES în settings). Cu LocMem, fiecare
+    proces vede doar schimbările făcute de el.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = None
+        self._version = None
+
+    def _current_version(self):
+        return cache.get_or_set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+    def invalidate(self):
+        self._buckets = None
+        cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+    def buckets(self):
+        version = self._current_version()
+        buckets = self._buckets
+
+        if buckets is None or self._version != version:
+            with self._lock:
+                buckets = {}
+                rows = Quote.objects.filter(active=True).values_list("id", "mood")
+                for pk, mood in rows.order_by():
+                    buckets.setdefault(mood, []).append(pk)
+
+                self._buckets, self._version = buckets, version
+
+        return buckets
+
+    def random_id(self, moods=None):
+        """Un id aleator din bucket-urile cerute (None = toate)."""
+        buckets = self.buckets()
+        if moods is None:
+            moods = buckets.keys()
+
+        pools = [buckets[m] for m in dict.fromkeys(moods) if m in buckets]
+        total = sum(len(pool) for pool in pools)
+        if not total:
+            return None
+
+        index = random.randrange(total)
+        for pool in pools:
+            if index < len(pool):
+                return pool[index]
+            index -= len(pool)
+
+    def pick(self, moods=None):
+        """
+        Citatul ales, sau None. Dacă id-ul nu mai există (index învechit),
+        reconstruim indexul și mai încercăm o dată.
+        """
+        for _ in range(2):
+            pk = self.random_id(moods)
+            if pk is None:
+                return None
+
+            quote = Quote.objects.filter(pk=pk, active=True).first()
+            if quote:
+                return quote
+
+            self.invalidate()
+
+        return None
+
+
+quote_index = QuoteIndex()
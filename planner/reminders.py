@@ -0,0 +1,117 @@
+from datetime import time, timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Exists, OuterRef
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Day, UserProfile
+
+
+# ===================================================
+# 🌙 REMINDERE DE SEARĂ
+# ===================================================
+# La fiecare minut: doar profilurile cu ora în minutul acela (index
+# parțial pe evening_reminder_time), fără cele cu ziua deja închisă
+# sau cu reminderul de azi trimis. Mesajele pleacă în loturi, pe o
+# singură conexiune SMTP.
+
+BATCH_SIZE = 500
+SUBJECT = "🌙 Reflecția de seară te așteaptă"
+
+
+def minute_window(moment):
+    """[hh:mm:00, hh:mm:59.999999] pentru minutul lui `moment`."""
+    start = time(moment.hour, moment.minute)
+    return start, time(moment.hour, moment.minute, 59, 999999)
+
+
+def due_profiles(moment):
+    today = moment.date()
+    start, end = minute_window(moment)
+
+    closed_today = Day.objects.filter(
+        user=OuterRef("user_id"),
+        date=today,
+        is_closed=True
+    )
+
+    return (
+        UserProfile.objects
+        .filter(
+            evening_reminder_time__range=(start, end),
+            user__is_active=True,
+        )
+        .exclude(last_reminder_sent=today)
+        .exclude(Exists(closed_today))
+        .exclude(user__email="")
+        .select_related("user")
+        .only("id", "nickname", "user__username", "user__email")
+        .order_by("id")
+    )
+
+
+def reminder_message(profile, link):
+    return EmailMessage(
+        subject=SUBJECT,
+        body=render_to_string("planner/email/reminder_email.html", {
+            "user": profile.user,
+            "profile": profile,
+            "reflection_link": link,
+        }),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[profile.user.email],
+    )
+
+
+def dispatch(moment=None, batch_size=BATCH_SIZE, connection=None):
+    """Trimite reminderele minutului `moment` (implicit: acum). Întoarce câte."""
+    moment = timezone.localtime(moment)
+    today = moment.date()
+    link = settings.SITE_URL.rstrip("/") + reverse("today")
+
+    connection = connection or get_connection()
+    sent = 0
+
+    due = due_profiles(moment)
+    last_id = 0
+
+    with connection:
+        # paginare după id: fiecare lot e un query mic, indiferent câți useri
+        while True:
+            batch = list(due.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            sent += _send_batch(connection, batch, link, today)
+            last_id = batch[-1].id
+
+            if len(batch) < batch_size:
+                break
+
+    return sent
+
+
+def _send_batch(connection, profiles, link, today):
+    sent = connection.send_messages([
+        reminder_message(profile, link) for profile in profiles
+    ]) or 0
+
+    UserProfile.objects.filter(
+        pk__in=[profile.pk for profile in profiles]
+    ).update(last_reminder_sent=today)
+
+    return sent
+
+
+def minutes_between(last, now):
+    """Minutele (datetime-uri) de după `last` până la `now` inclusiv."""
+    last = last.replace(second=0, microsecond=0)
+    now = now.replace(second=0, microsecond=0)
+
+    moment = last + timedelta(minutes=1)
+    while moment <= now:
+        yield moment
+        moment += timedelta(minutes=1)
@@ -0,0 +1,140 @@
+from django.db.models import Count, F, Q
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+from .caching import forget_day
+from .models import Day, MonthlyRollup
+
+
+# ===================================================
+# 📊 ROLLUP LUNAR – agregate per user / lună
+# ===================================================
+
+MOOD_FIELDS = {mood: f"mood_{mood}" for mood in Day.Mood.values}
+COLOR_FIELDS = {color: f"color_{color}" for color in Day.Color.values}
+
+
+def rollup_aggregates():
+    """Expresiile de agregare condiționată pentru un grup de zile."""
+    aggregates = {
+        "days_logged": Count("id", distinct=True),
+        "rest_days": Count("id", filter=Q(rest_day=True), distinct=True),
+        "blocks_planned": Count("time_blocks"),
+        "blocks_completed": Count(
+            "time_blocks",
+            filter=Q(time_blocks__completed=True)
+        ),
+    }
+
+    for mood, field in MOOD_FIELDS.items():
+        aggregates[field] = Count("id", filter=Q(mood=mood), distinct=True)
+
+    for color, field in COLOR_FIELDS.items():
+        aggregates[field] = Count("id", filter=Q(color=color), distinct=True)
+
+    return aggregates
+
+
+def refresh_month(user_id, year, month):
+    """Recalculează o singură lună din rândurile brute (un query)."""
+    stats = Day.objects.filter(
+        user_id=user_id,
+        date__year=year,
+        date__month=month
+    ).aggregate(**rollup_aggregates())
+
+    rollup, _ = MonthlyRollup.objects.update_or_create(
+        user_id=user_id,
+        year=year,
+        month=month,
+        defaults=stats
+    )
+    return rollup
+
+
+def rebuild(days=None):
+    """
+    Reconstruiește rollup-urile pentru toate lunile din `days`
+    (implicit: toate zilele) – pentru backfill / reparații.
+    """
+    if days is None:
+        days = Day.objects.all()
+
+    rows = (
+        days
+        .annotate(year=ExtractYear("date"), month=ExtractMonth("date"))
+        .values("user_id", "year", "month")
+        .annotate(**rollup_aggregates())
+        .order_by()
+    )
+
+    count = 0
+    for row in rows:
+        MonthlyRollup.objects.update_or_create(
+            user_id=row.pop("user_id"),
+            year=row.pop("year"),
+            month=row.pop("month"),
+            defaults=row
+        )
+        count += 1
+    return count
+
+
+def record_change(user_id, day_date, **deltas):
+    """
+    Aplică diferențele (ex. blocks_completed=1, mood_bad=-1) pe luna zilei,
+    cu un UPDATE atomic. Dacă luna nu are încă rollup, o calculează complet.
+    Se apelează DUPĂ ce schimbarea a fost salvată.
+    """
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    forget_day(user_id, day_date)
+
+    updated = MonthlyRollup.objects.filter(
+        user_id=user_id,
+        year=day_date.year,
+        month=day_date.month
+    ).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in deltas.items()}
+    )
+
+    if not updated:
+        refresh_month(user_id, day_date.year, day_date.month)
+
+
+def _swap(fields, old, new):
+    deltas = {}
+    if old in fields:
+        deltas[fields[old]] = -1
+    if new in fields:
+        deltas[fields[new]] = deltas.get(fields[new], 0) + 1
+    return deltas
+
+
+def mood_delta(old, new):
+    return _swap(MOOD_FIELDS, old, new)
+
+
+def color_delta(old, new):
+    return _swap(COLOR_FIELDS, old, new)
+
+
+def rollups_between(user, start=None, end=None):
+    """Rândurile de rollup pentru lunile care ating intervalul [start, end]."""
+    rollups = MonthlyRollup.objects.filter(user=user)
+
+    if start:
+        rollups = rollups.filter(
+            Q(year__gt=start.year) |
+            Q(year=start.year, month__gte=start.month)
+        )
+    if end:
+        rollups = rollups.filter(
+            Q(year__lt=end.year) |
+            Q(year=end.year, month__lte=end.month)
+        )
+
+    return rollups.order_by("year", "month")
@@ -0,0 +1,175 @@
+from collections import namedtuple
+
+from .batch import BatchError, apply_operations
+from .intervals import DAY_MINUTES, DayIntervals, from_minutes, parse_minutes
+from .models import TimeBlock
+from .wellbeing import max_tasks_for_day
+
+
+# ===================================================
+# 🧩 PLANIFICARE AUTOMATĂ (task-uri → timpul liber al zilei)
+# ===================================================
+# {"tasks": [{"title": "Raport", "minutes": 90, "category": "work",
+#             "priority": 2}, ...],
+#  "from": "09:00", "to": "18:00", "accept": false}
+#
+# Task-urile se iau după prioritate (apoi cele mai lungi întâi, ca să
+# nu rămână fără loc) și fiecare intră în cel mai devreme gol liber în
+# care încape, până se umple limita blândă a zilei (max_tasks_for_day).
+# Cu "accept": true planul trece prin apply_operations: o validare,
+# un bulk_create, un record_change.
+
+MAX_TASKS = 50
+MIN_TASK_MINUTES = 5
+
+# programul de lucru implicit
+WORKING_HOURS = (9 * 60, 18 * 60)
+
+Task = namedtuple("Task", "index title minutes category priority")
+
+
+def parse_tasks(tasks):
+    """Lista de task-uri validată; la orice eroare → BatchError."""
+    if not isinstance(tasks, list) or not tasks:
+        raise BatchError([{"index": None, "error": "Niciun task."}])
+
+    if len(tasks) > MAX_TASKS:
+        raise BatchError([{
+            "index": None,
+            "error": f"Cel mult {MAX_TASKS} task-uri odată.",
+        }])
+
+    parsed, errors = [], []
+    title_length = TimeBlock._meta.get_field("title").max_length
+
+    for index, task in enumerate(tasks):
+        if not isinstance(task, dict):
+            errors.append({"index": index, "error": "Task invalid."})
+            continue
+
+        title = str(task.get("title") or "").strip()
+        category = task.get("category") or TimeBlock.Category.OTHER
+
+        try:
+            minutes = int(task.get("minutes"))
+            priority = int(task.get("priority") or 0)
+        except (TypeError, ValueError):
+            errors.append({"index": index, "error": "Durată sau prioritate invalidă."})
+            continue
+
+        if not title or len(title) > title_length:
+            errors.append({"index": index, "error": "Titlul lipsește sau e prea lung."})
+        elif not MIN_TASK_MINUTES <= minutes <= DAY_MINUTES:
+            errors.append({
+                "index": index,
+                "error": f"Durata trebuie să fie de cel puțin {MIN_TASK_MINUTES} minute.",
+            })
+        elif category not in TimeBlock.Category.values:
+            errors.append({"index": index, "error": f"Categorie necunoscută: {category!r}."})
+        else:
+            parsed.append(Task(index, title, minutes, category, priority))
+
+    if errors:
+        raise BatchError(errors)
+
+    return parsed
+
+
+def pack(slots, tasks, capacity):
+    """
+    Greedy: după prioritate, apoi durată descrescătoare; fiecare task în
+    primul gol (cel mai devreme) în care încape. Golurile rămân sortate,
+    deci un pas costă O(numărul de goluri).
+    Întoarce (plasate [(task, start, end)], neplasate [(task, motiv)]).
+    """
+    slots = [list(slot) for slot in slots]
+    order = sorted(tasks, key=lambda task: (-task.priority, -task.minutes, task.index))
+
+    placed, unplaced = [], []
+    for task in order:
+        if len(placed) >= capacity:
+            unplaced.append((task, "limit"))
+            continue
+
+        for slot in slots:
+            if slot[1] - slot[0] >= task.minutes:
+                placed.append((task, slot[0], slot[0] + task.minutes))
+                slot[0] += task.minutes
+                break
+        else:
+            unplaced.append((task, "no_slot"))
+
+    placed.sort(key=lambda item: item[1])
+    return placed, unplaced
+
+
+def propose(day, tasks, window=WORKING_HOURS):
+    """
+    Planul pentru `day` (cu time_blocks deja încărcate, vezi load_day):
+    {"limit", "remaining", "placed", "unplaced"}.
+    """
+    blocks = list(day.time_blocks.all())
+    limit = max_tasks_for_day(day)
+    remaining = max(limit - len(blocks), 0)
+
+    slots = DayIntervals.from_blocks(blocks).free_slots(MIN_TASK_MINUTES, *window)
+    placed, unplaced = pack(slots, tasks, remaining)
+
+    return {
+        "limit": limit,
+        "remaining": remaining,
+        "placed": [
+            {
+                "index": task.index,
+                "title": task.title,
+                "category": task.category,
+                "start_time": from_minutes(start),
+                "end_time": from_minutes(end),
+            }
+            for task, start, end in placed
+        ],
+        "unplaced": [
+            {"index": task.index, "title": task.title, "reason": reason}
+            for task, reason in sorted(unplaced, key=lambda item: item[0].index)
+        ],
+    }
+
+
+def parse_window(data):
+    """(start, end) în minute din "from" / "to"; None dacă e invalid."""
+    start = parse_minutes(data.get("from"), WORKING_HOURS[0])
+    end = parse_minutes(data.get("to"), WORKING_HOURS[1])
+
+    # un bloc nu poate trece de miezul nopții (end_time > start_time)
+    if not 0 <= start < end < DAY_MINUTES:
+        return None
+    return start, end
+
+
+def accept(day, plan):
+    """
+    Scrie planul: o singură tranzacție cu un bulk_create (apply_operations).
+    Ziua e blocată și recitită acolo: dacă s-a schimbat de la propunere
+    (un bloc adăugat, mood-ul schimbat), planul e refuzat cu BatchError,
+    nu scris peste. Erorile poartă indexul task-ului, nu al operației.
+    """
+    try:
+        return apply_operations(day, [
+            {
+                "op": "create",
+                "title": item["title"],
+                "category": item["category"],
+                "start_time": item["start_time"],
+                "end_time": item["end_time"],
+            }
+            for item in plan["placed"]
+        ])
+    except BatchError as error:
+        raise BatchError([
+            {
+                **item,
+                "index": None if item["index"] is None
+                else plan["placed"][item["index"]]["index"],
+            }
+            for item in error.errors
+        ])
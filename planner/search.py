@@ -0,0 +1,133 @@
+import re
+from collections import namedtuple
+
+from django.db import connection
+from django.db.models import Q
+from django.utils.dateparse import parse_date
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .models import Day
+
+
+# ===================================================
+# 🔎 CĂUTARE ÎN JURNAL (FTS5)
+# ===================================================
+# Indexul planner_day_search (migrarea 0018) are câte un rând pe zi cu
+# notele, focusul, recunoștința și reflecția de seară; triggerele îl
+# țin la zi. Rezultatele sunt ordonate după bm25 și paginate cu un
+# cursor (scor, id) – nicio pagină nu costă mai mult decât prima.
+
+PAGE_SIZE = 20
+SNIPPET_TOKENS = 12
+
+# ponderile bm25, în ordinea coloanelor (user_id și date nu sunt indexate)
+WEIGHTS = (0, 0, 1.0, 2.0, 2.0, 1.0, 1.0)
+
+# marcaje care nu apar în text; devin <mark> după escape
+OPEN, CLOSE = "\x02", "\x03"
+
+Result = namedtuple("Result", "day_id date snippet score")
+
+WORD = re.compile(r"\w+")
+
+RANK = f"bm25(planner_day_search, {', '.join(map(str, WEIGHTS))})"
+
+SEARCH_SQL = f"""
+    SELECT rowid, date, {RANK} AS score,
+           snippet(planner_day_search, -1, '{OPEN}', '{CLOSE}', '…', {SNIPPET_TOKENS})
+    FROM planner_day_search
+    WHERE planner_day_search MATCH %s AND user_id = %s
+"""
+
+# keyset: doar rezultatele de după ultimul afișat, în aceeași ordine
+AFTER_SQL = f" AND ({RANK} > %s OR ({RANK} = %s AND rowid > %s))"
+
+ORDER_SQL = " ORDER BY score, rowid LIMIT %s"
+
+
+def match_expression(text):
+    """
+    Cuvintele din `text` ca termeni FTS5 între ghilimele, cu prefix
+    („respir” găsește și „respirat”); operatorii FTS nu ajung la SQLite.
+    """
+    words = WORD.findall(text or "")
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def parse_cursor(value):
+    """„scor_id” → (scor, id); orice altceva înseamnă prima pagină."""
+    try:
+        score, day_id = (value or "").split("_")
+        return float(score), int(day_id)
+    except ValueError:
+        return None
+
+
+def make_cursor(result):
+    return f"{result.score!r}_{result.day_id}"
+
+
+def highlight(snippet):
+    return mark_safe(
+        escape(snippet).replace(OPEN, "<mark>").replace(CLOSE, "</mark>")
+    )
+
+
+def search_days(user_id, text, after=None, limit=PAGE_SIZE):
+    """
+    (rezultate, cursorul paginii următoare sau None). `after` este
+    cursorul primit la pagina anterioară.
+    """
+    query = match_expression(text)
+    if not query:
+        return [], None
+
+    if connection.vendor != "sqlite":
+        return _search_like(user_id, text, after, limit)
+
+    sql = SEARCH_SQL
+    params = [query, user_id]
+
+    if after:
+        sql += AFTER_SQL
+        params += [after[0], after[0], after[1]]
+
+    sql += ORDER_SQL
+    params.append(limit + 1)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    results = [
+        Result(day_id, parse_date(day_date), highlight(snippet), score)
+        for day_id, day_date, score, snippet in rows[:limit]
+    ]
+    more = len(rows) > limit
+    return results, make_cursor(results[-1]) if more else None
+
+
+def _search_like(user_id, text, after, limit):
+    """Fallback fără FTS: toate cuvintele, oriunde, cele mai noi zile întâi."""
+    days = Day.objects.filter(user_id=user_id)
+
+    for word in WORD.findall(text):
+        days = days.filter(
+            Q(notes__icontains=word) |
+            Q(focus_of_the_day__icontains=word) |
+            Q(gratitude__icontains=word) |
+            Q(evening_reflection__drain__icontains=word) |
+            Q(evening_reflection__small_win__icontains=word)
+        )
+
+    if after:
+        days = days.filter(id__lt=after[1])
+
+    rows = list(days.order_by("-id").values_list("id", "date", "notes")[:limit + 1])
+    results = [
+        Result(day_id, day_date, escape(notes[:120]), 0.0)
+        for day_id, day_date, notes in rows[:limit]
+    ]
+    more = len(rows) > limit
+    return results, make_cursor(results[-1]) if more else None
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import forget_identity, reset_user_cache
+from .models import Quote, UserProfile
+from .quotes import quote_index
+
+
+# ===================================================
+# 📡 SIGNALS
+# ===================================================
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def start_fresh_user_cache(sender, instance, created, **kwargs):
+    # id-urile se pot refolosi (ex. după rollback în teste)
+    if created:
+        reset_user_cache(instance.pk)
+
+
+@receiver(post_save, sender=Quote)
+@receiver(post_delete, sender=Quote)
+def invalidate_quote_index(sender, **kwargs):
+    # acoperă QuoteAdmin (save_model / delete_model / delete_queryset)
+    quote_index.invalidate()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def forget_cached_user(sender, instance, **kwargs):
+    # inclusiv last_login (update_fields) și parola schimbată
+    forget_identity(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def forget_cached_profile(sender, instance, **kwargs):
+    forget_identity(instance.user_id)
@@ -116,3 +116,50 @@ document.addEventListener("DOMContentLoaded", () => {
 
 
 
+
+
+/* ===========================
+   ⚡ AJAX – doar fragmentul schimbat
+   Formularele cu data-ajax (POST, cu CSRF) primesc JSON
+   {ok, target, html}; fără JS rămâne fluxul cu redirect.
+=========================== */
+
+document.addEventListener("DOMContentLoaded", () => {
+
+  function patch(payload) {
+    if (payload.error) {
+      alert(payload.error);
+    }
+
+    const target = document.getElementById(payload.target);
+    if (!target) return;
+
+    if (payload.html) {
+      target.outerHTML = payload.html;
+    } else {
+      target.remove();
+    }
+  }
+
+  function send(url, options) {
+    options.headers = {"X-Requested-With": "XMLHttpRequest"};
+    options.credentials = "same-origin";
+
+    return fetch(url, options)
+      .then((response) => response.json())
+      .then(patch);
+  }
+
+  document.addEventListener("submit", (event) => {
+    const form = event.target;
+    if (!form.matches("form[data-ajax]")) return;
+
+    event.preventDefault();
+    send(form.action, {method: "POST", body: new FormData(form)})
+      .then(() => {
+        if (form.hasAttribute("data-reset")) form.reset();
+      })
+      .catch(() => form.submit());
+  });
+
+});
@@ -0,0 +1,151 @@
+import random
+import uuid
+from datetime import date, time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+
+from . import rollups
+from .caching import reset_user_cache
+from .models import Day, EveningReflection, Quote, TimeBlock
+from .quotes import quote_index
+
+
+# ===================================================
+# 🧪 DATE SINTETICE (benchmark-uri, demo)
+# ===================================================
+
+MOODS = [mood for mood in Day.Mood.values]
+MOOD_WEIGHTS = [1, 2, 4, 4, 2]
+COLORS = [color for color in Day.Color.values]
+
+TITLES = {
+    TimeBlock.Category.WORK: ["Email", "Ședință", "Raport", "Cod", "Planificare"],
+    TimeBlock.Category.PERSONAL: ["Cumpărături", "Telefon mama", "Citit", "Curățenie"],
+    TimeBlock.Category.HEALTH: ["Alergat", "Yoga", "Plimbare", "Doctor"],
+    TimeBlock.Category.TRAVEL: ["Drum spre birou", "Drum acasă"],
+    TimeBlock.Category.REST: ["Pauză", "Somn de prânz", "Ceai"],
+    TimeBlock.Category.OTHER: ["Diverse", "Administrativ"],
+}
+
+WORDS = (
+    "azi am simțit că ziua a fost lungă dar am reușit să respir "
+    "mai mult decât ieri și să fiu blândă cu mine chiar dacă nu am "
+    "terminat tot ce mi-am propus pentru dimineață"
+).split()
+
+
+def _sentence(rng, low=4, high=14):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def generate_users(count, password="ComplexPass123!", prefix="demo"):
+    """Useri activi cu aceeași parolă (hash calculat o singură dată)."""
+    hashed = make_password(password)
+    tag = uuid.uuid4().hex[:6]
+
+    users = User.objects.bulk_create([
+        User(
+            username=f"{prefix}_{tag}_{n}",
+            email=f"{prefix}.{tag}.{n}@example.com",
+            password=hashed,
+            is_active=True,
+        )
+        for n in range(count)
+    ])
+
+    for user in users:
+        reset_user_cache(user.pk)
+    return users
+
+
+def generate_quotes(count, seed=0, batch_size=2000):
+    rng = random.Random(seed)
+
+    Quote.objects.bulk_create(
+        [
+            Quote(
+                text=_sentence(rng, 6, 18).capitalize() + ".",
+                mood=rng.choice(MOODS + [None, None]),
+                active=rng.random() > 0.05,
+            )
+            for _ in range(count)
+        ],
+        batch_size=batch_size
+    )
+
+    # bulk_create nu trimite semnale
+    quote_index.invalidate()
+
+
+def generate_history(user, days, end=None, seed=0, max_blocks=6, batch_size=2000):
+    """
+    `days` zile consecutive care se termină la `end` (implicit: ieri),
+    cu blocuri, reflecții și rollup-uri recalculate. Întoarce numărul de zile.
+    """
+    rng = random.Random(seed)
+    end = end or date.today() - timedelta(days=1)
+    start = end - timedelta(days=days - 1)
+
+    Day.objects.bulk_create(
+        [
+            Day(
+                user=user,
+                date=start + timedelta(days=n),
+                mood=rng.choices(MOODS, MOOD_WEIGHTS)[0] if rng.random() > 0.1 else None,
+                color=rng.choice(COLORS) if rng.random() > 0.2 else None,
+                rest_day=rng.random() < 0.05,
+                is_closed=rng.random() < 0.7,
+                notes=_sentence(rng) if rng.random() > 0.3 else "",
+                focus_of_the_day=_sentence(rng, 2, 5) if rng.random() > 0.5 else "",
+                gratitude=_sentence(rng, 2, 6) if rng.random() > 0.5 else "",
+            )
+            for n in range(days)
+        ],
+        batch_size=batch_size
+    )
+
+    created = list(
+        Day.objects.filter(user=user, date__range=(start, end))
+        .values_list("id", "is_closed")
+    )
+
+    blocks, reflections = [], []
+    for day_id, is_closed in created:
+        hour = 7
+        for _ in range(rng.randint(0, max_blocks)):
+            category = rng.choice(list(TITLES))
+            length = rng.choice([30, 60, 90])
+            if hour * 60 + length >= 23 * 60:
+                break
+
+            begin = time(hour, rng.choice([0, 30]))
+            finish_minutes = begin.hour * 60 + begin.minute + length
+            blocks.append(TimeBlock(
+                day_id=day_id,
+                title=rng.choice(TITLES[category]),
+                start_time=begin,
+                end_time=time(finish_minutes // 60, finish_minutes % 60),
+                category=category,
+                completed=rng.random() < 0.6,
+            ))
+            hour = finish_minutes // 60 + 1
+
+        if is_closed:
+            reflections.append(EveningReflection(
+                day_id=day_id,
+                drain=_sentence(rng),
+                small_win=_sentence(rng),
+            ))
+
+        if len(blocks) >= batch_size:
+            TimeBlock.objects.bulk_create(blocks)
+            blocks = []
+
+    TimeBlock.objects.bulk_create(blocks, batch_size=batch_size)
+    EveningReflection.objects.bulk_create(reflections, batch_size=batch_size)
+
+    rollups.rebuild(Day.objects.filter(user=user, date__range=(start, end)))
+    reset_user_cache(user.pk)
+
+    return days
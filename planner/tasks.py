@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import render_to_string
+from django.utils.dateparse import parse_datetime
+
+from . import reminders
+from .jobs import task
+
+
+# ===================================================
+# 📨 JOBURI
+# ===================================================
+
+@task(max_attempts=8)
+def send_activation_email(user_id, activation_link):
+    user = User.objects.filter(pk=user_id, is_active=False).first()
+    if user is None:
+        # deja activat sau șters între timp
+        return
+
+    context = {"user": user, "activation_link": activation_link}
+
+    email = EmailMultiAlternatives(
+        subject="🌸 Confirmă contul tău",
+        body=render_to_string("planner/email/confirm_email.txt", context),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+    email.attach_alternative(
+        render_to_string("planner/email/confirm_email.html", context),
+        "text/html"
+    )
+    email.send()
+
+
+@task(max_attempts=3)
+def dispatch_evening_reminders(moment):
+    # last_reminder_sent împiedică dublurile dacă jobul se reia
+    reminders.dispatch(parse_datetime(moment))
@@ -1,11 +1,20 @@
+from django.contrib.auth import BACKEND_SESSION_KEY
 from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_login_failed
 from django.contrib.auth.tokens import default_token_generator
 from django.core import mail
+from django.db import connection
 from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from planner.benchmarks import identity_queries
+from planner.checks import shared_cache_check
+from planner.jobs import run_pending
+from planner.models import UserProfile
+
 
 @override_settings(
     EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
@@ -28,6 +37,10 @@ class AuthFlowTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "planner/auth/check_email.html")
+
+        # emailul e trimis de worker, nu de cerere
+        self.assertEqual(len(mail.outbox), 0)
+        run_pending()
         self.assertEqual(len(mail.outbox), 1)
 
     def test_activate_account(self):
@@ -63,3 +76,128 @@ class AuthFlowTests(TestCase):
 
         response = self.client.get(reverse("logout"))
         self.assertRedirects(response, reverse("home"))
+
+
+class EmailLoginTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="carla",
+            email="Carla@Example.com",
+            password="ComplexPass123!",
+        )
+
+    def login(self, email, password="ComplexPass123!"):
+        return self.client.post(reverse("login"), {"email": email, "password": password})
+
+    def test_login_reads_the_user_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.login("carla@example.com")
+
+        self.assertRedirects(response, reverse("today"), fetch_redirect_response=False)
+        user_selects = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT") and 'FROM "auth_user"' in q["sql"]
+        ]
+        self.assertEqual(len(user_selects), 1)
+
+    def test_wrong_password_and_unknown_email_share_the_message(self):
+        for email, password in [
+            ("carla@example.com", "gresit"),
+            ("nimeni@example.com", "ComplexPass123!"),
+        ]:
+            response = self.login(email, password)
+            self.assertContains(response, "Email sau parolă incorectă.")
+
+    def test_inactive_account_is_explained(self):
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.login("carla@example.com")
+
+        self.assertContains(response, "Contul nu este activ.")
+
+    def test_login_goes_through_authenticate(self):
+        failed = []
+
+        def record(sender, credentials, **kwargs):
+            failed.append(credentials)
+
+        user_login_failed.connect(record)
+        try:
+            self.login("carla@example.com", "gresit")
+        finally:
+            user_login_failed.disconnect(record)
+
+        self.assertEqual(len(failed), 1)
+
+        self.login("carla@example.com")
+        self.assertEqual(
+            self.client.session[BACKEND_SESSION_KEY], "planner.backends.EmailBackend"
+        )
+
+    def test_register_rejects_email_in_other_case(self):
+        response = self.client.post(reverse("register"), {
+            "email": "CARLA@example.com",
+            "password1": "ComplexPass123!",
+            "password2": "ComplexPass123!",
+        })
+
+        self.assertContains(response, "Există deja un cont asociat cu acest email.")
+
+
+class IdentityCacheTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="dana", email="dana@example.com", password="ComplexPass123!"
+        )
+        UserProfile.objects.create(user=self.user, nickname="Dana")
+        self.client.force_login(self.user)
+
+    def identity_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return identity_queries(ctx.captured_queries), response
+
+    def test_warm_request_needs_no_identity_queries(self):
+        self.identity_queries(reverse("weekly_score"))
+
+        count, _ = self.identity_queries(reverse("weekly_score"))
+        self.assertEqual(count, 0)
+
+        count, response = self.identity_queries(reverse("profile"))
+        self.assertEqual(count, 0)
+        self.assertEqual(response.context["profile"].nickname, "Dana")
+
+    def test_saving_the_profile_refreshes_the_cache(self):
+        self.identity_queries(reverse("profile"))
+        self.client.post(reverse("profile"), {"nickname": "Dana B.", "bio": ""})
+
+        _, response = self.identity_queries(reverse("profile"))
+        self.assertEqual(response.context["profile"].nickname, "Dana B.")
+
+    def test_saving_over_db_sessions(self):
+        # ce economisim: sesiune + user la fiecare cerere, plus profilul
+        with self.settings(
+            SESSION_ENGINE="django.contrib.sessions.backends.db",
+            AUTHENTICATION_BACKENDS=["django.contrib.auth.backends.ModelBackend"],
+        ):
+            self.client.force_login(self.user)
+            self.identity_queries(reverse("profile"))
+            count, _ = self.identity_queries(reverse("profile"))
+
+        self.assertEqual(count, 3)
+
+
+class SharedCacheCheckTests(TestCase):
+    def test_process_local_cache_is_flagged_for_deploy(self):
+        self.assertEqual(
+            [w.id for w in shared_cache_check(None)], ["planner.W001"]
+        )
+
+    @override_settings(CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "planner_cache",
+    }})
+    def test_shared_cache_passes(self):
+        self.assertEqual(shared_cache_check(None), [])
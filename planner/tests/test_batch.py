@@ -0,0 +1,151 @@
+import json
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.batch import BatchError, apply_operations
+from planner.day_context import load_day
+from planner.models import Day, MonthlyRollup, TimeBlock
+
+
+class TimeBlockBatchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="vera",
+            email="vera@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        self.day = Day.objects.create(user=self.user, date=date(2024, 7, 1), mood="good")
+        self.keep = TimeBlock.objects.create(
+            day=self.day, title="Email", start_time="08:00", end_time="08:30"
+        )
+        self.drop = TimeBlock.objects.create(
+            day=self.day, title="Vechi", start_time="12:00", end_time="13:00", completed=True
+        )
+        self.url = reverse("timeblock_batch", args=[2024, 7, 1])
+
+    def _post(self, operations):
+        return self.client.post(
+            self.url,
+            json.dumps({"operations": operations}),
+            content_type="application/json",
+        )
+
+    def test_plan_a_day_in_one_request(self):
+        operations = [
+            {"op": "create", "title": f"Task {h}", "start_time": f"{h}:00", "end_time": f"{h}:45",
+             "category": "work"}
+            for h in (9, 10, 11, 14)
+        ] + [
+            {"op": "update", "id": self.keep.id, "title": "Inbox", "end_time": "08:45"},
+            {"op": "complete", "id": self.keep.id},
+            {"op": "delete", "id": self.drop.id},
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post(operations)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(
+            [block["title"] for block in payload["blocks"]],
+            ["Inbox", "Task 9", "Task 10", "Task 11", "Task 14"],
+        )
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "planner_timeblock"')]
+        self.assertEqual(len(inserts), 1)
+
+        self.keep.refresh_from_db()
+        self.assertTrue(self.keep.completed)
+        self.assertEqual(self.keep.title, "Inbox")
+        self.assertFalse(TimeBlock.objects.filter(pk=self.drop.pk).exists())
+
+        rollup = MonthlyRollup.objects.get(user=self.user, year=2024, month=7)
+        self.assertEqual(rollup.blocks_planned, 5)
+        self.assertEqual(rollup.blocks_completed, 1)
+
+    def test_invalid_operation_rolls_back_everything(self):
+        response = self._post([
+            {"op": "create", "title": "Bun", "start_time": "09:00", "end_time": "10:00"},
+            {"op": "create", "title": "Invers", "start_time": "11:00", "end_time": "10:00"},
+            {"op": "delete", "id": 999999},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([e["index"] for e in response.json()["errors"]], [1, 2])
+        self.assertEqual(self.day.time_blocks.count(), 2)
+
+    def test_mood_limit_is_enforced(self):
+        Day.objects.filter(pk=self.day.pk).update(mood="bad")  # limită 3
+
+        response = self._post([
+            {"op": "create", "title": "A", "start_time": "09:00", "end_time": "10:00"},
+            {"op": "create", "title": "B", "start_time": "10:00", "end_time": "11:00"},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.day.time_blocks.count(), 2)
+
+    def test_other_users_blocks_are_rejected(self):
+        other = User.objects.create_user(username="x", email="x@test.com", password="ComplexPass123!")
+        other_day = Day.objects.create(user=other, date=date(2024, 7, 1))
+        foreign = TimeBlock.objects.create(day=other_day, title="Nu", start_time="09:00", end_time="10:00")
+
+        response = self._post([{"op": "delete", "id": foreign.id}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(TimeBlock.objects.filter(pk=foreign.pk).exists())
+
+    def test_closed_day_and_bad_json(self):
+        response = self.client.post(self.url, "nu e json", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+        Day.objects.filter(pk=self.day.pk).update(is_closed=True)
+        response = self._post([{"op": "complete", "id": self.keep.id}])
+        self.assertEqual(response.status_code, 400)
+
+    def test_completed_must_be_a_json_boolean(self):
+        response = self._post([
+            {"op": "complete", "id": self.keep.id, "completed": "false"},
+            {"op": "update", "id": self.drop.id, "completed": 0},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([e["index"] for e in response.json()["errors"]], [0, 1])
+        self.keep.refresh_from_db()
+        self.assertFalse(self.keep.completed)
+
+    def test_update_writes_only_the_fields_it_sets(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post([{"op": "update", "id": self.keep.id, "title": "Inbox"}])
+
+        self.assertEqual(response.status_code, 200)
+        updates = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "planner_timeblock"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"title"', updates[0])
+        self.assertNotIn('"completed"', updates[0])
+
+    def test_blocks_are_read_again_inside_the_transaction(self):
+        # pagina a încărcat ziua, apoi altă cerere a adăugat un bloc
+        day, _ = load_day(self.user, date(2024, 7, 1))
+        list(day.time_blocks.all())
+        TimeBlock.objects.create(
+            day=self.day, title="Între timp", start_time="15:00", end_time="16:00"
+        )
+
+        with self.assertRaises(BatchError) as raised:
+            apply_operations(day, [
+                {"op": "create", "title": "Nou", "start_time": "15:30", "end_time": "16:30"},
+            ])
+
+        self.assertIn("Între timp", raised.exception.errors[0]["error"])
+        self.assertEqual(self.day.time_blocks.count(), 3)
@@ -0,0 +1,77 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.models import Day
+
+
+class CalendarTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ioana",
+            email="ioana@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        for d in (1, 15, 28):
+            Day.objects.create(user=self.user, date=date(2024, 2, d), mood="good")
+        Day.objects.create(user=self.user, date=date(2024, 3, 31), color="red")
+
+    def _queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, ctx.captured_queries
+
+    def test_month_navigation(self):
+        response, _ = self._queries(reverse("calendar_month", args=[2024, 2]))
+
+        self.assertTemplateUsed(response, "planner/calendar.html")
+        self.assertEqual(len(response.context["days"]), 29)
+        self.assertEqual(response.context["prev_month"], (2024, 1))
+        self.assertEqual(response.context["next_month"], (2024, 3))
+
+        loaded = [item for item in response.context["days"] if item["day"]]
+        self.assertEqual(len(loaded), 3)
+
+    def test_query_count_is_constant(self):
+        counts = set()
+        day_queries = set()
+
+        # identitatea (user + profil) vine din cache după prima cerere
+        self.client.get(reverse("mood_chart"))
+
+        for url in (
+            reverse("calendar_month", args=[2024, 2]),
+            reverse("calendar_month", args=[2024, 3]),
+            reverse("calendar_month", args=[2024, 1]) + "?months=6",
+            reverse("calendar"),
+        ):
+            _, queries = self._queries(url)
+            counts.add(len(queries))
+            day_queries.add(
+                sum("planner_day" in q["sql"] for q in queries)
+            )
+
+        self.assertEqual(len(counts), 1)
+        self.assertEqual(day_queries, {1})
+
+    def test_multi_month(self):
+        response, _ = self._queries(
+            reverse("calendar_month", args=[2024, 2]) + "?months=2"
+        )
+
+        months = response.context["months"]
+        self.assertEqual([(m["year"], m["month"]) for m in months], [(2024, 2), (2024, 3)])
+        self.assertEqual(months[1]["days"][-1]["day"].color, "red")
+        self.assertEqual(response.context["next_month"], (2024, 4))
+
+    def test_invalid_month(self):
+        response = self.client.get(reverse("calendar_month", args=[2024, 13]))
+        self.assertEqual(response.status_code, 404)
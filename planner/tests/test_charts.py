@@ -1,7 +1,14 @@
+from datetime import date, timedelta
+
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from planner.models import Day, TimeBlock
+from planner.rollups import rebuild
+
 
 class ChartsTests(TestCase):
     def setUp(self):
@@ -24,3 +31,139 @@ class ChartsTests(TestCase):
     def test_monthly_overview_template_exists(self):
         response = self.client.get(reverse("monthly_overview"))
         self.assertTemplateUsed(response, "planner/monthly_overview.html")
+
+
+class ProductivityChartTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="mara",
+            email="mara@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _add_days(self, start, count):
+        for offset in range(count):
+            day = Day.objects.create(user=self.user, date=start + timedelta(days=offset))
+            TimeBlock.objects.create(
+                day=day, title="A", start_time="09:00", end_time="10:00", completed=True
+            )
+            TimeBlock.objects.create(
+                day=day, title="B", start_time="10:00", end_time="11:00"
+            )
+
+    def _query_count(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_history(self):
+        self._add_days(date(2024, 1, 1), 3)
+        self.client.get(reverse("mood_chart"))  # identitatea intră în cache
+        short = self._query_count(reverse("productivity_chart"))
+
+        self._add_days(date(2024, 2, 1), 40)
+        long = self._query_count(reverse("productivity_chart"))
+
+        self.assertEqual(short, long)
+
+    def test_completed_and_total_per_day(self):
+        self._add_days(date(2024, 1, 1), 2)
+
+        response = self.client.get(reverse("productivity_chart"))
+
+        self.assertEqual(
+            response.context["data"],
+            [
+                {"date": date(2024, 1, 1), "days": 1, "completed": 1, "total": 2},
+                {"date": date(2024, 1, 2), "days": 1, "completed": 1, "total": 2},
+            ],
+        )
+
+    def test_range_and_monthly_bucket(self):
+        self._add_days(date(2024, 1, 30), 4)
+        Day.objects.create(user=self.user, date=date(2024, 2, 20))
+
+        response = self.client.get(
+            reverse("productivity_chart"),
+            {"from": "2024-01-31", "to": "2024-02-29", "bucket": "month"},
+        )
+
+        self.assertEqual(
+            response.context["data"],
+            [
+                {"date": date(2024, 1, 1), "days": 1, "completed": 1, "total": 2},
+                {"date": date(2024, 2, 1), "days": 3, "completed": 2, "total": 4},
+            ],
+        )
+
+    def test_weekly_bucket_starts_on_monday(self):
+        self._add_days(date(2024, 1, 3), 7)
+
+        response = self.client.get(
+            reverse("productivity_chart"), {"bucket": "week"}
+        )
+
+        self.assertEqual(
+            [(item["date"], item["days"]) for item in response.context["data"]],
+            [(date(2024, 1, 1), 5), (date(2024, 1, 8), 2)],
+        )
+
+
+class MoodChartDataTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="lia",
+            email="lia@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _data(self, **params):
+        response = self.client.get(reverse("mood_chart_data"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_daily_columns(self):
+        Day.objects.create(user=self.user, date=date(2024, 1, 1), mood="bad", notes="x" * 500)
+        Day.objects.create(user=self.user, date=date(2024, 1, 2))
+        Day.objects.create(user=self.user, date=date(2024, 1, 3), mood="very_good")
+
+        self.assertEqual(
+            self._data(),
+            {"bucket": "day", "dates": ["2024-01-01", "2024-01-03"], "moods": [2, 5]},
+        )
+
+    def test_window_and_weekly_mode(self):
+        moods = ["good", "good", "bad", "neutral", "neutral", "neutral", "very_bad", "good"]
+        for offset, mood in enumerate(moods):
+            Day.objects.create(
+                user=self.user, date=date(2024, 1, 1) + timedelta(days=offset), mood=mood
+            )
+
+        self.assertEqual(
+            self._data(**{"from": "2024-01-02", "to": "2024-01-08", "bucket": "week"}),
+            {"bucket": "week", "dates": ["2024-01-01", "2024-01-08"], "moods": [3, 4]},
+        )
+
+    def test_auto_bucket_bounds_payload(self):
+        start = date(2020, 1, 1)
+        for offset in range(0, 5 * 365, 5):
+            Day.objects.create(user=self.user, date=start + timedelta(days=offset), mood="neutral")
+        rebuild()
+
+        payload = self._data()
+
+        self.assertEqual(payload["bucket"], "month")
+        self.assertLessEqual(len(payload["dates"]), 61)
+
+    def test_html_chart_does_not_load_days(self):
+        Day.objects.create(user=self.user, date=date(2024, 1, 1), mood="good")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("mood_chart"))
+
+        self.assertContains(response, reverse("mood_chart_data"))
+        self.assertFalse(any("planner_day" in q["sql"] for q in ctx.captured_queries))
@@ -0,0 +1,86 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.template.loader import render_to_string
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.day_context import day_context, load_day
+from planner.models import Day, EveningReflection, Quote, TimeBlock
+
+
+class DayContextTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ilinca",
+            email="ilinca@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        self.quote = Quote.objects.create(text="Ai făcut suficient.")
+        self.day = Day.objects.create(
+            user=self.user,
+            date=date(2024, 3, 5),
+            is_closed=True,
+            closing_quote=self.quote,
+            notes="Zi lungă",
+        )
+        EveningReflection.objects.create(day=self.day, drain="Ședințe", small_win="Plimbare")
+        for hour in (14, 9, 11):
+            TimeBlock.objects.create(
+                day=self.day, title=f"T{hour}",
+                start_time=f"{hour}:00", end_time=f"{hour}:30",
+            )
+
+    def test_existing_day_loads_in_two_queries(self):
+        with self.assertNumQueries(2):
+            day, created = load_day(self.user, self.day.date)
+            context = day_context(day)
+            render_to_string("planner/day.html", context)
+
+        self.assertFalse(created)
+        self.assertEqual(
+            [block.title for block in context["time_blocks"]],
+            ["T9", "T11", "T14"],
+        )
+        self.assertEqual(context["reflection"].small_win, "Plimbare")
+        self.assertEqual(context["quote"], self.quote)
+
+    def test_new_day_needs_no_follow_up_queries(self):
+        new_date = date(2024, 3, 6)
+        day, created = load_day(self.user, new_date)
+        self.assertTrue(created)
+
+        with self.assertNumQueries(0):
+            context = day_context(day)
+            list(context["time_blocks"])
+
+        self.assertIsNone(context["reflection"])
+        self.assertIsNone(context["quote"])
+
+    def _planner_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [q["sql"] for q in ctx.captured_queries if "planner_" in q["sql"]]
+
+    def test_day_detail_query_budget(self):
+        url = reverse("day_detail", args=[2024, 3, 5])
+        self.client.get(reverse("mood_chart"))  # identitatea intră în cache
+
+        queries = self._planner_queries(url)
+
+        self.assertEqual(len(queries), 2)
+
+    def test_today_query_budget(self):
+        Day.objects.create(user=self.user, date=date.today() - timedelta(days=1), mood="bad")
+        self.client.get(reverse("today"))
+
+        queries = self._planner_queries(reverse("today"))
+
+        # ziua + blocurile + citatul ales după cheia primară
+        self.assertEqual(len(queries), 3)
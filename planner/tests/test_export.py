@@ -0,0 +1,204 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner import journal
+from planner.models import Day, EveningReflection, Quote, TimeBlock
+
+
+def body(response):
+    return b"".join(response.streaming_content)
+
+
+class JournalExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ana", email="ana@test.com", password="ComplexPass123!"
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        quote = Quote.objects.create(text="Respiră.", mood="good")
+        self.day = Day.objects.create(
+            user=self.user, date=date(2024, 3, 1), mood="good",
+            is_closed=True, closing_quote=quote, notes="Zi, cu \"virgule\"",
+        )
+        TimeBlock.objects.create(
+            day=self.day, title="Scris", start_time="09:00",
+            end_time="10:00", completed=True,
+        )
+        EveningReflection.objects.create(day=self.day, drain="Ploaia", small_win="Ceai")
+
+        for n in range(2, 6):
+            Day.objects.create(user=self.user, date=date(2024, 3, n))
+
+        other = User.objects.create_user(username="ion", password="ComplexPass123!")
+        Day.objects.create(user=other, date=date(2024, 3, 1))
+
+    def test_jsonl_streams_every_day_in_order(self):
+        response = self.client.get(reverse("export_jsonl"))
+
+        self.assertTrue(response.streaming)
+        lines = body(response).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[0]["closing_quote"], "Respiră.")
+        self.assertEqual(records[0]["reflection"], {"drain": "Ploaia", "small_win": "Ceai"})
+        self.assertEqual(records[0]["time_blocks"][0]["title"], "Scris")
+        self.assertEqual(records[-1]["date"], "2024-03-05")
+
+    def test_csv_quotes_fields(self):
+        response = self.client.get(reverse("export_csv"))
+
+        rows = list(csv.DictReader(io.StringIO(body(response).decode())))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["notes"], 'Zi, cu "virgule"')
+        self.assertEqual(rows[0]["blocks_completed"], "1")
+
+    def test_gzip_stream_is_a_valid_file(self):
+        response = self.client.get(reverse("export_jsonl") + "?gzip=1")
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertIn(".jsonl.gz", response["Content-Disposition"])
+        lines = gzip.decompress(body(response)).decode().splitlines()
+        self.assertEqual(len(lines), 5)
+
+    def test_queries_grow_per_chunk_not_per_day(self):
+        # un SELECT pe zile (citit cu fetchmany) + blocurile
+        # pentru fiecare bucată de 2 zile → 1 + 3
+        with self.assertNumQueries(4):
+            lines = list(journal.jsonl_lines(self.user, chunk_size=2))
+
+        self.assertEqual(len(lines), 5)
+
+
+class JournalImportTests(TestCase):
+    def setUp(self):
+        self.source = User.objects.create_user(username="ana", password="ComplexPass123!")
+        self.target = User.objects.create_user(username="ion", password="ComplexPass123!")
+        Quote.objects.create(text="Respiră.")
+
+        for n in range(1, 8):
+            day = Day.objects.create(
+                user=self.source, date=date(2024, 1, 27 + n) if n < 5 else date(2024, 2, n),
+                mood="good", closing_quote=Quote.objects.first(),
+            )
+            TimeBlock.objects.create(
+                day=day, title="Scris", start_time="09:00",
+                end_time="10:00", completed=n % 2 == 0,
+            )
+            EveningReflection.objects.create(day=day, drain="x", small_win="y")
+
+        self.lines = list(journal.jsonl_lines(self.source))
+
+    def test_round_trip_in_batches(self):
+        with CaptureQueriesContext(connection) as ctx:
+            result = journal.import_lines(self.target, self.lines, batch_size=4)
+
+        self.assertEqual(result.created, 7)
+        inserts = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "planner_day"')
+        ]
+        self.assertEqual(len(inserts), 2)
+        exported = [json.loads(line) for line in journal.jsonl_lines(self.target)]
+        self.assertEqual(exported, [json.loads(line) for line in self.lines])
+
+        january = self.target.monthly_rollups.get(year=2024, month=1)
+        self.assertEqual(january.days_logged, 4)
+        self.assertEqual(january.blocks_completed, 2)
+
+    def test_resume_and_rerun_do_not_duplicate(self):
+        first = journal.import_lines(self.target, self.lines[:3])
+        resumed = journal.import_lines(self.target, self.lines, start_line=first.last_line)
+        again = journal.import_lines(self.target, self.lines)
+
+        self.assertEqual((first.created, resumed.created), (3, 4))
+        self.assertEqual((again.created, again.skipped), (0, 7))
+        self.assertEqual(Day.objects.filter(user=self.target).count(), 7)
+
+    def test_bad_lines_are_reported_not_fatal(self):
+        lines = ["{nu e json", '{"date": "2024-13-01"}', "", self.lines[0]]
+
+        result = journal.import_lines(self.target, lines)
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual([e["line"] for e in result.errors], [1, 2])
+
+    def test_wrong_types_are_rejected_per_line(self):
+        lines = [
+            '{"date": 5}',
+            '{"date": "2024-03-01", "time_blocks": [{"start_time": 900, "end_time": 1000}]}',
+            '{"date": "2024-03-02", "time_blocks": 7}',
+            '{"date": "2024-03-03", "mood": ["good"], "closing_quote": {"x": 1}}',
+            self.lines[0],
+        ]
+
+        result = journal.import_lines(self.target, lines)
+
+        self.assertEqual([e["line"] for e in result.errors], [1, 2, 3])
+        self.assertEqual(result.created, 2)
+        day = Day.objects.get(user=self.target, date=date(2024, 3, 3))
+        self.assertIsNone(day.mood)
+        self.assertIsNone(day.closing_quote_id)
+
+    def test_rollups_are_rebuilt_once_per_import(self):
+        with mock.patch("planner.rollups.rebuild", wraps=journal.rollups.rebuild) as rebuild:
+            journal.import_lines(self.target, self.lines, batch_size=2)
+
+        self.assertEqual(rebuild.call_count, 1)
+        february = self.target.monthly_rollups.get(year=2024, month=2)
+        self.assertEqual(february.days_logged, 3)
+
+    def test_resume_rebuilds_rollups_of_earlier_batches(self):
+        # prima rulare „moare” după primul lot, înainte de rebuild
+        with mock.patch("planner.rollups.rebuild"):
+            first = journal.import_lines(self.target, self.lines[:4])
+
+        journal.import_lines(self.target, self.lines, start_line=first.last_line)
+
+        january = self.target.monthly_rollups.get(year=2024, month=1)
+        self.assertEqual(january.days_logged, 4)
+
+    def test_days_written_concurrently_are_skipped(self):
+        # alt import scrie prima zi între SELECT-ul nostru și INSERT
+        raced = json.loads(self.lines[0])["date"]
+        Day.objects.create(user=self.target, date=raced)
+        real = journal._existing_dates
+        calls = []
+
+        def first_misses(user, dates):
+            calls.append(dates)
+            return set() if len(calls) == 1 else real(user, dates)
+
+        with mock.patch.object(journal, "_existing_dates", side_effect=first_misses):
+            result = journal.import_lines(self.target, self.lines)
+
+        self.assertEqual(len(calls), 2)
+
+        self.assertEqual((result.created, result.skipped), (6, 1))
+        self.assertEqual(Day.objects.filter(user=self.target).count(), 7)
+        self.assertEqual(
+            TimeBlock.objects.filter(day__user=self.target).count(), 6
+        )
+
+    def test_upload_endpoint_accepts_gzip(self):
+        client = Client()
+        client.force_login(self.target)
+        upload = io.BytesIO(gzip.compress("".join(self.lines).encode()))
+        upload.name = "jurnal.jsonl.gz"
+
+        response = client.post(reverse("import_journal"), {"file": upload})
+
+        self.assertEqual(response.context["result"].created, 7)
+        self.assertEqual(Day.objects.filter(user=self.target).count(), 7)
@@ -0,0 +1,125 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.models import Day, TimeBlock
+
+
+AJAX = {"HTTP_X_REQUESTED_WITH": "XMLHttpRequest"}
+
+
+class FragmentEndpointTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="oana",
+            email="oana@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        self.day = Day.objects.create(user=self.user, date=date(2024, 4, 2))
+        self.block = TimeBlock.objects.create(
+            day=self.day, title="Scris", start_time="09:00", end_time="10:00"
+        )
+
+    def test_toggle_returns_block_fragment(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse("toggle_timeblock", args=[self.block.id]), **AJAX
+            )
+
+        payload = response.json()
+        self.assertTrue(payload["ok"])
+        self.assertEqual(payload["target"], f"block-{self.block.id}")
+        self.assertIn("done", payload["html"])
+
+        updates = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith("UPDATE") and "planner_timeblock" in q["sql"]
+        ]
+        self.assertEqual(len(updates), 1)
+        self.block.refresh_from_db()
+        self.assertTrue(self.block.completed)
+
+    def test_redirect_flow_still_works(self):
+        response = self.client.post(reverse("toggle_timeblock", args=[self.block.id]))
+
+        self.assertRedirects(response, reverse("day_detail", args=[2024, 4, 2]))
+
+    def test_toggle_and_delete_refuse_get(self):
+        for name in ("toggle_timeblock", "delete_timeblock"):
+            response = self.client.get(reverse(name, args=[self.block.id]))
+            self.assertEqual(response.status_code, 405)
+
+        for name in ("add_timeblock", "set_day_color", "set_day_mood", "update_day_text"):
+            self.assertEqual(self.client.get(reverse(name)).status_code, 405)
+
+        self.block.refresh_from_db()
+        self.assertFalse(self.block.completed)
+
+    def test_block_actions_are_post_forms(self):
+        response = self.client.get(reverse("day_detail", args=[2024, 4, 2]))
+
+        self.assertContains(
+            response,
+            f'action="{reverse("delete_timeblock", args=[self.block.id])}"',
+        )
+        self.assertNotContains(
+            response,
+            f'href="{reverse("delete_timeblock", args=[self.block.id])}"',
+        )
+
+    def test_set_mood_fragment(self):
+        response = self.client.post(
+            reverse("set_day_mood"), {"day_id": self.day.id, "mood": "good"}, **AJAX
+        )
+
+        payload = response.json()
+        self.assertEqual(payload["target"], "day-mood")
+        self.assertIn('data-mood="good"', payload["html"])
+
+    def test_closed_day_is_not_changed(self):
+        Day.objects.filter(pk=self.day.pk).update(is_closed=True)
+
+        self.client.post(
+            reverse("update_day_text"), {"day_id": self.day.id, "notes": "Târziu"}, **AJAX
+        )
+
+        self.day.refresh_from_db()
+        self.assertEqual(self.day.notes, "")
+
+    def test_add_returns_ordered_list_and_respects_limit(self):
+        Day.objects.filter(pk=self.day.pk).update(mood="very_bad")
+
+        response = self.client.post(
+            reverse("add_timeblock"),
+            {"day_id": self.day.id, "title": "Nou", "start_time": "08:00", "end_time": "08:30"},
+            **AJAX
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(response.json()["ok"])
+        self.assertEqual(self.day.time_blocks.count(), 1)
+
+        Day.objects.filter(pk=self.day.pk).update(mood="good")
+        payload = self.client.post(
+            reverse("add_timeblock"),
+            {"day_id": self.day.id, "title": "Nou", "start_time": "08:00", "end_time": "08:30"},
+            **AJAX
+        ).json()
+
+        self.assertEqual(payload["target"], "time-blocks")
+        self.assertLess(payload["html"].index("Nou"), payload["html"].index("Scris"))
+
+    def test_delete_returns_empty_fragment(self):
+        payload = self.client.post(
+            reverse("delete_timeblock", args=[self.block.id]), **AJAX
+        ).json()
+
+        self.assertEqual(payload, {"ok": True, "target": f"block-{self.block.id}", "html": ""})
+        self.assertFalse(TimeBlock.objects.filter(pk=self.block.pk).exists())
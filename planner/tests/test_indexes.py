@@ -0,0 +1,56 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Count, Q
+from django.test import TestCase
+
+from planner.models import Day, Quote, TimeBlock
+
+
+class IndexUsageTests(TestCase):
+    """Planurile SQLite pentru query-urile fierbinți folosesc indexurile noastre."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="ana", email="ana@test.com", password="ComplexPass123!"
+        )
+        cls.day = Day.objects.create(user=cls.user, date=date(2024, 5, 1))
+        TimeBlock.objects.create(
+            day=cls.day, title="Scris", start_time="09:00", end_time="10:00"
+        )
+        Quote.objects.create(text="Respiră.", mood="good")
+
+    def plan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return " | ".join(row[-1] for row in cursor.fetchall())
+
+    def assertUsesIndex(self, queryset, index):
+        if connection.vendor != "sqlite":
+            self.skipTest("EXPLAIN QUERY PLAN e specific SQLite")
+        plan = self.plan(queryset)
+        self.assertIn(index, plan, plan)
+
+    def test_quote_index_is_covering(self):
+        queryset = Quote.objects.filter(active=True).values_list("id", "mood").order_by()
+        self.assertUsesIndex(queryset, "COVERING INDEX quote_active_mood_idx")
+
+    def test_day_blocks_prefetch_is_ordered_by_index(self):
+        queryset = TimeBlock.objects.filter(day_id__in=[self.day.id]).order_by("start_time")
+        plan = self.plan(queryset)
+
+        self.assertUsesIndex(queryset, "timeblock_day_start_idx")
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_completed_count_uses_index(self):
+        queryset = Day.objects.filter(user=self.user).annotate(
+            done=Count("time_blocks", filter=Q(time_blocks__completed=True))
+        )
+        self.assertUsesIndex(queryset, "timeblock_day_completed_idx")
+
+    def test_case_insensitive_email_lookup_uses_index(self):
+        queryset = User.objects.filter(email__iexact="ANA@test.com")
+        self.assertUsesIndex(queryset, "planner_user_email_ci_idx")
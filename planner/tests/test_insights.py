@@ -0,0 +1,217 @@
+import json
+from datetime import date, timedelta
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from planner.insights import (
+    compute_correlations,
+    compute_insights,
+    load_history,
+    load_report,
+    rolling_mean,
+    user_correlations,
+    user_insights,
+)
+from planner.models import Day, TimeBlock
+
+
+TODAY = date(2024, 3, 20)  # miercuri
+
+
+class InsightsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ilinca", email="ilinca@test.com", password="ComplexPass123!"
+        )
+
+    def _day(self, offset, **fields):
+        return Day.objects.create(
+            user=self.user, date=TODAY - timedelta(days=offset), **fields
+        )
+
+    def _insights(self):
+        return compute_insights(load_history(self.user.id, end=TODAY), TODAY)
+
+    def test_history_is_one_query(self):
+        day = self._day(0, mood="good", color="green", is_closed=True)
+        TimeBlock.objects.create(
+            day=day, title="A", start_time="09:00", end_time="10:00", completed=True
+        )
+        TimeBlock.objects.create(day=day, title="B", start_time="10:00", end_time="11:00")
+        self._day(-1, mood="bad")  # în viitor, ignorată
+
+        with self.assertNumQueries(1):
+            history = load_history(self.user.id, end=TODAY)
+
+        self.assertEqual(history.ordinal.tolist(), [TODAY.toordinal()])
+        self.assertEqual(history.mood.tolist(), [4])
+        self.assertEqual(history.closed.tolist(), [True])
+        self.assertEqual(history.completed.tolist(), [1])
+
+    def test_streaks(self):
+        # 5 zile la rând până ieri, o pauză, apoi 7 zile mai demult
+        for offset in range(1, 6):
+            self._day(offset, mood="neutral", is_closed=offset < 3)
+        for offset in range(10, 17):
+            self._day(offset, is_closed=True)
+
+        insights = self._insights()
+
+        self.assertEqual(insights["logged_streak"], {"current": 5, "longest": 7})
+        self.assertEqual(insights["closed_streak"], {"current": 2, "longest": 7})
+
+    def test_broken_streak_is_zero(self):
+        self._day(2, notes="Am scris")
+        self._day(3, mood="good")
+
+        self.assertEqual(self._insights()["logged_streak"], {"current": 0, "longest": 2})
+
+    def test_empty_visited_days_are_not_logged(self):
+        # zile create doar de deschiderea paginii
+        self._day(0)
+        self._day(1)
+        self._day(2, notes="Am scris")
+        day = self._day(3)
+        TimeBlock.objects.create(day=day, title="A", start_time="09:00", end_time="10:00")
+
+        insights = self._insights()
+
+        self.assertEqual(insights["days_logged"], 2)
+        self.assertEqual(insights["logged_streak"], {"current": 0, "longest": 2})
+
+    def test_rolling_mean_skips_missing_days(self):
+        values = np.array([5, 0, 1, 0, 0, 0])
+
+        means = rolling_mean(values, values > 0, 3)
+
+        self.assertEqual(means[:4].tolist(), [5.0, 5.0, 3.0, 1.0])
+        self.assertTrue(np.isnan(means[-1]))
+
+    def test_rolling_averages_and_weekly_deltas(self):
+        # săptămâna trecută: „bad” (2), săptămâna aceasta: „good” (4)
+        for offset in range(2, 9):
+            self._day(offset + 1, mood="bad")
+        for offset in range(0, 3):
+            self._day(offset, mood="good")
+
+        insights = self._insights()
+        this_week, last_week = insights["weeks"][-1], insights["weeks"][-2]
+
+        self.assertEqual(insights["averages"]["mood_7"], round((3 * 4 + 4 * 2) / 7, 2))
+        self.assertEqual(this_week["week"], date(2024, 3, 18))
+        self.assertEqual((this_week["days"], this_week["mood"]), (3, 4.0))
+        self.assertEqual((last_week["days"], last_week["mood"]), (7, 2.0))
+        self.assertEqual(this_week["mood_delta"], 2.0)
+        self.assertEqual(len(insights["chart"]["labels"]), len(insights["chart"]["mood_30"]))
+
+    def test_cached_until_a_day_changes(self):
+        day = Day.objects.create(user=self.user, date=date.today(), mood="neutral")
+        client = Client()
+        client.force_login(self.user)
+
+        first = client.get(reverse("insights")).context["insights"]
+        self.assertEqual(first["averages"]["mood_7"], 3.0)
+
+        with self.assertNumQueries(0):
+            user_insights(self.user.id)
+
+        client.post(reverse("set_day_mood"), {"day_id": day.id, "mood": "very_good"})
+
+        self.assertEqual(user_insights(self.user.id)["averages"]["mood_7"], 5.0)
+
+    def test_notes_refresh_the_logged_days(self):
+        day = Day.objects.create(user=self.user, date=date.today())
+        client = Client()
+        client.force_login(self.user)
+
+        self.assertEqual(user_insights(self.user.id)["days_logged"], 0)
+
+        client.post(reverse("update_day_text"), {"day_id": day.id, "notes": "Am respirat."})
+
+        insights = client.get(reverse("insights")).context["insights"]
+        self.assertEqual(insights["days_logged"], 1)
+        self.assertEqual(insights["logged_streak"]["current"], 1)
+
+
+class CorrelationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="sorana", email="sorana@test.com", password="ComplexPass123!"
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _day(self, day, blocks=(), **fields):
+        day = Day.objects.create(user=self.user, date=date(2024, 5, day), **fields)
+        TimeBlock.objects.bulk_create([
+            TimeBlock(
+                day=day, title=f"T{n}", start_time=f"{n + 8:02d}:00",
+                end_time=f"{n + 8:02d}:30", category=category, completed=completed,
+            )
+            for n, (category, completed) in enumerate(blocks)
+        ])
+        return day
+
+    def test_report(self):
+        self._day(1, mood="good", color="green", blocks=[("work", True), ("work", True)])
+        self._day(2, mood="bad", color="red", blocks=[("work", False), ("rest", True)])
+        self._day(3, rest_day=True)
+        self._day(4, mood="good", blocks=[("health", True), ("work", False)])
+        self._day(8, mood="bad", blocks=[("work", False)])
+
+        with self.assertNumQueries(1):
+            report = compute_correlations(load_report(self.user.id))
+
+        by_mood = {item["value"]: item["completion"] for item in report["by_mood"]}
+        self.assertEqual(by_mood["good"], 75)
+        self.assertEqual(by_mood["bad"], 33)
+        self.assertIsNone(by_mood["neutral"])
+
+        by_color = {item["value"]: item["completion"] for item in report["by_color"]}
+        self.assertEqual((by_color["green"], by_color["red"]), (100, 50))
+
+        # 4 mai e în cele 3 zile de după odihnă; 1, 2 și 8 nu
+        self.assertEqual(report["rest"]["after"], {"days": 1, "completion": 50, "mood": 4.0})
+        self.assertEqual(report["rest"]["other"]["days"], 3)
+        self.assertEqual(report["rest"]["other"]["completion"], 60)
+
+        good = next(row for row in report["categories"] if row["value"] == "good")
+        mix = {item["value"]: item["percent"] for item in good["mix"]}
+        self.assertEqual((good["blocks"], mix["work"], mix["health"]), (4, 75, 25))
+
+    def test_cached_until_a_block_changes(self):
+        day = self._day(1, mood="good", blocks=[("work", False)])
+        block = day.time_blocks.get()
+
+        response = self.client.get(reverse("insights_report"))
+        self.assertEqual(response.context["report"]["by_mood"][3]["completion"], 0)
+
+        with self.assertNumQueries(0):
+            user_correlations(self.user.id)
+
+        self.client.post(reverse("toggle_timeblock", args=[block.id]))
+
+        self.assertEqual(user_correlations(self.user.id)["by_mood"][3]["completion"], 100)
+
+    def test_category_change_in_a_batch_refreshes_the_report(self):
+        day = self._day(1, mood="good", blocks=[("work", False)])
+        block = day.time_blocks.get()
+        user_correlations(self.user.id)
+
+        self.client.post(
+            reverse("timeblock_batch", args=[2024, 5, 1]),
+            json.dumps({"operations": [
+                {"op": "update", "id": block.id, "category": "health"},
+            ]}),
+            content_type="application/json",
+        )
+
+        good = next(
+            row for row in user_correlations(self.user.id)["categories"]
+            if row["value"] == "good"
+        )
+        mix = {item["value"]: item["percent"] for item in good["mix"]}
+        self.assertEqual((mix["work"], mix["health"]), (0, 100))
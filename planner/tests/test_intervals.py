@@ -0,0 +1,206 @@
+import json
+import random
+from datetime import date, time
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.intervals import DayIntervals, from_minutes
+from planner.models import Day, TimeBlock
+
+
+AJAX = {"HTTP_X_REQUESTED_WITH": "XMLHttpRequest"}
+
+
+def random_intervals(rng, count):
+    items = []
+    for key in range(count):
+        start = rng.randrange(0, 24 * 60 - 1)
+        items.append((start, rng.randint(start + 1, min(start + 90, 24 * 60)), key))
+    return items
+
+
+class DayIntervalsTests(SimpleTestCase):
+    def test_matches_brute_force_on_hundreds_of_blocks(self):
+        rng = random.Random(7)
+        items = random_intervals(rng, 400)
+        intervals = DayIntervals(items)
+
+        for start, end, _ in random_intervals(rng, 200):
+            expected = sorted(
+                key for a, b, key in items if a < end and b > start
+            )
+            self.assertEqual(sorted(intervals.overlaps(start, end)), expected)
+
+        expected_pairs = {
+            frozenset((k1, k2))
+            for a1, b1, k1 in items
+            for a2, b2, k2 in items
+            if k1 < k2 and a1 < b2 and a2 < b1
+        }
+        self.assertEqual({frozenset(pair) for pair in intervals.conflicts()}, expected_pairs)
+
+    def test_free_slots_match_a_minute_map(self):
+        rng = random.Random(3)
+        items = random_intervals(rng, 30)
+        intervals = DayIntervals(items)
+
+        busy = [False] * (24 * 60)
+        for start, end, _ in items:
+            busy[start:end] = [True] * (end - start)
+
+        slots = intervals.free_slots(15, 6 * 60, 23 * 60)
+
+        for start, end in slots:
+            self.assertGreaterEqual(end - start, 15)
+            self.assertFalse(any(busy[start:end]))
+        free = sum(end - start for start, end in slots)
+        runs, run = [], 0
+        for minute in range(6 * 60, 23 * 60):
+            if busy[minute]:
+                runs.append(run)
+                run = 0
+            else:
+                run += 1
+        runs.append(run)
+        self.assertEqual(free, sum(r for r in runs if r >= 15))
+
+    def test_touching_blocks_do_not_overlap(self):
+        intervals = DayIntervals([(540, 600, "a")])
+
+        self.assertEqual(intervals.overlaps(600, 660), [])
+        self.assertEqual(intervals.overlaps(480, 540), [])
+        self.assertEqual(intervals.overlaps(599, 601), ["a"])
+
+        intervals.add(600, 660, "b")
+        self.assertEqual(intervals.conflicts(), [])
+        self.assertEqual(intervals.free_slots(30, 480, 720), [(480, 540), (660, 720)])
+        self.assertEqual(from_minutes(24 * 60), "24:00")
+
+
+class OverlapViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ana-maria", email="am@test.com", password="ComplexPass123!"
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+        self.day = Day.objects.create(user=self.user, date=date(2024, 7, 1), mood="good")
+        self.block = TimeBlock.objects.create(
+            day=self.day, title="Ședință", start_time="10:00", end_time="11:00"
+        )
+
+    def _add(self, start, end):
+        return self.client.post(reverse("add_timeblock"), {
+            "day_id": self.day.id, "title": "Nou", "start_time": start, "end_time": end,
+        }, **AJAX)
+
+    def test_add_timeblock_rejects_overlap(self):
+        response = self._add("10:30", "11:30")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn("suprapune", response.json()["error"])
+        self.assertEqual(self.day.time_blocks.count(), 1)
+
+        self.assertEqual(self._add("11:00", "11:30").status_code, 200)
+        self.assertEqual(self.day.time_blocks.count(), 2)
+
+    def test_block_ending_at_midnight_is_a_form_error(self):
+        response = self._add("23:00", "24:00")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn("23:59", response.json()["error"])
+        self.assertEqual(self.day.time_blocks.count(), 1)
+
+        response = self.client.post(reverse("add_timeblock"), {
+            "day_id": self.day.id, "title": "Nou", "start_time": "23:00", "end_time": "24:00",
+        }, follow=True)
+        self.assertContains(response, "23:59")
+
+    def test_rejected_form_post_shows_the_error(self):
+        response = self.client.post(reverse("add_timeblock"), {
+            "day_id": self.day.id, "title": "Nou", "start_time": "10:30", "end_time": "11:30",
+        }, follow=True)
+
+        self.assertRedirects(response, reverse("day_detail", args=[2024, 7, 1]))
+        self.assertContains(response, "Intervalul se suprapune cu altul deja planificat.")
+        self.assertEqual(self.day.time_blocks.count(), 1)
+
+    def test_check_and_insert_share_one_transaction(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self._add("11:00", "11:30")
+
+        sql = [query["sql"] for query in ctx.captured_queries]
+        opened = next(i for i, q in enumerate(sql) if q.startswith("SAVEPOINT"))
+        released = next(i for i, q in enumerate(sql) if q.startswith("RELEASE SAVEPOINT"))
+        inserted = next(i for i, q in enumerate(sql) if q.startswith('INSERT INTO "planner_timeblock"'))
+        self.assertLess(opened, inserted)
+        self.assertLess(inserted, released)
+        self.assertIn('FROM "planner_day"', sql[opened + 1])
+
+    def test_batch_rejects_overlap_with_operation_index(self):
+        response = self.client.post(
+            reverse("timeblock_batch", args=[2024, 7, 1]),
+            json.dumps({"operations": [
+                {"op": "create", "title": "Liber", "start_time": "12:00", "end_time": "13:00"},
+                {"op": "create", "title": "Prânz", "start_time": "10:45", "end_time": "12:00"},
+            ]}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [1])
+        self.assertEqual(self.day.time_blocks.count(), 1)
+
+    def test_batch_can_move_a_block_out_of_the_way(self):
+        response = self.client.post(
+            reverse("timeblock_batch", args=[2024, 7, 1]),
+            json.dumps({"operations": [
+                {"op": "update", "id": self.block.id, "start_time": "08:00", "end_time": "09:00"},
+                {"op": "create", "title": "Prânz", "start_time": "10:00", "end_time": "11:00"},
+            ]}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_free_slots_on_a_day_with_hundreds_of_blocks(self):
+        # 265 de blocuri: 2 minute ocupate, 1 liber, 08:00–22:00; pauză la prânz
+        TimeBlock.objects.bulk_create([
+            TimeBlock(
+                day=self.day, title=f"B{n}",
+                start_time=time(*divmod(minute, 60)),
+                end_time=time(*divmod(minute + 2, 60)),
+            )
+            for n, minute in enumerate(range(8 * 60, 22 * 60, 3))
+            if not 12 * 60 <= minute < 12 * 60 + 45
+        ])
+        self.assertEqual(self.day.time_blocks.count(), 266)
+        url = reverse("free_slots", args=[2024, 7, 1])
+
+        data = self.client.get(url, {"min": 30, "from": "07:00", "to": "23:00"}).json()
+
+        self.assertEqual(
+            [(slot["start"], slot["end"]) for slot in data["slots"]],
+            [("07:00", "08:00"), ("11:59", "12:45"), ("21:59", "23:00")],
+        )
+        # Ședința de la 10:00 (mai veche) se suprapune cu 20 de blocuri
+        self.assertEqual(len(data["overlaps"]), 20)
+
+        short = self.client.get(url, {"min": 1, "from": "08:00", "to": "09:00"}).json()
+        self.assertEqual(len(short["slots"]), 20)
+
+    def test_free_slots_for_an_unsaved_day(self):
+        response = self.client.get(
+            reverse("free_slots", args=[2024, 8, 1]), {"from": "09:00", "to": "24:00"}
+        )
+
+        self.assertEqual(response.json()["slots"], [{"start": "09:00", "end": "24:00", "minutes": 900}])
+        self.assertFalse(Day.objects.filter(date=date(2024, 8, 1)).exists())
+        self.assertEqual(
+            self.client.get(reverse("free_slots", args=[2024, 8, 1]), {"min": "x"}).status_code,
+            400,
+        )
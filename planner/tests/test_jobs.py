@@ -0,0 +1,126 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from planner import jobs
+from planner.models import Job
+
+
+calls = []
+
+
+@jobs.task(name="test.record", max_attempts=3)
+def record(value):
+    calls.append(value)
+
+
+@jobs.task(name="test.explode", max_attempts=2)
+def explode():
+    raise RuntimeError("SMTP indisponibil")
+
+
+@jobs.task(name="test.slow")
+def slow():
+    time.sleep(0.2)
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_deferred_job_runs_once(self):
+        job = jobs.defer(record, value=7)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(jobs.run_pending(), 1)
+        self.assertEqual(jobs.run_pending(), 0)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.DONE)
+        self.assertEqual(calls, [7])
+
+    def test_idempotency_key_returns_existing_job(self):
+        first = jobs.defer("test.record", value=1, idempotency_key="k")
+        second = jobs.defer("test.record", value=2, idempotency_key="k")
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_failures_back_off_then_give_up(self):
+        job = jobs.defer(explode)
+
+        jobs.run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.PENDING)
+        self.assertGreater(job.run_at, timezone.now() + timedelta(seconds=20))
+        self.assertIn("SMTP indisponibil", job.last_error)
+
+        # nu e încă scadent
+        self.assertEqual(jobs.run_pending(), 0)
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        jobs.run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_stale_running_job_is_reclaimed(self):
+        job = jobs.defer(record, value=3)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.Status.RUNNING,
+            locked_by="mort",
+            locked_at=timezone.now() - jobs.LOCK_TIMEOUT - timedelta(minutes=1),
+        )
+
+        self.assertEqual(jobs.run_pending(), 1)
+        self.assertEqual(calls, [3])
+
+    def test_stale_job_on_its_last_attempt_fails(self):
+        job = jobs.defer(record, value=3)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.Status.RUNNING,
+            attempts=job.max_attempts,
+            locked_by="mort",
+            locked_at=timezone.now() - jobs.LOCK_TIMEOUT - timedelta(minutes=1),
+        )
+
+        self.assertEqual(jobs.run_pending(), 0)
+        self.assertEqual(calls, [])
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertEqual(job.attempts, job.max_attempts)
+        self.assertTrue(job.last_error)
+
+    def test_touch_keeps_a_running_job_alive(self):
+        job = jobs.defer(record, value=3)
+        old = timezone.now() - jobs.LOCK_TIMEOUT - timedelta(minutes=1)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.Status.RUNNING, locked_by="viu", locked_at=old,
+        )
+        job.refresh_from_db()
+
+        self.assertEqual(jobs.touch(job), 1)
+        # alt worker nu-l poate ține în viață
+        job.locked_by = "altul"
+        self.assertEqual(jobs.touch(job), 0)
+
+        # nu mai e abandonat, deci nu se revendică a doua oară
+        self.assertEqual(jobs.run_pending(), 0)
+        self.assertEqual(calls, [])
+
+    def test_long_job_sends_heartbeats(self):
+        jobs.defer(slow)
+
+        with mock.patch.object(jobs, "HEARTBEAT", timedelta(seconds=0.02)), \
+                mock.patch.object(jobs, "touch") as touch:
+            jobs.run_pending()
+
+        self.assertGreater(touch.call_count, 1)
+
+    def test_unknown_task_is_rejected(self):
+        with self.assertRaises(LookupError):
+            jobs.defer("nu.exista")
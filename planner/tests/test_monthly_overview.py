@@ -0,0 +1,74 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from planner.analytics import month_overview
+from planner.models import Day, TimeBlock
+
+
+class MonthlyOverviewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="rita", email="rita@test.com", password="ComplexPass123!"
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        first = Day.objects.create(user=self.user, date=date(2024, 2, 1), mood="good", color="green")
+        Day.objects.create(user=self.user, date=date(2024, 2, 2), mood="good", rest_day=True)
+        Day.objects.create(user=self.user, date=date(2024, 2, 3), mood="bad", color="red")
+        Day.objects.create(user=self.user, date=date(2024, 3, 1), mood="very_bad")
+
+        for n, completed in enumerate([True, True, False, False]):
+            TimeBlock.objects.create(
+                day=first, title=f"T{n}", start_time=f"0{n + 1}:00",
+                end_time=f"0{n + 1}:30", completed=completed,
+            )
+
+    def test_statistics_for_any_month(self):
+        response = self.client.get(reverse("monthly_overview_month", args=[2024, 2]))
+        overview = response.context["overview"]
+
+        self.assertEqual(overview["days_logged"], 3)
+        self.assertEqual(overview["rest_days"], 1)
+        self.assertEqual(overview["completion"], 50)
+        self.assertEqual(
+            {m["value"]: m["count"] for m in overview["moods"] if m["count"]},
+            {"good": 2, "bad": 1},
+        )
+        self.assertEqual(
+            {c["value"]: c["percent"] for c in overview["colors"] if c["count"]},
+            {"green": 50, "red": 50},
+        )
+        self.assertEqual(len(overview["days"]), 3)
+        self.assertEqual(response.context["next_month"], (2024, 3))
+
+    def test_past_month_is_cached_until_a_day_changes(self):
+        with self.assertNumQueries(2):
+            month_overview(self.user.id, 2024, 2)
+        with self.assertNumQueries(0):
+            month_overview(self.user.id, 2024, 2)
+
+        self.client.post(reverse("set_day_mood"), {
+            "day_id": Day.objects.get(user=self.user, date=date(2024, 2, 3)).id,
+            "mood": "very_good",
+        })
+
+        overview = month_overview(self.user.id, 2024, 2)
+        self.assertEqual(
+            {m["value"]: m["count"] for m in overview["moods"] if m["count"]},
+            {"good": 2, "very_good": 1},
+        )
+
+    def test_current_month_is_not_cached(self):
+        today = date.today()
+        month_overview(self.user.id, today.year, today.month)
+
+        with self.assertNumQueries(2):
+            month_overview(self.user.id, today.year, today.month)
+
+    def test_invalid_month(self):
+        response = self.client.get(reverse("monthly_overview_month", args=[2024, 13]))
+        self.assertEqual(response.status_code, 404)
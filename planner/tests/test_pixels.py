@@ -0,0 +1,55 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from planner import pixels
+from planner.models import Day
+
+
+class YearPixelsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ilinca", email="ilinca@test.com", password="ComplexPass123!"
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        self.day = Day.objects.create(
+            user=self.user, date=date(2024, 3, 1), mood="good", color="blue"
+        )
+        Day.objects.create(user=self.user, date=date(2024, 12, 31), mood="very_bad")
+
+    def test_one_byte_per_day(self):
+        data = pixels.year_pixels(self.user.id, 2024)
+
+        self.assertEqual(len(data), 366)
+        self.assertEqual(data[pixels.day_index(date(2024, 3, 1))], pixels.encode("good", "blue"))
+        self.assertEqual(data[365] >> 4, pixels.MOOD_CODES["very_bad"])
+        self.assertEqual(data.count(0), 364)
+
+    def test_second_render_reads_only_the_cache(self):
+        url = reverse("year_pixels_year", args=[2024])
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url + "?mode=color")
+
+        march = response.context["months"][2]["cells"]
+        self.assertEqual((march[0]["mood"], march[0]["color"]), ("good", "blue"))
+        self.assertContains(response, "color-blue")
+
+    def test_mood_and_color_changes_drop_the_year(self):
+        pixels.year_pixels(self.user.id, 2024)
+
+        self.client.post(reverse("set_day_mood"), {"day_id": self.day.id, "mood": "bad"})
+        self.client.post(reverse("set_day_color"), {"day_id": self.day.id, "color": ""})
+
+        with self.assertNumQueries(1):
+            data = pixels.year_pixels(self.user.id, 2024)
+        with self.assertNumQueries(0):
+            self.assertEqual(pixels.year_pixels(self.user.id, 2024), data)
+
+        self.assertEqual(data, pixels.build_year(self.user.id, 2024))
+        self.assertEqual(data[pixels.day_index(self.day.date)], pixels.encode("bad", None))
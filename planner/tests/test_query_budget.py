@@ -0,0 +1,84 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver
+
+from planner.benchmarks import CHUNKED, chunks, over_budget, prepare, run_cases, url_names
+from planner.journal import CHUNK_SIZE
+from planner.models import Day, EveningReflection, TimeBlock
+from planner.synthetic import generate_history, generate_quotes
+
+
+class SyntheticDataTests(TestCase):
+    def test_history_is_generated_in_bulk(self):
+        user = User.objects.create_user(username="ana", password="ComplexPass123!")
+
+        with CaptureQueriesContext(connection) as ctx:
+            generate_history(user, 60, seed=3)
+
+        # inserturi în lot + câteva query-uri per lună de rollup
+        self.assertLess(len(ctx.captured_queries), 60)
+
+        self.assertEqual(Day.objects.filter(user=user).count(), 60)
+        self.assertTrue(TimeBlock.objects.filter(day__user=user).exists())
+        self.assertTrue(EveningReflection.objects.filter(day__user=user).exists())
+        self.assertEqual(
+            sum(r.days_logged for r in user.monthly_rollups.all()), 60
+        )
+
+
+class QueryBudgetTests(TestCase):
+    # al doilea istoric trece de o bucată de export
+    SIZES = (14, CHUNK_SIZE + 100)
+
+    @classmethod
+    def setUpTestData(cls):
+        generate_quotes(50)
+
+    def _run(self, size):
+        cache.clear()
+        user = User.objects.create_user(
+            username=f"bench{size}", password="ComplexPass123!"
+        )
+        fixture = prepare(user, size, seed=size)
+
+        client = Client()
+        client.force_login(user)
+        return run_cases(client, fixture)
+
+    def test_every_url_has_a_case(self):
+        names = {
+            pattern.name
+            for pattern in get_resolver("planner.urls").url_patterns
+        }
+        self.assertEqual(names - url_names(), set())
+
+    def test_query_count_does_not_grow_with_history(self):
+        small, large = (self._run(size) for size in self.SIZES)
+        self.assertGreater(chunks(self.SIZES[1]), chunks(self.SIZES[0]))
+
+        for name, result in small.items():
+            with self.subTest(url=name):
+                self.assertLess(result["status"], 500)
+                self.assertFalse(
+                    over_budget(
+                        name,
+                        large[name]["queries"],
+                        result["queries"],
+                        self.SIZES[1],
+                        self.SIZES[0],
+                    ),
+                    f"{name}: {result['queries']} → {large[name]['queries']} query-uri",
+                )
+
+    def test_over_budget(self):
+        export = next(iter(CHUNKED))
+
+        self.assertTrue(over_budget("home", 8, 7, 400, 14))
+        self.assertFalse(over_budget("home", 7, 7, 400, 14))
+        # o bucată în plus → un query în plus, nu mai mult
+        self.assertFalse(over_budget(export, 6, 5, CHUNK_SIZE + 100, 14))
+        self.assertTrue(over_budget(export, 7, 5, CHUNK_SIZE + 100, 14))
+        self.assertTrue(over_budget(export, 6, 5, 400, 14))
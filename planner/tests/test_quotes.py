@@ -0,0 +1,91 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.models import Day, Quote
+from planner.quotes import quote_index
+
+
+class QuoteIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="nora",
+            email="nora@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+        self.sad = Quote.objects.create(text="Pentru zile grele.", mood="bad")
+        self.any = Quote.objects.create(text="Pentru orice zi.")
+        self.happy = Quote.objects.create(text="Pentru zile bune.", mood="good")
+        Quote.objects.create(text="Inactiv.", mood="bad", active=False)
+
+    def test_buckets_by_mood(self):
+        buckets = quote_index.buckets()
+
+        self.assertEqual(buckets["bad"], [self.sad.id])
+        self.assertEqual(buckets[None], [self.any.id])
+        self.assertEqual(buckets["good"], [self.happy.id])
+
+    def test_today_picks_without_table_scan(self):
+        Day.objects.create(user=self.user, date=date.today(), mood="bad")
+        quote_index.buckets()
+
+        for _ in range(10):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse("today"))
+
+            self.assertIn(response.context["quote"], [self.sad, self.any])
+            self.assertFalse(
+                any("RANDOM" in q["sql"].upper() for q in ctx.captured_queries)
+            )
+
+    def test_index_follows_saves_and_deletes(self):
+        quote_index.buckets()
+
+        new = Quote.objects.create(text="Nou.", mood="bad")
+        self.assertIn(new.id, quote_index.buckets()["bad"])
+
+        self.sad.active = False
+        self.sad.save()
+        new.delete()
+        self.assertNotIn("bad", quote_index.buckets())
+
+    def test_admin_delete_invalidates_index(self):
+        admin = User.objects.create_superuser(
+            username="admin", email="admin@test.com", password="ComplexPass123!"
+        )
+        self.client.force_login(admin)
+        quote_index.buckets()
+
+        self.client.post(
+            reverse("admin:planner_quote_delete", args=[self.happy.id]),
+            {"post": "yes"},
+        )
+
+        self.assertNotIn("good", quote_index.buckets())
+
+    def test_stale_id_is_skipped(self):
+        quote_index.buckets()
+
+        # .update() nu trimite semnale – indexul rămâne învechit
+        Quote.objects.filter(pk=self.sad.pk).update(active=False)
+
+        self.assertIsNone(quote_index.pick(["bad"]))
+        self.assertNotIn("bad", quote_index.buckets())
+
+    def test_closing_quote_prefers_mood(self):
+        day = Day.objects.create(user=self.user, date=date.today(), mood="good")
+
+        self.client.post(
+            reverse("evening_reflection", args=[day.date.year, day.date.month, day.date.day]),
+            {"drain": "", "small_win": ""},
+        )
+
+        day.refresh_from_db()
+        self.assertEqual(day.closing_quote, self.happy)
@@ -0,0 +1,72 @@
+from datetime import datetime, time
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from planner.models import Day, UserProfile
+from planner.reminders import dispatch, due_profiles
+
+
+MOMENT = timezone.make_aware(datetime(2024, 6, 3, 21, 30, 15))
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class EveningReminderTests(TestCase):
+    def make_user(self, name, at=time(21, 30), **extra):
+        user = User.objects.create(username=name, email=f"{name}@test.com", **extra)
+        UserProfile.objects.create(user=user, nickname=name.title(), evening_reminder_time=at)
+        return user
+
+    def setUp(self):
+        self.due = [self.make_user(f"ana{n}") for n in range(3)]
+        self.make_user("later", at=time(21, 31))
+        self.make_user("never", at=None)
+        self.make_user("inactive", is_active=False)
+
+        closed = self.make_user("closed")
+        Day.objects.create(user=closed, date=MOMENT.date(), is_closed=True)
+
+    def test_only_due_users_get_one_reminder(self):
+        sent = dispatch(MOMENT, batch_size=2)
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(
+            sorted(m.to[0] for m in mail.outbox),
+            sorted(u.email for u in self.due),
+        )
+        self.assertIn("Ana0", mail.outbox[0].body)
+
+        # a doua rulare în același minut nu trimite din nou
+        self.assertEqual(dispatch(MOMENT), 0)
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_queries_scale_with_due_users_only(self):
+        for n in range(20):
+            self.make_user(f"other{n}", at=time(8, n))
+
+        # 2 loturi (2 + 1 useri), fiecare cu un SELECT și un UPDATE
+        with self.assertNumQueries(4):
+            dispatch(MOMENT, batch_size=2)
+
+    def test_lookup_uses_partial_index(self):
+        sql, params = due_profiles(MOMENT).query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " | ".join(row[-1] for row in cursor.fetchall())
+
+        self.assertIn("profile_reminder_time_idx", plan)
+
+    def test_profile_form_sets_reminder_time(self):
+        user = self.due[0]
+        self.client.force_login(user)
+
+        self.client.post(reverse("profile"), {
+            "nickname": "Ana", "bio": "", "evening_reminder_time": "20:45",
+        })
+
+        user.profile.refresh_from_db()
+        self.assertEqual(user.profile.evening_reminder_time, time(20, 45))
@@ -0,0 +1,95 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from planner.models import Day, MonthlyRollup, TimeBlock
+from planner.rollups import rebuild
+
+
+class MonthlyRollupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="rita",
+            email="rita@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _open_day(self, d):
+        self.client.get(reverse("day_detail", args=[d.year, d.month, d.day]))
+        return Day.objects.get(user=self.user, date=d)
+
+    def _rollup(self, d):
+        return MonthlyRollup.objects.get(user=self.user, year=d.year, month=d.month)
+
+    def test_views_keep_rollup_in_sync(self):
+        d = date(2024, 5, 10)
+        day = self._open_day(d)
+
+        self.client.post(reverse("set_day_mood"), {"day_id": day.id, "mood": "bad"})
+        self.client.post(reverse("set_day_mood"), {"day_id": day.id, "mood": "good"})
+        self.client.post(reverse("set_day_color"), {"day_id": day.id, "color": "green"})
+        for start in ("09:00", "10:00"):
+            self.client.post(
+                reverse("add_timeblock"),
+                {"day_id": day.id, "title": "T", "start_time": start, "end_time": start[:2] + ":30"},
+            )
+
+        first, second = day.time_blocks.all()
+        self.client.post(reverse("toggle_timeblock", args=[first.id]))
+        self.client.post(reverse("toggle_timeblock", args=[second.id]))
+        self.client.post(reverse("delete_timeblock", args=[second.id]))
+
+        rollup = self._rollup(d)
+        self.assertEqual(rollup.days_logged, 1)
+        self.assertEqual(rollup.blocks_planned, 1)
+        self.assertEqual(rollup.blocks_completed, 1)
+        self.assertEqual(rollup.mood_bad, 0)
+        self.assertEqual(rollup.mood_good, 1)
+        self.assertEqual(rollup.color_green, 1)
+
+        # ✅ incremental == recalculat din rândurile brute
+        expected = {
+            field: getattr(rollup, field)
+            for field in ("days_logged", "blocks_planned", "blocks_completed", "mood_good", "color_green")
+        }
+        MonthlyRollup.objects.all().delete()
+        rebuild()
+        rebuilt = self._rollup(d)
+        self.assertEqual(
+            {field: getattr(rebuilt, field) for field in expected},
+            expected,
+        )
+
+    def test_missing_month_is_computed_from_raw_rows(self):
+        d = date(2024, 6, 2)
+        day = Day.objects.create(user=self.user, date=d, mood="neutral")
+        TimeBlock.objects.create(day=day, title="T", start_time="09:00", end_time="10:00")
+
+        self.client.post(reverse("set_day_color"), {"day_id": day.id, "color": "blue"})
+
+        rollup = self._rollup(d)
+        self.assertEqual(rollup.days_logged, 1)
+        self.assertEqual(rollup.mood_neutral, 1)
+        self.assertEqual(rollup.blocks_planned, 1)
+        self.assertEqual(rollup.color_blue, 1)
+
+    def test_monthly_charts_read_rollups(self):
+        MonthlyRollup.objects.create(
+            user=self.user, year=2023, month=3,
+            days_logged=20, blocks_planned=40, blocks_completed=30,
+            mood_good=12, mood_bad=8,
+        )
+
+        response = self.client.get(reverse("productivity_chart"), {"bucket": "month"})
+        self.assertEqual(
+            response.context["data"],
+            [{"date": date(2023, 3, 1), "days": 20, "completed": 30, "total": 40}],
+        )
+
+        payload = self.client.get(reverse("mood_chart_data"), {"bucket": "month"}).json()
+        self.assertEqual(payload["dates"], ["2023-03-01"])
+        self.assertEqual(payload["moods"], [4])
@@ -0,0 +1,147 @@
+import json
+import time as clock
+from datetime import date, time
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner import scheduler
+from planner.batch import BatchError
+from planner.day_context import load_day
+from planner.models import Day, TimeBlock
+from planner.scheduler import Task, pack
+
+
+def task(index, minutes, priority=0):
+    return Task(index, f"T{index}", minutes, "work", priority)
+
+
+class PackTests(SimpleTestCase):
+    def test_priority_then_longest_first_into_earliest_slot(self):
+        slots = [(540, 570), (600, 720)]  # 09:00–09:30, 10:00–12:00
+        tasks = [task(0, 30), task(1, 90, priority=1), task(2, 60)]
+
+        placed, unplaced = pack(slots, tasks, capacity=5)
+
+        self.assertEqual(
+            [(t.index, start, end) for t, start, end in placed],
+            [(0, 540, 570), (1, 600, 690)],
+        )
+        self.assertEqual([(t.index, reason) for t, reason in unplaced], [(2, "no_slot")])
+
+    def test_capacity_keeps_the_most_important(self):
+        placed, unplaced = pack([(0, 1000)], [task(0, 10), task(1, 10, 3), task(2, 10, 1)], 2)
+
+        self.assertEqual(sorted(t.index for t, _, _ in placed), [1, 2])
+        self.assertEqual(unplaced[0][1], "limit")
+
+    def test_many_slots_and_tasks_in_milliseconds(self):
+        slots = [(minute, minute + 2) for minute in range(0, 1440, 3)]
+        tasks = [task(n, 2 + n % 2) for n in range(50)]
+
+        started = clock.perf_counter()
+        placed, _ = pack(slots, tasks, capacity=99)
+        elapsed = clock.perf_counter() - started
+
+        self.assertEqual(len(placed), 25)
+        self.assertLess(elapsed, 0.05)
+
+
+class ScheduleViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="dora", email="dora@test.com", password="ComplexPass123!"
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+        self.day = Day.objects.create(user=self.user, date=date(2024, 7, 1), mood="good")
+        TimeBlock.objects.create(
+            day=self.day, title="Ședință", start_time="10:00", end_time="11:00"
+        )
+        self.url = reverse("schedule_day", args=[2024, 7, 1])
+
+    def _post(self, **payload):
+        return self.client.post(self.url, json.dumps(payload), content_type="application/json")
+
+    def test_proposal_respects_blocks_and_hours(self):
+        response = self._post(**{"from": "09:00", "to": "12:00", "tasks": [
+            {"title": "Email", "minutes": 30},
+            {"title": "Raport", "minutes": 60, "category": "work", "priority": 2},
+            {"title": "Prea lung", "minutes": 120},
+        ]})
+        data = response.json()
+
+        self.assertFalse(data["accepted"])
+        self.assertEqual(
+            [(item["title"], item["start_time"], item["end_time"]) for item in data["placed"]],
+            [("Raport", "09:00", "10:00"), ("Email", "11:00", "11:30")],
+        )
+        self.assertEqual(data["unplaced"], [{"index": 2, "title": "Prea lung", "reason": "no_slot"}])
+        self.assertEqual(self.day.time_blocks.count(), 1)
+
+    def test_mood_limit_and_rest_day(self):
+        Day.objects.filter(pk=self.day.pk).update(rest_day=True)
+
+        data = self._post(tasks=[{"title": "Email", "minutes": 30}]).json()
+
+        self.assertEqual((data["limit"], data["remaining"]), (1, 0))
+        self.assertEqual(data["unplaced"][0]["reason"], "limit")
+
+    def test_accept_writes_with_one_bulk_insert(self):
+        tasks = [{"title": f"T{n}", "minutes": 15, "category": "personal"} for n in range(4)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post(accept=True, tasks=tasks)
+
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "planner_timeblock"')]
+        self.assertEqual(len(inserts), 1)
+
+        data = response.json()
+        self.assertTrue(data["accepted"])
+        self.assertEqual(len(data["blocks"]), 5)
+        self.assertEqual(
+            list(self.day.time_blocks.filter(category="personal").values_list("start_time", flat=True)),
+            [time(9, 0), time(9, 15), time(9, 30), time(9, 45)],
+        )
+
+    def test_accept_refuses_a_plan_the_day_outgrew(self):
+        day, _ = load_day(self.user, date(2024, 7, 1))
+        tasks = scheduler.parse_tasks([
+            {"title": "Email", "minutes": 30},
+            {"title": "Raport", "minutes": 60, "priority": 2},
+        ])
+        plan = scheduler.propose(day, tasks)
+
+        # între propunere și accept, ora 09:00 a fost ocupată manual
+        TimeBlock.objects.create(
+            day=self.day, title="Telefon", start_time="09:00", end_time="09:30"
+        )
+
+        with self.assertRaises(BatchError) as raised:
+            scheduler.accept(day, plan)
+
+        self.assertEqual([error["index"] for error in raised.exception.errors], [1])
+        self.assertIn("Telefon", raised.exception.errors[0]["error"])
+        self.assertEqual(self.day.time_blocks.count(), 2)
+
+    def test_accept_respects_a_limit_lowered_after_the_proposal(self):
+        day, _ = load_day(self.user, date(2024, 7, 1))
+        plan = scheduler.propose(day, scheduler.parse_tasks([
+            {"title": "Email", "minutes": 30},
+        ]))
+        Day.objects.filter(pk=self.day.pk).update(rest_day=True)
+
+        with self.assertRaises(BatchError):
+            scheduler.accept(day, plan)
+
+        self.assertEqual(self.day.time_blocks.count(), 1)
+
+    def test_invalid_tasks(self):
+        response = self._post(tasks=[{"title": "", "minutes": 30}, {"title": "X", "minutes": "y"}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [0, 1])
+        self.assertEqual(self._post(tasks=[], **{"from": "18:00", "to": "09:00"}).status_code, 400)
@@ -0,0 +1,109 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from planner.models import Day, EveningReflection
+from planner.search import parse_cursor, search_days
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="oana", email="oana@test.com", password="ComplexPass123!"
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _day(self, offset=0, **fields):
+        return Day.objects.create(
+            user=self.user, date=date(2024, 1, 1) + timedelta(days=offset), **fields
+        )
+
+    def _dates(self, text, **kwargs):
+        results, _ = search_days(self.user.id, text, **kwargs)
+        return [result.date for result in results]
+
+    def test_every_text_field_is_searchable(self):
+        self._day(0, notes="o plimbare lungă în parc")
+        self._day(1, focus_of_the_day="plimbare cu mama")
+        self._day(2, gratitude="soare")
+        day = self._day(3)
+        EveningReflection.objects.create(day=day, drain="ședința", small_win="am respirat")
+
+        self.assertEqual(
+            sorted(self._dates("plimbare")), [date(2024, 1, 1), date(2024, 1, 2)]
+        )
+        self.assertEqual(self._dates("soare"), [date(2024, 1, 3)])
+        self.assertEqual(self._dates("respir"), [date(2024, 1, 4)])  # prefix
+        self.assertEqual(self._dates("sedinta"), [date(2024, 1, 4)])  # fără diacritice
+
+    def test_focus_ranks_above_notes(self):
+        self._day(0, notes="plimbare și multe altele de făcut azi dimineață")
+        self._day(1, focus_of_the_day="plimbare și multe altele de făcut azi dimineață")
+
+        self.assertEqual(self._dates("plimbare"), [date(2024, 1, 2), date(2024, 1, 1)])
+
+    def test_index_follows_updates_and_deletes(self):
+        day = self._day(0, notes="ceai")
+        reflection = EveningReflection.objects.create(day=day, drain="trafic")
+
+        # UPDATE direct, ca în update_open_day
+        Day.objects.filter(pk=day.pk).update(notes="cafea")
+        self.assertEqual(self._dates("ceai"), [])
+        self.assertEqual(self._dates("cafea"), [date(2024, 1, 1)])
+
+        reflection.delete()
+        self.assertEqual(self._dates("trafic"), [])
+
+        day.delete()
+        self.assertEqual(self._dates("cafea"), [])
+
+    def test_only_own_days_and_safe_input(self):
+        other = User.objects.create_user(username="x", email="x@test.com", password="p")
+        Day.objects.create(user=other, date=date(2024, 1, 1), notes="secret")
+
+        self.assertEqual(self._dates("secret"), [])
+        self.assertEqual(self._dates('"secret AND (*'), [])
+        self.assertEqual(self._dates("   "), [])
+
+    def test_highlight_is_escaped(self):
+        self._day(0, notes="<b>plimbare</b> scurtă")
+
+        results, _ = search_days(self.user.id, "plimbare")
+
+        self.assertIn("<mark>plimbare</mark>", results[0].snippet)
+        self.assertIn("&lt;b&gt;", results[0].snippet)
+
+    def test_keyset_pages_cover_every_match_once(self):
+        Day.objects.bulk_create([
+            Day(
+                user=self.user,
+                date=date(2020, 1, 1) + timedelta(days=n),
+                notes="plimbare " + "cuvânt " * (n % 7),
+            )
+            for n in range(300)
+        ])
+
+        seen, cursor = [], None
+        while True:
+            with self.assertNumQueries(1):
+                results, next_cursor = search_days(
+                    self.user.id, "plimbare", after=parse_cursor(cursor), limit=40
+                )
+            seen += [result.day_id for result in results]
+            if not next_cursor:
+                break
+            cursor = next_cursor
+
+        self.assertEqual(len(seen), 300)
+        self.assertEqual(len(set(seen)), 300)
+
+    def test_view(self):
+        self._day(0, notes="plimbare")
+
+        response = self.client.get(reverse("search"), {"q": "plimbare"})
+
+        self.assertContains(response, "<mark>plimbare</mark>")
+        self.assertContains(response, reverse("day_detail", args=[2024, 1, 1]))
@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.analytics import weekly_scores
+from planner.caching import user_generation
+from planner.models import Day, TimeBlock
+
+
+class WeeklyScoreTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="sara",
+            email="sara@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _day(self, d, mood=None, completed=0):
+        day = Day.objects.create(user=self.user, date=d, mood=mood)
+        for _ in range(completed):
+            TimeBlock.objects.create(
+                day=day, title="T", start_time="09:00", end_time="10:00", completed=True
+            )
+        return day
+
+    def test_trailing_week_score(self):
+        today = date.today()
+        self._day(today, mood="good", completed=2)
+        self._day(today - timedelta(days=3))
+        self._day(today - timedelta(days=9), mood="bad", completed=5)
+
+        response = self.client.get(reverse("weekly_score"))
+
+        self.assertEqual(response.context["score"], 2 * 10 + 8 + 2 * 2)
+        self.assertEqual(response.context["days_logged"], 2)
+        self.assertEqual(response.context["mood_days"], 1)
+        self.assertEqual(response.context["completed_tasks"], 2)
+
+    def test_history_is_one_grouped_query(self):
+        today = date(2024, 6, 12)  # miercuri
+        self._day(date(2024, 6, 10), mood="good", completed=1)
+        self._day(date(2024, 6, 3), completed=3)
+        self._day(date(2023, 7, 1), mood="bad")
+
+        with CaptureQueriesContext(connection) as ctx:
+            history = weekly_scores(self.user, 52, today=today)
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(len(history), 52)
+        self.assertEqual(history[-1]["week"], date(2024, 6, 10))
+        self.assertEqual(history[-1]["score"], 10 + 8 + 2)
+        self.assertEqual(history[-2]["score"], 10 + 3 * 2)
+        self.assertEqual(sum(item["days"] for item in history), 3)
+
+    def test_completed_weeks_come_from_cache(self):
+        today = date(2024, 6, 12)
+        self._day(date(2024, 6, 3), completed=3)
+        weekly_scores(self.user, 52, today=today)
+
+        # 🔒 rândul se schimbă direct în DB – săptămâna încheiată e în cache
+        TimeBlock.objects.update(completed=False)
+
+        with CaptureQueriesContext(connection) as ctx:
+            history = weekly_scores(self.user, 52, today=today)
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(history[-2]["completed"], 3)
+
+    def test_generation_is_read_once_for_all_weeks(self):
+        with mock.patch(
+            "planner.analytics.user_generation", wraps=user_generation
+        ) as generation, mock.patch(
+            "planner.caching.user_generation", wraps=user_generation
+        ) as per_key:
+            weekly_scores(self.user, 52, today=date(2024, 6, 12))
+
+        self.assertEqual(generation.call_count, 1)
+        self.assertEqual(per_key.call_count, 0)
+
+    def test_changes_through_views_invalidate_cached_week(self):
+        today = date.today()
+        past = today - timedelta(days=14)
+        day = self._day(past)
+        weekly_scores(self.user, 4)
+
+        self.client.post(reverse("set_day_mood"), {"day_id": day.id, "mood": "good"})
+
+        history = weekly_scores(self.user, 4)
+        self.assertEqual(history[-3]["mood_days"], 1)
+
+    def test_history_view(self):
+        response = self.client.get(reverse("weekly_score_history"), {"weeks": 12})
+
+        self.assertTemplateUsed(response, "planner/weekly_history.html")
+        self.assertEqual(len(response.context["chart"]["scores"]), 12)
@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from planner.models import Day
+
+
+WRITES = ("INSERT", "UPDATE", "DELETE")
+
+
+class WellbeingStateTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ema",
+            email="ema@test.com",
+            password="ComplexPass123!",
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+        self.today = date.today()
+
+    def _past(self, days_ago, mood=None):
+        return Day.objects.create(
+            user=self.user,
+            date=self.today - timedelta(days=days_ago),
+            mood=mood,
+        )
+
+    def _get_today(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("today"))
+        return response, [q["sql"] for q in ctx.captured_queries]
+
+    def test_repeat_visits_do_not_write(self):
+        self._past(1, "bad")
+        self._past(2, "very_bad")
+
+        response, _ = self._get_today()
+        self.assertTrue(response.context["day"].rest_day)
+
+        response, queries = self._get_today()
+        self.assertTrue(response.context["day"].rest_day)
+        self.assertFalse(
+            [sql for sql in queries if sql.startswith(WRITES) and "planner_day" in sql]
+        )
+        self.assertEqual(sum("planner_day" in sql for sql in queries), 1)
+
+    def test_mood_change_updates_state(self):
+        yesterday = self._past(1)
+        self._past(2, "bad")
+
+        response, _ = self._get_today()
+        self.assertFalse(response.context["day"].rest_day)
+        self.assertIsNone(response.context["message"])
+
+        self.client.post(reverse("set_day_mood"), {"day_id": yesterday.id, "mood": "bad"})
+
+        response, _ = self._get_today()
+        self.assertTrue(response.context["day"].rest_day)
+        self.assertTrue(
+            Day.objects.get(user=self.user, date=self.today).rest_day
+        )
+
+    def test_gentle_day_after_bad_yesterday(self):
+        self._past(1, "bad")
+        self._past(2, "good")
+
+        response, _ = self._get_today()
+
+        self.assertFalse(response.context["day"].rest_day)
+        self.assertEqual(response.context["message"], "🌿 Azi fii blândă cu tine.")
@@ -10,6 +10,9 @@ from .views import (
     add_timeblock,
     toggle_timeblock,
     delete_timeblock,
+    timeblock_batch_view,
+    free_slots_view,
+    schedule_day_view,
 
     # 🎨 + 💭 Zi
     set_day_color,
@@ -19,12 +22,25 @@ from .views import (
     # 🌙 Reflecție
     evening_reflection_view,
 
+    # 🔍 Căutare
+    search_view,
+
     # 📊 Analytics
     monthly_overview_view,
+    year_pixels_view,
+    insights_view,
+    insights_report_view,
     weekly_balance_score_view,
+    weekly_score_history_view,
     mood_chart_view,
+    mood_chart_data_view,
     productivity_chart_view,
 
+    # 📤 Export
+    export_jsonl_view,
+    export_csv_view,
+    import_journal_view,
+
     # 🔐 AUTH
     register_view,
     login_view,
@@ -58,6 +74,11 @@ urlpatterns = [
     # 🗓 CALENDAR
     # =========================
     path('calendar/', calendar_view, name='calendar'),
+    path(
+        'calendar/<int:year>/<int:month>/',
+        calendar_view,
+        name='calendar_month'
+    ),
 
     # =========================
     # ⏰ TIMEBLOCKS
@@ -65,6 +86,21 @@ urlpatterns = [
     path('add-timeblock/', add_timeblock, name='add_timeblock'),
     path('toggle-timeblock/<int:block_id>/', toggle_timeblock, name='toggle_timeblock'),
     path('delete-timeblock/<int:block_id>/', delete_timeblock, name='delete_timeblock'),
+    path(
+        'day/<int:year>/<int:month>/<int:day>/timeblocks/batch/',
+        timeblock_batch_view,
+        name='timeblock_batch'
+    ),
+    path(
+        'day/<int:year>/<int:month>/<int:day>/free-slots/',
+        free_slots_view,
+        name='free_slots'
+    ),
+    path(
+        'day/<int:year>/<int:month>/<int:day>/schedule/',
+        schedule_day_view,
+        name='schedule_day'
+    ),
 
     # =========================
     # 🎨 + 💭 STARE ZI
@@ -82,6 +118,11 @@ urlpatterns = [
         name='evening_reflection'
     ),
 
+    # =========================
+    # 🔍 CĂUTARE
+    # =========================
+    path('search/', search_view, name='search'),
+
     # =========================
     # 📊 ANALYTICS
     # =========================
@@ -90,22 +131,48 @@ urlpatterns = [
         monthly_overview_view,
         name='monthly_overview'
     ),
+    path(
+        'monthly-overview/<int:year>/<int:month>/',
+        monthly_overview_view,
+        name='monthly_overview_month'
+    ),
+    path('year/', year_pixels_view, name='year_pixels'),
+    path('year/<int:year>/', year_pixels_view, name='year_pixels_year'),
+    path('insights/', insights_view, name='insights'),
+    path('insights/report/', insights_report_view, name='insights_report'),
     path(
         'weekly-score/',
         weekly_balance_score_view,
         name='weekly_score'
     ),
+    path(
+        'weekly-score/history/',
+        weekly_score_history_view,
+        name='weekly_score_history'
+    ),
     path(
         'charts/mood/',
         mood_chart_view,
         name='mood_chart'
     ),
+    path(
+        'charts/mood/data/',
+        mood_chart_data_view,
+        name='mood_chart_data'
+    ),
     path(
         'charts/productivity/',
         productivity_chart_view,
         name='productivity_chart'
     ),
 
+    # =========================
+    # 📤 EXPORT
+    # =========================
+    path('export/jsonl/', export_jsonl_view, name='export_jsonl'),
+    path('export/csv/', export_csv_view, name='export_csv'),
+    path('import/', import_journal_view, name='import_journal'),
+
     # =========================
     # 🔐 AUTH
     # =========================
@@ -1,23 +1,54 @@
+import gzip
+import json
 from datetime import date, timedelta, timezone
-from calendar import monthrange
-from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
-from django.db.models import Count, Q
+from django.http import Http404, JsonResponse
+from django.db import transaction
+from django.contrib import messages
 from django.contrib.auth import login, logout
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.http import require_POST
 from django.contrib.auth.models import User
 from django.utils.http import urlsafe_base64_decode
 from django.utils.encoding import force_str
-from .models import Day, TimeBlock, Quote, EveningReflection, UserProfile
+from django.utils.dateparse import parse_time
+from .models import Day, TimeBlock, EveningReflection, UserProfile
 from django.shortcuts import render, redirect
 from django.urls import reverse
 from django.template.loader import render_to_string
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import EmailMultiAlternatives
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 from .forms import RegisterForm, EmailAuthenticationForm
+from .calendar_engine import MAX_MONTHS, build_months, shift_month
+from .analytics import (
+    MAX_SCORE_WEEKS,
+    date_window,
+    month_overview,
+    mood_series,
+    productivity_series,
+    weekly_scores,
+    window_score,
+)
+from . import rollups
+from .quotes import quote_index
+from .day_context import day_context, load_day
+from .batch import BatchError, apply_operations, block_data
+from . import journal, jobs, pixels
+from .caching import forget_day
+from .insights import user_correlations, user_insights
+from .search import parse_cursor, search_days
+from .intervals import (
+    DAY_MINUTES,
+    DEFAULT_WINDOW,
+    DayIntervals,
+    parse_minutes,
+    slot_data,
+    to_time,
+)
+from . import scheduler
+from .tasks import send_activation_email
 from django.utils import timezone
 
 
@@ -27,10 +58,8 @@ from django.contrib.auth import login, logout
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.models import User
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.urls import reverse
-from django.conf import settings
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 
@@ -59,31 +88,14 @@ def register_view(request):
             reverse("activate", args=[uidb64, token])
         )
 
-        text_message = render_to_string(
-            "planner/email/confirm_email.txt",
-            {
-                "user": user,
-                "activation_link": activation_link,
-            }
+        # ✉️ emailul pleacă din worker, cererea nu așteaptă SMTP-ul
+        jobs.defer(
+            send_activation_email,
+            user_id=user.pk,
+            activation_link=activation_link,
+            idempotency_key=f"activation:{user.pk}",
         )
 
-        html_message = render_to_string(
-            "planner/email/confirm_email.html",
-            {
-                "user": user,
-                "activation_link": activation_link,
-            }
-        )
-
-        email = EmailMultiAlternatives(
-            subject="🌸 Confirmă contul tău",
-            body=text_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.email],
-        )
-        email.attach_alternative(html_message, "text/html")
-        email.send()
-
         return render(request, "planner/auth/check_email.html")
 
     return render(request, "planner/auth/register.html", {"form": form})
@@ -117,7 +129,7 @@ def login_view(request):
     if request.user.is_authenticated:
         return redirect("today")
 
-    form = EmailAuthenticationForm(request.POST or None)
+    form = EmailAuthenticationForm(request, data=request.POST or None)
 
     if request.method == "POST" and form.is_valid():
         login(request, form.get_user())
@@ -139,12 +151,25 @@ from .forms import ProfileForm
 
 @login_required
 def profile_view(request):
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
+    # 👤 profilul vine deja cu userul din cache (EmailBackend.get_user)
+    try:
+        profile = request.user.profile
+    except UserProfile.DoesNotExist:
+        profile, _ = UserProfile.objects.get_or_create(user=request.user)
 
     saved = False
     if request.method == "POST":
         profile.nickname = request.POST.get("nickname")
         profile.bio = request.POST.get("bio")
+
+        # 🌙 gol = fără reminder
+        try:
+            profile.evening_reminder_time = parse_time(
+                request.POST.get("evening_reminder_time") or ""
+            )
+        except ValueError:
+            profile.evening_reminder_time = None
+
         profile.save()
         saved = True
 
@@ -158,33 +183,11 @@ def profile_view(request):
 # 🌱 LOGICĂ EMOȚIONALĂ
 # ===================================================
 
-MOOD_LIMITS = {
-    "very_bad": 1,
-    "bad": 3,
-    "neutral": 5,
-    "good": 7,
-    "very_good": 99,
-}
-
-
-def is_gentle_day(day):
-    yesterday = day.date - timedelta(days=1)
-    yd = Day.objects.filter(user=day.user, date=yesterday).first()
-    return bool(yd and yd.mood in ["bad", "very_bad"])
-
-
-def should_force_rest(day):
-    last_days = Day.objects.filter(
-        user=day.user,
-        date__lt=day.date
-    ).order_by("-date")[:3]
-    return sum(d.mood in ["bad", "very_bad"] for d in last_days) >= 2
-
-
-def max_tasks_for_day(day):
-    if day.rest_day:
-        return 1
-    return MOOD_LIMITS.get(day.mood, 5)
+from .wellbeing import (
+    is_gentle_day,
+    max_tasks_for_day,
+    should_force_rest,
+)
 
 
 # ===================================================
@@ -195,7 +198,7 @@ def home_view(request):
     if request.user.is_authenticated:
         return redirect("today")
 
-    quote = Quote.objects.filter(active=True).order_by("?").first()
+    quote = quote_index.pick()
 
     return render(request, "planner/home.html", {
         "quote": quote,
@@ -210,11 +213,16 @@ def home_view(request):
 @login_required
 def today_view(request):
     today = date.today()
-    day, _ = Day.objects.get_or_create(user=request.user, date=today)
+    day, _ = load_day(request.user, today)
 
-    if should_force_rest(day):
+    # ✍️ scriem doar când steagul chiar se schimbă
+    if not day.rest_day and should_force_rest(day):
         day.rest_day = True
-        day.save()
+        Day.objects.filter(pk=day.pk).update(
+            rest_day=True,
+            updated_at=timezone.now()
+        )
+        rollups.record_change(request.user.id, today, rest_days=1)
 
     message = None
     if day.rest_day:
@@ -222,18 +230,11 @@ def today_view(request):
     elif is_gentle_day(day):
         message = "🌿 Azi fii blândă cu tine."
 
-    quote = Quote.objects.filter(
-        Q(mood=day.mood) | Q(mood__isnull=True),
-        active=True
-    ).order_by("?").first()
-
-    return render(request, "planner/day.html", {
-        "day": day,
-        "time_blocks": day.time_blocks.all(),
-        "limit": max_tasks_for_day(day),
-        "message": message,
-        "quote": quote,
-    })
+    return render(request, "planner/day.html", day_context(
+        day,
+        message=message,
+        quote=quote_index.pick([day.mood, None]),
+    ))
 
 
 from datetime import date as date_cls
@@ -247,10 +248,7 @@ from .models import Day
 def day_detail_view(request, year, month, day):
     selected_date = date_cls(year, month, day)
 
-    day_obj, created = Day.objects.get_or_create(
-        user=request.user,
-        date=selected_date
-    )
+    day_obj, created = load_day(request.user, selected_date)
 
     message = None
     if created:
@@ -261,18 +259,11 @@ def day_detail_view(request, year, month, day):
         else:
             message = "Zi din viitor. Nu trebuie încă să fie clară. ✨"
 
-    reflection = EveningReflection.objects.filter(day=day_obj).first()
-
-    return render(request, "planner/day.html", {
-        "day": day_obj,
-        "time_blocks": day_obj.time_blocks.order_by("start_time"),
-        "limit": max_tasks_for_day(day_obj),
-        "message": message,
-        "reflection": reflection,
-
-        # ✅ ASTA LIPSEA
-        "quote": day_obj.closing_quote,
-    })
+    # ✅ citatul final vine din day_context (salvat la închiderea zilei)
+    return render(request, "planner/day.html", day_context(
+        day_obj,
+        message=message,
+    ))
 
 
 
@@ -283,162 +274,427 @@ def day_detail_view(request, year, month, day):
 # ===================================================
 
 @login_required
-def calendar_view(request):
+def calendar_view(request, year=None, month=None):
     today = date.today()
-    days = []
+    year = year or today.year
+    month = month or today.month
+
+    try:
+        count = int(request.GET.get("months", 1))
+    except ValueError:
+        count = 1
+    count = max(1, min(count, MAX_MONTHS))
 
-    for d in range(1, monthrange(today.year, today.month)[1] + 1):
-        current = date(today.year, today.month, d)
-        day_obj = Day.objects.filter(user=request.user, date=current).first()
-        days.append({"date": current, "day": day_obj})
+    # capetele sunt excluse ca navigarea înainte / înapoi să rămână validă
+    if not (1 <= month <= 12 and 1 < year < 9999):
+        raise Http404("Lună invalidă.")
+
+    months = build_months(request.user, year, month, count)
+    prev_month = shift_month(year, month, -count)
+    next_month = shift_month(year, month, count)
 
     return render(request, "planner/calendar.html", {
-        "year": today.year,
-        "month": today.month,
-        "days": days,
+        "year": year,
+        "month": month,
+        "days": months[0]["days"],
+        "months": months,
+        "months_count": count,
+        "prev_month": prev_month,
+        "next_month": next_month,
+        "today": today,
     })
 
 
 # ===================================================
 # ⏰ TIMEBLOCKS
 # ===================================================
+# Fiecare mutație răspunde cu redirect (fără JS) sau, pentru cereri
+# AJAX din script.js, cu JSON care conține doar fragmentul schimbat.
+
+def is_ajax(request):
+    return request.headers.get("x-requested-with") == "XMLHttpRequest"
+
+
+def fragment_response(request, target, template=None, context=None, status=200, **extra):
+    html = ""
+    if template:
+        html = render_to_string(template, context, request=request)
+
+    return JsonResponse({
+        "ok": status < 400,
+        "target": target,
+        "html": html,
+        **extra,
+    }, status=status)
+
+
+def redirect_to_day(day):
+    return redirect(
+        "day_detail",
+        year=day.date.year,
+        month=day.date.month,
+        day=day.date.day
+    )
+
+
+def time_blocks_fragment(request, day, status=200, **extra):
+    return fragment_response(
+        request,
+        "time-blocks",
+        "planner/partials/time_blocks.html",
+        {"day": day, "time_blocks": day.time_blocks.order_by("start_time")},
+        status=status,
+        **extra
+    )
+
 
 @login_required
+@require_POST
 def add_timeblock(request):
-    if request.method == "POST":
+    start = parse_minutes(request.POST.get("start_time"))
+    end = parse_minutes(request.POST.get("end_time"))
+
+    # 🔒 ziua rămâne blocată de la verificare până la INSERT: două
+    # cereri paralele nu pot trece amândouă de limită / suprapunere
+    with transaction.atomic():
         day = get_object_or_404(
-            Day,
+            Day.objects.select_for_update(),
             id=request.POST.get("day_id"),
             user=request.user
         )
 
-        if day.time_blocks.count() < max_tasks_for_day(day):
+        # ⏰ un query: câte blocuri are ziua și unde sunt
+        blocks = DayIntervals.from_rows(
+            day.time_blocks.values_list("start_time", "end_time", "id")
+        )
+
+        error = None
+        if len(blocks) >= max_tasks_for_day(day):
+            error = "Ai atins limita blândă pentru azi. 🌿"
+        elif start is None or end is None or end <= start:
+            error = "Ora de sfârșit trebuie să fie după ora de început."
+        elif end >= DAY_MINUTES:
+            # 24:00 e valid pentru timpul liber, dar nu într-un TimeField
+            error = "Un interval se termină cel târziu la 23:59."
+        elif blocks.overlaps(start, end):
+            error = "Intervalul se suprapune cu altul deja planificat."
+        else:
             TimeBlock.objects.create(
                 day=day,
                 title=request.POST.get("title"),
-                start_time=request.POST.get("start_time"),
-                end_time=request.POST.get("end_time"),
+                start_time=to_time(start),
+                end_time=to_time(end),
             )
+            rollups.record_change(request.user.id, day.date, blocks_planned=1)
 
-    return redirect(
-        "day_detail",
-        year=day.date.year,
-        month=day.date.month,
-        day=day.date.day
-    )
+    if is_ajax(request):
+        if error:
+            return time_blocks_fragment(request, day, status=409, error=error)
+        return time_blocks_fragment(request, day)
+
+    if error:
+        messages.error(request, error)
+
+    return redirect_to_day(day)
 
 
 @login_required
+@require_POST
 def toggle_timeblock(request, block_id):
     block = get_object_or_404(
-        TimeBlock,
+        TimeBlock.objects.select_related("day"),
         id=block_id,
         day__user=request.user
     )
+    day = block.day
 
-    block.completed = not block.completed
-    block.save(update_fields=["completed"])
+    # ⚡ un singur UPDATE condiționat – nimic nu se schimbă
+    # dacă altă cerere a comutat deja blocul
+    updated = TimeBlock.objects.filter(
+        pk=block.pk,
+        completed=block.completed
+    ).update(completed=not block.completed)
+
+    if updated:
+        block.completed = not block.completed
+        rollups.record_change(
+            request.user.id,
+            day.date,
+            blocks_completed=1 if block.completed else -1
+        )
 
-    day = block.day
+    if is_ajax(request):
+        return fragment_response(
+            request,
+            f"block-{block.pk}",
+            "planner/partials/time_block.html",
+            {"day": day, "block": block}
+        )
 
     # ✅ rămâi pe ACEEAȘI zi
-    return redirect(
-        "day_detail",
-        year=day.date.year,
-        month=day.date.month,
-        day=day.date.day
+    return redirect_to_day(day)
+
+
+@login_required
+@require_POST
+def timeblock_batch_view(request, year, month, day):
+    try:
+        selected_date = date_cls(year, month, day)
+    except ValueError:
+        raise Http404("Zi invalidă.")
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        payload = None
+
+    if not isinstance(payload, dict):
+        return JsonResponse({
+            "ok": False,
+            "errors": [{"index": None, "error": "JSON invalid."}],
+        }, status=400)
+
+    day_obj, _ = load_day(request.user, selected_date)
+
+    try:
+        blocks = apply_operations(day_obj, payload.get("operations"))
+    except BatchError as error:
+        return JsonResponse({"ok": False, "errors": error.errors}, status=400)
+
+    return JsonResponse({
+        "ok": True,
+        "blocks": [block_data(block) for block in blocks],
+        "target": "time-blocks",
+        "html": render_to_string(
+            "planner/partials/time_blocks.html",
+            {"day": day_obj, "time_blocks": blocks},
+            request=request
+        ),
+    })
+
+
+@login_required
+@require_POST
+def schedule_day_view(request, year, month, day):
+    try:
+        selected_date = date_cls(year, month, day)
+    except ValueError:
+        raise Http404("Zi invalidă.")
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        payload = None
+
+    if not isinstance(payload, dict):
+        return JsonResponse({
+            "ok": False,
+            "errors": [{"index": None, "error": "JSON invalid."}],
+        }, status=400)
+
+    window = scheduler.parse_window(payload)
+    if window is None:
+        return JsonResponse({
+            "ok": False,
+            "errors": [{"index": None, "error": "Program de lucru invalid."}],
+        }, status=400)
+
+    day_obj, _ = load_day(request.user, selected_date)
+
+    try:
+        tasks = scheduler.parse_tasks(payload.get("tasks"))
+        if day_obj.is_closed:
+            raise BatchError([{"index": None, "error": "Ziua este închisă."}])
+
+        # 🧩 propunerea se calculează în memorie, din blocurile deja încărcate
+        plan = scheduler.propose(day_obj, tasks, window)
+
+        if not payload.get("accept"):
+            return JsonResponse({"ok": True, "accepted": False, **plan})
+
+        if not plan["placed"]:
+            raise BatchError([{"index": None, "error": "Niciun task nu încape azi. 🌿"}])
+
+        blocks = scheduler.accept(day_obj, plan)
+    except BatchError as error:
+        return JsonResponse({"ok": False, "errors": error.errors}, status=400)
+
+    return JsonResponse({
+        "ok": True,
+        "accepted": True,
+        **plan,
+        "blocks": [block_data(block) for block in blocks],
+        "target": "time-blocks",
+        "html": render_to_string(
+            "planner/partials/time_blocks.html",
+            {"day": day_obj, "time_blocks": blocks},
+            request=request
+        ),
+    })
+
+
+@login_required
+def free_slots_view(request, year, month, day):
+    try:
+        selected_date = date_cls(year, month, day)
+    except ValueError:
+        raise Http404("Zi invalidă.")
+
+    try:
+        minutes = max(int(request.GET.get("min", 30)), 1)
+    except ValueError:
+        minutes = None
+    start = parse_minutes(request.GET.get("from"), DEFAULT_WINDOW[0])
+    end = parse_minutes(request.GET.get("to"), DEFAULT_WINDOW[1])
+
+    if minutes is None or not 0 <= start < end <= DAY_MINUTES:
+        return JsonResponse({"ok": False, "error": "Interval invalid."}, status=400)
+
+    # ⏰ fără get_or_create: o zi nesalvată e pur și simplu liberă
+    intervals = DayIntervals.from_rows(
+        TimeBlock.objects.filter(
+            day__user=request.user,
+            day__date=selected_date
+        ).values_list("start_time", "end_time", "id")
     )
 
+    return JsonResponse({
+        "ok": True,
+        "date": selected_date.isoformat(),
+        "min": minutes,
+        "window": slot_data(start, end),
+        "slots": [
+            slot_data(slot_start, slot_end)
+            for slot_start, slot_end in intervals.free_slots(minutes, start, end)
+        ],
+        # blocuri vechi care se suprapun (de dinainte de verificare)
+        "overlaps": [list(pair) for pair in intervals.conflicts()],
+    })
+
 
 # ===================================================
 # 🎨 + 💭 ZI
 # ===================================================
 
+def update_open_day(day, field, value):
+    """
+    UPDATE condiționat: doar dacă ziua e încă deschisă și câmpul
+    are valoarea citită. Întoarce True dacă rândul s-a schimbat.
+    """
+    updated = Day.objects.filter(
+        pk=day.pk,
+        is_closed=False,
+        **{field: getattr(day, field)}
+    ).update(**{field: value})
+
+    if updated:
+        setattr(day, field, value)
+    return bool(updated)
+
+
 @login_required
+@require_POST
 def set_day_color(request):
-    if request.method == "POST":
-        day = get_object_or_404(
-            Day,
-            id=request.POST.get("day_id"),
-            user=request.user
-        )
+    day = get_object_or_404(
+        Day,
+        id=request.POST.get("day_id"),
+        user=request.user
+    )
 
-        if not day.is_closed:
-            day.color = request.POST.get("color")
-            day.save(update_fields=["color"])
+    old_color = day.color
+    if update_open_day(day, "color", request.POST.get("color")):
+        rollups.record_change(
+            request.user.id,
+            day.date,
+            **rollups.color_delta(old_color, day.color)
+        )
+        pixels.forget_year(request.user.id, day.date.year)
 
-        return redirect(
-            "day_detail",
-            year=day.date.year,
-            month=day.date.month,
-            day=day.date.day
+    if is_ajax(request):
+        return fragment_response(
+            request, "day-color", "planner/partials/day_color.html", {"day": day}
         )
 
+    return redirect_to_day(day)
+
 
 @login_required
+@require_POST
 def set_day_mood(request):
-    if request.method == "POST":
-        day = get_object_or_404(
-            Day,
-            id=request.POST.get("day_id"),
-            user=request.user
-        )
+    day = get_object_or_404(
+        Day,
+        id=request.POST.get("day_id"),
+        user=request.user
+    )
 
-        if not day.is_closed:
-            day.mood = request.POST.get("mood")
-            day.save(update_fields=["mood"])
+    old_mood = day.mood
+    if update_open_day(day, "mood", request.POST.get("mood")):
+        rollups.record_change(
+            request.user.id,
+            day.date,
+            **rollups.mood_delta(old_mood, day.mood)
+        )
+        pixels.forget_year(request.user.id, day.date.year)
 
-        return redirect(
-            "day_detail",
-            year=day.date.year,
-            month=day.date.month,
-            day=day.date.day
+    if is_ajax(request):
+        return fragment_response(
+            request, "day-mood", "planner/partials/day_mood.html", {"day": day}
         )
+
+    return redirect_to_day(day)
+
+
 @login_required
+@require_POST
 def delete_timeblock(request, block_id):
     block = get_object_or_404(
-        TimeBlock,
+        TimeBlock.objects.select_related("day"),
         id=block_id,
         day__user=request.user
     )
 
     day = block.day   # ✅ FOARTE IMPORTANT
-    block.delete()
+    deleted, _ = TimeBlock.objects.filter(pk=block.pk).delete()
+    if deleted:
+        rollups.record_change(
+            request.user.id,
+            day.date,
+            blocks_planned=-1,
+            blocks_completed=-1 if block.completed else 0
+        )
 
-    return redirect(
-        "day_detail",
-        year=day.date.year,
-        month=day.date.month,
-        day=day.date.day
-    )
+    if is_ajax(request):
+        # html gol → script.js scoate blocul din pagină
+        return fragment_response(request, f"block-{block_id}")
+
+    return redirect_to_day(day)
 
 
 @login_required
+@require_POST
 def update_day_text(request):
-    if request.method == "POST":
-        day = get_object_or_404(
-            Day,
-            id=request.POST.get("day_id"),
-            user=request.user
-        )
+    day = get_object_or_404(
+        Day,
+        id=request.POST.get("day_id"),
+        user=request.user
+    )
 
-        if not day.is_closed:
-            day.notes = request.POST.get("notes")
-            day.save(update_fields=["notes"])
+    if update_open_day(day, "notes", request.POST.get("notes")):
+        # o zi doar cu note contează ca logată (insights)
+        forget_day(request.user.id, day.date)
 
-        return redirect(
-            "day_detail",
-            year=day.date.year,
-            month=day.date.month,
-            day=day.date.day
+    if is_ajax(request):
+        return fragment_response(
+            request, "day-notes", "planner/partials/day_notes.html", {"day": day}
         )
 
+    return redirect_to_day(day)
+
 
 # ===================================================
 # 🌙 EVENING REFLECTION
 # ===================================================
 from django.utils import timezone
-from random import choice
 
 @login_required
 def evening_reflection_view(request, year, month, day):
@@ -459,21 +715,18 @@ def evening_reflection_view(request, year, month, day):
 
         # ✅ alegem citatul DOAR O DATĂ
         if not day_obj.closing_quote:
-            quotes = Quote.objects.filter(active=True)
-
-            # 🔹 opțional: dacă vrei după mood
+            # 🔹 după mood, dacă există citate pentru el
+            quote = None
             if day_obj.mood:
-                mood_quotes = quotes.filter(mood=day_obj.mood)
-                if mood_quotes.exists():
-                    quotes = mood_quotes
+                quote = quote_index.pick([day_obj.mood])
 
-            if quotes.exists():
-                day_obj.closing_quote = choice(list(quotes))
+            day_obj.closing_quote = quote or quote_index.pick()
 
         # ✅ închidem ziua
         day_obj.is_closed = True
         day_obj.closed_at = timezone.now()
         day_obj.save(update_fields=["is_closed", "closed_at", "closing_quote"])
+        forget_day(request.user.id, selected_date)
 
         return redirect(
             "day_detail",
@@ -490,6 +743,26 @@ def evening_reflection_view(request, year, month, day):
 
 
 
+# ===================================================
+# 🔍 CĂUTARE
+# ===================================================
+
+@login_required
+def search_view(request):
+    query = request.GET.get("q", "").strip()
+    after = parse_cursor(request.GET.get("after"))
+
+    # 🔍 index FTS5, ordonat după relevanță, paginat cu cursor
+    results, next_cursor = search_days(request.user.id, query, after)
+
+    return render(request, "planner/search.html", {
+        "query": query,
+        "results": results,
+        "next_cursor": next_cursor,
+        "first_page": after is None,
+    })
+
+
 # ===================================================
 # 📊 ANALYTICS
 # ===================================================
@@ -497,25 +770,8 @@ def evening_reflection_view(request, year, month, day):
 @login_required
 def weekly_balance_score_view(request):
     today = date.today()
-    start = today - timedelta(days=6)
-
-    days = Day.objects.filter(
-        user=request.user,
-        date__range=[start, today]
-    )
-
-    mood_days = sum(bool(d.mood) for d in days)
-    completed_tasks = TimeBlock.objects.filter(
-        day__in=days,
-        completed=True
-    ).count()
-
-    score = min(
-        days.count() * 10 +
-        mood_days * 8 +
-        completed_tasks * 2,
-        100
-    )
+    stats = window_score(request.user, today - timedelta(days=6), today)
+    score = stats["score"]
 
     if score < 40:
         message = "A fost o săptămână grea. Faptul că ești aici contează."
@@ -527,48 +783,172 @@ def weekly_balance_score_view(request):
     return render(request, "planner/weekly_score.html", {
         "score": score,
         "message": message,
-        "days_logged": days.count(),
-        "completed_tasks": completed_tasks,
-        "mood_days": mood_days,
+        "days_logged": stats["days"],
+        "completed_tasks": stats["completed"],
+        "mood_days": stats["mood_days"],
     })
 
 
 @login_required
-def monthly_overview_view(request):
+def weekly_score_history_view(request):
+    try:
+        weeks = int(request.GET.get("weeks", 52))
+    except ValueError:
+        weeks = 52
+    weeks = max(1, min(weeks, MAX_SCORE_WEEKS))
+
+    history = weekly_scores(request.user, weeks)
+
+    return render(request, "planner/weekly_history.html", {
+        "history": history,
+        "weeks": weeks,
+        "chart": {
+            "labels": [item["week"].isoformat() for item in history],
+            "scores": [item["score"] for item in history],
+        },
+    })
+
+
+@login_required
+def monthly_overview_view(request, year=None, month=None):
     today = date.today()
-    days = Day.objects.filter(
-        user=request.user,
-        date__year=today.year,
-        date__month=today.month
-    )
+    year = year or today.year
+    month = month or today.month
+
+    if not (1 <= month <= 12 and 1 < year < 9999):
+        raise Http404("Lună invalidă.")
 
     return render(request, "planner/monthly_overview.html", {
-        "days": days,
-        "month": today.month,
-        "year": today.year,
+        "overview": month_overview(request.user.id, year, month, today),
+        "month": month,
+        "year": year,
+        "prev_month": shift_month(year, month, -1),
+        "next_month": shift_month(year, month, 1),
+    })
+
+
+@login_required
+def year_pixels_view(request, year=None):
+    year = year or date.today().year
+    if not 1 < year < 9999:
+        raise Http404("An invalid.")
+
+    mode = request.GET.get("mode")
+    if mode not in ("mood", "color"):
+        mode = "mood"
+
+    # 🟪 un an întreg = o citire din cache (octeți), fără rânduri Day
+    data = pixels.year_pixels(request.user.id, year)
+
+    return render(request, "planner/year_pixels.html", {
+        "year": year,
+        "months": pixels.year_grid(data, year),
+        "days": range(1, 32),
+        "mode": mode,
+        "legend": Day.Mood.choices if mode == "mood" else Day.Color.choices,
+        "today": date.today(),
+    })
+
+
+@login_required
+def insights_view(request):
+    # 🔎 istoricul se citește o dată pe zi (sau după o schimbare), ca vectori
+    insights = user_insights(request.user.id)
+
+    return render(request, "planner/insights.html", {
+        "insights": insights,
+        "chart": insights["chart"],
+    })
+
+
+@login_required
+def insights_report_view(request):
+    # 🔗 un query grupat la prima cerere, apoi cache până la o schimbare
+    return render(request, "planner/insights_report.html", {
+        "report": user_correlations(request.user.id),
     })
 
 
 @login_required
 def mood_chart_view(request):
-    days = Day.objects.filter(user=request.user).order_by("date")
+    start, end, bucket = date_window(request, default="auto")
 
+    # 📈 datele vin din mood_chart_data_view (JSON compact)
     return render(request, "planner/chart/mood.html", {
-        "days": days
+        "start": start,
+        "end": end,
+        "bucket": bucket,
     })
 
 
 @login_required
-def productivity_chart_view(request):
-    days = Day.objects.filter(user=request.user)
+def mood_chart_data_view(request):
+    start, end, bucket = date_window(request, default="auto")
 
-    data = []
-    for d in days:
-        data.append({
-            "date": d.date,
-            "completed": d.time_blocks.filter(completed=True).count()
-        })
+    return JsonResponse(mood_series(request.user, start, end, bucket))
+
+
+@login_required
+def productivity_chart_view(request):
+    start, end, bucket = date_window(request)
 
     return render(request, "planner/chart/productivity.html", {
-        "data": data
+        "data": productivity_series(request.user, start, end, bucket),
+        "start": start,
+        "end": end,
+        "bucket": bucket,
+    })
+
+
+# ===================================================
+# 📤 EXPORT
+# ===================================================
+
+def wants_gzip(request):
+    return request.GET.get("gzip") in ("1", "true", "yes")
+
+
+@login_required
+def export_jsonl_view(request):
+    return journal.stream_response(
+        journal.jsonl_lines(request.user),
+        "jsonl",
+        "application/x-ndjson; charset=utf-8",
+        compress=wants_gzip(request),
+    )
+
+
+@login_required
+def export_csv_view(request):
+    return journal.stream_response(
+        journal.csv_lines(request.user),
+        "csv",
+        "text/csv; charset=utf-8",
+        compress=wants_gzip(request),
+    )
+
+
+@login_required
+def import_journal_view(request):
+    result = None
+    error = None
+
+    if request.method == "POST":
+        upload = request.FILES.get("file")
+
+        if upload is None:
+            error = "Alege un fișier .jsonl exportat din planner."
+        else:
+            lines = upload
+            if upload.name.endswith(".gz"):
+                lines = gzip.GzipFile(fileobj=upload)
+
+            try:
+                result = journal.import_lines(request.user, lines)
+            except (OSError, EOFError):
+                error = "Arhiva nu poate fi citită."
+
+    return render(request, "planner/import.html", {
+        "result": result,
+        "error": error,
     })
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+
+from .caching import user_key
+from .models import Day
+
+
+# ===================================================
+# 🌱 STARE EMOȚIONALĂ RECENTĂ (per user, în cache)
+# ===================================================
+# Ultimele 3 zile notate dinaintea zilei curente + steagurile derivate.
+# Se calculează o dată pe zi (un query) și se uită când se schimbă
+# o zi din trecut (vezi caching.forget_day).
+
+MOOD_LIMITS = {
+    "very_bad": 1,
+    "bad": 3,
+    "neutral": 5,
+    "good": 7,
+    "very_good": 99,
+}
+
+BAD_MOODS = ("bad", "very_bad")
+RECENT_DAYS = 3
+STATE_TIMEOUT = 60 * 60 * 48
+
+
+def state_key(user_id):
+    return user_key(user_id, "wellbeing")
+
+
+def compute_state(user_id, day_date):
+    recent = list(
+        Day.objects.filter(user_id=user_id, date__lt=day_date)
+        .order_by("-date")
+        .values_list("date", "mood")[:RECENT_DAYS]
+    )
+
+    yesterday = day_date - timedelta(days=1)
+
+    return {
+        "as_of": day_date,
+        "recent_moods": [mood for _, mood in recent],
+        "force_rest": sum(mood in BAD_MOODS for _, mood in recent) >= 2,
+        "gentle": bool(
+            recent and
+            recent[0][0] == yesterday and
+            recent[0][1] in BAD_MOODS
+        ),
+    }
+
+
+def state_for(user_id, day_date):
+    """Starea pentru `day_date`; pentru azi vine din cache (O(1))."""
+    if day_date != date.today():
+        return compute_state(user_id, day_date)
+
+    key = state_key(user_id)
+    state = cache.get(key)
+
+    if state is None or state["as_of"] != day_date:
+        state = compute_state(user_id, day_date)
+        cache.set(key, state, STATE_TIMEOUT)
+
+    return state
+
+
+def is_gentle_day(day):
+    return state_for(day.user_id, day.date)["gentle"]
+
+
+def should_force_rest(day):
+    return state_for(day.user_id, day.date)["force_rest"]
+
+
+def max_tasks_for_day(day):
+    if day.rest_day:
+        return 1
+    return MOOD_LIMITS.get(day.mood, 5)